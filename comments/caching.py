@@ -0,0 +1,36 @@
+"""
+Fragment cache for the viewer-independent part of comments/comment_item.html.
+
+The template caches each comment's body under FRAGMENT_NAME, varying on the
+comment's id, edited_at, is_deleted and author's username, so an edit, a
+soft delete or a renamed author renders under a new key. Comment.save() also drops the fragment of the saved state,
+so a change that leaves those fields alone is not served stale either.
+"""
+from django.core.cache import InvalidCacheBackendError, caches
+from django.core.cache.utils import make_template_fragment_key
+from django.db import transaction
+
+FRAGMENT_NAME = 'comment_item'
+
+
+def fragment_key(comment):
+    # Must match the {% cache %} tag's vary_on arguments in comment_item.html
+    return make_template_fragment_key(
+        FRAGMENT_NAME, [comment.pk, comment.edited_at, comment.is_deleted, comment.author.username]
+    )
+
+
+def fragment_cache():
+    # The {% cache %} tag prefers a 'template_fragments' cache when configured
+    try:
+        return caches['template_fragments']
+    except InvalidCacheBackendError:
+        return caches['default']
+
+
+def invalidate_fragment(comment):
+    key = fragment_key(comment)
+    cache = fragment_cache()
+    cache.delete(key)
+    # A render racing the save may have stored the old content in between
+    transaction.on_commit(lambda: cache.delete(key))
@@ -0,0 +1,10 @@
+from django import forms
+
+from taskflow.forms import IdListField
+
+
+class CommentModerationForm(forms.Form):
+    """
+    Comments to soft-delete in one moderation action.
+    """
+    ids = IdListField(limit_setting='COMMENTS_MODERATION_MAX')
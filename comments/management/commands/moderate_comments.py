@@ -0,0 +1,55 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from comments.models import Comment
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Soft-delete comments in bulk on behalf of a moderator'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--as', dest='moderator', required=True,
+                            help='Username the deletions are performed (and audited) as')
+        parser.add_argument('--ids', type=int, nargs='+', help='Comment ids')
+        parser.add_argument('--task', type=int, help='Only comments on this task')
+        parser.add_argument('--author', help='Only comments by this username')
+        parser.add_argument('--contains', help='Only comments whose content contains this text')
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Comments soft-deleted per UPDATE and transaction')
+        parser.add_argument('--dry-run', action='store_true')
+
+    def handle(self, *args, **options):
+        try:
+            moderator = User.objects.get(username=options['moderator'])
+        except User.DoesNotExist:
+            raise CommandError(f"Unknown user {options['moderator']!r}")
+
+        filters = {
+            'pk__in': options['ids'],
+            'task_id': options['task'],
+            'author__username': options['author'],
+            'content__contains': options['contains'],
+        }
+        filters = {lookup: value for lookup, value in filters.items() if value is not None}
+        if not filters:
+            raise CommandError('Pass at least one of --ids, --task, --author or --contains')
+
+        # deletable_by() applies the same rules as the web views
+        qs = Comment.objects.deletable_by(moderator).filter(**filters)
+        count = qs.count()
+        self.stdout.write(f'Found {count} comments {moderator.username} may delete.')
+        if options['dry_run']:
+            return
+
+        deleted, last_pk = 0, 0
+        while True:
+            ids = list(qs.filter(pk__gt=last_pk).order_by('pk').values_list('pk', flat=True)[:options['batch_size']])
+            if not ids:
+                break
+            deleted += len(Comment.objects.filter(pk__in=ids).soft_delete(by_user=moderator))
+            last_pk = ids[-1]
+            self.stdout.write(f'Soft-deleted {deleted}/{count} comments...')
+
+        self.stdout.write(self.style.SUCCESS(f'Soft-deleted {deleted} comments'))
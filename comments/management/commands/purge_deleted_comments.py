@@ -1,6 +1,17 @@
-from django.core.management.base import BaseCommand
+import json
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.contenttypes.models import ContentType
 from comments.models import Comment
+from tasks.models import Task
+from tasks.caching import invalidate_tasks
+from rbac.models import AuditEntry
+from sync.models import Tombstone
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.db import transaction
 from datetime import timedelta
 
 class Command(BaseCommand):
@@ -9,15 +20,112 @@ class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument('--days', type=int, default=30)
         parser.add_argument('--dry-run', action='store_true')
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Comments deleted per transaction')
+        parser.add_argument('--sleep', type=float, default=0,
+                            help='Seconds to pause between batches')
+        parser.add_argument('--checkpoint',
+                            help='File recording progress so an interrupted run can resume')
+        parser.add_argument('--purge-audit', action='store_true',
+                            help='Also delete audit entries that target the purged comments')
+
+    def load_checkpoint(self, path):
+        if not path or not os.path.exists(path):
+            return None
+        with open(path) as fh:
+            return json.load(fh)
+
+    def save_checkpoint(self, path, cutoff, last_pk, purged):
+        if not path:
+            return
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w') as fh:
+            json.dump({
+                'days': self.days,
+                'cutoff': cutoff.isoformat(),
+                'last_pk': last_pk,
+                'purged': purged,
+            }, fh)
+        os.replace(tmp_path, path)
 
     def handle(self, *args, **options):
-        days = options['days']
+        days = self.days = options['days']
         dry_run = options['dry_run']
+        batch_size = options['batch_size']
+        checkpoint_path = options['checkpoint']
+
         cutoff = timezone.now() - timedelta(days=days)
-        qs = Comment.all_objects.purge_older_than(days)
-        count = qs.count()
+        last_pk, purged = 0, 0
+
+        checkpoint = self.load_checkpoint(checkpoint_path)
+        if checkpoint:
+            if checkpoint.get('days', days) != days:
+                raise CommandError(
+                    f"{checkpoint_path} is from a run with --days {checkpoint['days']}; "
+                    f"pass --days {checkpoint['days']} to resume it, or remove it to start over"
+                )
+            # Keep the original cutoff so the resumed run purges the same set
+            cutoff = parse_datetime(checkpoint['cutoff'])
+            last_pk, purged = checkpoint['last_pk'], checkpoint['purged']
+            self.stdout.write(
+                f'Resuming after comment #{last_pk} ({purged} already purged), '
+                f'deleted before {cutoff.isoformat()}.'
+            )
+
+        qs = Comment.all_objects.filter(is_deleted=True, deleted_at__lt=cutoff)
+        count = qs.filter(pk__gt=last_pk).count()
         self.stdout.write(f'Found {count} comments to purge.')
         if dry_run:
             return
-        qs.delete()
-        self.stdout.write(self.style.SUCCESS(f'Purged {count} comments'))
\ No newline at end of file
+
+        comment_type = ContentType.objects.get_for_model(Comment)
+        done = 0
+
+        while True:
+            # One short transaction per batch keeps row locks brief
+            with transaction.atomic():
+                # Only ids are read: no model instances, no deleted_by/author
+                # joins. Locked, so the DELETE (and the tombstones) cover
+                # exactly these rows even if another delete races this one.
+                rows = list(
+                    qs.filter(pk__gt=last_pk)
+                    .order_by('pk')
+                    .select_for_update()
+                    .values_list('pk', 'task_id')[:batch_size]
+                )
+                if not rows:
+                    break
+
+                ids = [pk for pk, _ in rows]
+                task_ids = {task_id for _, task_id in rows}
+
+                # Comment has no reverse relations or delete signals, so this
+                # is a single DELETE ... WHERE id IN (...) without the collector
+                deleted, _ = qs.filter(pk__in=ids).delete()
+                # Sync clients still hold these as soft-deleted comments
+                Tombstone.objects.record(Comment, ids)
+
+                if options['purge_audit']:
+                    AuditEntry.objects.filter(
+                        target_content_type=comment_type,
+                        target_object_id__in=ids,
+                    ).delete()
+
+                # Purged rows are already inactive, but one flagged deleted outside
+                # soft_delete() would still be counted; recompute the affected tasks.
+                Task.objects.filter(pk__in=task_ids).recompute_comment_activity(counts_only=True)
+                invalidate_tasks(*task_ids)
+
+            last_pk = ids[-1]
+            done += deleted
+            purged += deleted
+            self.save_checkpoint(checkpoint_path, cutoff, last_pk, purged)
+            self.stdout.write(f'Purged {done}/{count} comments (up to #{last_pk}).')
+
+            if options['sleep']:
+                time.sleep(options['sleep'])
+
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+
+        self.stdout.write(self.style.SUCCESS(f'Purged {purged} comments'))
@@ -1,4 +1,6 @@
-from django.db import models
+from collections import Counter
+
+from django.db import models, transaction
 from django.db.models import Q
 from django.utils import timezone
 from datetime import timedelta
@@ -61,6 +63,50 @@ class CommentQuerySet(models.QuerySet):
             deleted_at__isnull=True
             )
     
+    def soft_delete(self, *, by_user):
+        """
+        Soft-delete every active comment in this queryset with one UPDATE,
+        and audit them with one bulk insert on commit. Returns the ids of
+        the comments deleted.
+        """
+        from rbac import audit
+        from rbac.models import AuditEntry
+        from tasks.caching import invalidate_tasks
+        from tasks.models import Task
+
+        with transaction.atomic(using=self.db):
+            rows = list(
+                self.filter(is_deleted=False)
+                .select_for_update()
+                .order_by()
+                .values_list('pk', 'task_id')
+            )
+            if not rows:
+                return []
+
+            ids = [pk for pk, _ in rows]
+            deleted_at = timezone.now()
+            self.model._base_manager.filter(pk__in=ids).update(
+                is_deleted = True,
+                deleted_at = deleted_at,
+                deleted_by = by_user,
+                updated_at = deleted_at,
+            )
+            removed = Counter(task_id for _, task_id in rows)
+            Task.objects.record_comment_removals(removed, at=deleted_at)
+            invalidate_tasks(*removed)
+
+            audit.record_entries(AuditEntry.objects.build_entries(
+                actor = by_user,
+                action = AuditEntry.ACTION_DELETE,
+                model = self.model,
+                object_ids = ids,
+                payload = {'is_deleted': True},
+                timestamp = deleted_at,
+            ))
+
+        return ids
+
     def purge_older_than(self, days):
         cutoff = timezone.now() - timedelta(days=days)
         return self.filter(
@@ -0,0 +1,20 @@
+# Generated by Django 6.0.1 on 2026-10-18 02:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comments', '0003_comment_edited_at'),
+        ('tasks', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['task', 'created_at', 'id'], name='comment_task_created_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 6.0.1 on 2026-10-18 03:18
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import F
+from django.db.models.functions import Coalesce, Greatest
+
+
+def backfill_updated_at(apps, schema_editor):
+    Comment = apps.get_model('comments', 'Comment')
+    Comment.objects.update(updated_at=Greatest(
+        F('created_at'),
+        Coalesce(F('edited_at'), F('created_at')),
+        Coalesce(F('deleted_at'), F('created_at')),
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comments', '0004_comment_task_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_updated_at, migrations.RunPython.noop),
+    ]
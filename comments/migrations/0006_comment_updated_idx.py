@@ -0,0 +1,21 @@
+# Generated by Django 6.0.1 on 2026-10-18 03:18
+
+from django.db import migrations, models
+
+from taskflow.migration_operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('comments', '0005_comment_updated_at'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='comment',
+            index=models.Index(fields=['updated_at', 'id'], name='comment_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,9 @@
+from django.urls import path
+from .views import CommentModerationView
+
+
+app_name = 'moderation'
+
+urlpatterns = [
+    path('', CommentModerationView.as_view(), name='comment-moderate'),
+]
@@ -0,0 +1,69 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+from rbac.services import user_has_perm
+
+
+class CommentPermissions:
+    """
+    Edit/delete rules for one viewer, evaluated in memory.
+
+    RBAC permissions and the edit window are resolved once, so flags for a
+    whole comment list cost no extra queries as long as 'author' is loaded
+    (or only 'author_id' is compared, as here).
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self.is_authenticated = bool(user) and user.is_authenticated
+        self.now = timezone.now()
+
+        window = getattr(settings, 'COMMENT_EDIT_WINDOW_MINUTES', None)
+        self.edit_window = None if window is None else timedelta(minutes=window)
+
+    @cached_property
+    def can_delete_any(self):
+        # RBAC rule, only resolved when the ownership rule doesn't decide
+        return user_has_perm(self.user, 'comments.delete_comment')
+
+    def can_delete(self, comment):
+        if not self.is_authenticated:
+            return False
+
+        # Ownership rule
+        if comment.author_id == self.user.pk:
+            return True
+
+        return self.can_delete_any
+
+    def can_edit(self, comment):
+        if comment.is_deleted:
+            return False
+
+        # Author only
+        if not self.is_authenticated or comment.author_id != self.user.pk:
+            return False
+
+        if comment.edited_at is not None:
+            return False # FIRST_EDIT_ONLY
+
+        if self.edit_window is None:
+            return True # Unlimited editing if disabled
+
+        return self.now <= comment.created_at + self.edit_window
+
+    def annotate(self, comments):
+        """
+        Return the '{comment, can_edit, can_delete}' items used by templates.
+        """
+        return [
+            {
+                'comment': comment,
+                'can_edit': self.can_edit(comment),
+                'can_delete': self.can_delete(comment),
+            }
+            for comment in comments
+        ]
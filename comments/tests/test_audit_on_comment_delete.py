@@ -25,8 +25,9 @@ class AuditOnCommentDeleteTest(TestCase):
             content = 'Hello'
         )
 
-        # perform soft-delete
-        comment.soft_delete(by_user = user)
+        # perform soft-delete; audit entries are written on commit
+        with self.captureOnCommitCallbacks(execute=True):
+            comment.soft_delete(by_user = user)
 
         # lazy import to avoid cross-import issues during test discovery
         from rbac.models import AuditEntry
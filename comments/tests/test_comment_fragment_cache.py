@@ -0,0 +1,79 @@
+from django.test import TestCase
+from django.urls import reverse
+from django.core.cache import cache
+from django.contrib.auth import get_user_model
+
+from tasks.models import Task
+from comments.models import Comment
+
+User = get_user_model()
+
+
+class CommentFragmentCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(
+            username = 'owner',
+            password = 'pass1234'
+        )
+        self.author = User.objects.create_user(
+            username = 'author',
+            password = 'pass1234'
+        )
+        self.task = Task.objects.create(
+            title = 'Test Task',
+            description = 'Task description',
+            owner = self.owner
+        )
+        self.comment = Comment.objects.create(
+            task = self.task,
+            author = self.author,
+            content = 'Original'
+        )
+        # The comment list fragment view; it has no page-level cache of its own
+        self.url = reverse('tasks:comments:comment-list', kwargs={'task_id': self.task.pk})
+        self.edit_url = reverse('tasks:comments:comment-edit', kwargs={'task_id': self.task.pk, 'pk': self.comment.pk})
+
+    def _get(self, username):
+        self.client.login(username=username, password='pass1234')
+        return self.client.get(self.url).content.decode()
+
+    def test_body_is_served_from_the_fragment_cache(self):
+        self.assertIn('Original', self._get('owner'))
+
+        # Bypasses save(), so nothing invalidates the fragment
+        Comment.objects.filter(pk=self.comment.pk).update(content='Changed behind our back')
+
+        self.assertIn('Original', self._get('owner'))
+
+    def test_save_invalidates_the_fragment(self):
+        self._get('owner')
+
+        self.comment.content = 'Corrected'
+        self.comment.save()
+
+        self.assertIn('Corrected', self._get('owner'))
+
+    def test_edit_renders_under_a_new_key(self):
+        self._get('owner')
+
+        self.client.login(username='author', password='pass1234')
+        self.client.post(self.edit_url, {'content': 'Edited'})
+
+        html = self._get('owner')
+        self.assertIn('Edited', html)
+        self.assertIn('(edited)', html)
+
+    def test_controls_stay_per_viewer(self):
+        self.assertNotIn(self.edit_url, self._get('owner'))
+
+        # Same cached body, but the author gets the edit link
+        self.assertIn(self.edit_url, self._get('author'))
+
+    def test_renamed_author_renders_under_a_new_key(self):
+        self.assertIn('author', self._get('owner'))
+
+        self.author.username = 'renamed'
+        self.author.save()
+
+        self.assertIn('renamed', self._get('owner'))
@@ -0,0 +1,158 @@
+from io import StringIO
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+
+from tasks.models import Task
+from comments.models import Comment
+from rbac.models import AuditEntry, Role, Membership
+
+User = get_user_model()
+
+
+class CommentModerationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(
+            username = 'owner',
+            password = 'pass1234'
+        )
+        self.spammer = User.objects.create_user(
+            username = 'spammer',
+            password = 'pass1234'
+        )
+        self.moderator = User.objects.create_user(
+            username = 'mod',
+            password = 'pass1234'
+        )
+        role = Role.objects.create(
+            name = 'Moderator',
+            slug = 'moderator'
+        )
+        role.permissions.add(Permission.objects.get(
+            content_type = ContentType.objects.get_for_model(Comment),
+            codename = 'delete_comment'
+        ))
+        Membership.objects.create(user=self.moderator, role=role)
+
+        self.tasks = [
+            Task.objects.create(
+                title = f'Task {i}',
+                description = 'Task description',
+                owner = self.owner
+            )
+            for i in range(2)
+        ]
+        self.spam = [
+            Comment.objects.create(
+                task = self.tasks[i % 2],
+                author = self.spammer,
+                content = f'Buy now {i}'
+            )
+            for i in range(6)
+        ]
+        self.legit = Comment.objects.create(
+            task = self.tasks[0],
+            author = self.owner,
+            content = 'Real comment'
+        )
+
+        self.url = reverse('moderation:comment-moderate')
+
+    def _active_ids(self):
+        return set(Comment.objects.values_list('pk', flat=True))
+
+    def test_queryset_soft_delete_uses_one_update_and_one_audit_insert(self):
+        ids = [comment.pk for comment in self.spam]
+        ContentType.objects.get_for_model(Comment)
+
+        # savepoint, select, UPDATE comments, recompute task counters,
+        # release; the audit INSERT waits for commit
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertNumQueries(5):
+                deleted = Comment.objects.filter(pk__in=ids).soft_delete(by_user=self.moderator)
+
+        self.assertEqual(sorted(deleted), ids)
+        self.assertEqual(self._active_ids(), {self.legit.pk})
+        comment = Comment.all_objects.get(pk=ids[0])
+        self.assertEqual(comment.deleted_by, self.moderator)
+        self.assertIsNotNone(comment.deleted_at)
+        self.assertEqual(
+            [task.active_comment_count for task in Task.objects.order_by('pk')],
+            [1, 0],
+        )
+        self.assertEqual(
+            sorted(AuditEntry.objects.filter(action=AuditEntry.ACTION_DELETE).values_list('target_object_id', flat=True)),
+            ids,
+        )
+
+    def test_already_deleted_comments_are_not_deleted_again(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.spam[0].soft_delete(by_user=self.spammer)
+            deleted = Comment.all_objects.filter(pk__in=[self.spam[0].pk, self.spam[1].pk]).soft_delete(by_user=self.moderator)
+
+        self.assertEqual(deleted, [self.spam[1].pk])
+        self.assertEqual(AuditEntry.objects.filter(target_object_id=self.spam[0].pk).count(), 1)
+
+    def test_moderator_endpoint_deletes_any_comment(self):
+        self.client.login(
+            username = 'mod',
+            password = 'pass1234'
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.url, {'ids': [self.spam[0].pk, self.legit.pk]})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['ids'], [self.spam[0].pk, self.legit.pk])
+        self.assertNotIn(self.legit.pk, self._active_ids())
+
+    def test_regular_user_only_deletes_own_comments(self):
+        self.client.login(
+            username = 'spammer',
+            password = 'pass1234'
+        )
+
+        response = self.client.post(self.url, {'ids': [self.spam[0].pk, self.legit.pk]})
+
+        self.assertEqual(response.json(), {'ids': [self.spam[0].pk], 'skipped': [self.legit.pk]})
+        self.assertIn(self.legit.pk, self._active_ids())
+
+    def test_invalid_ids_are_rejected(self):
+        self.client.login(
+            username = 'mod',
+            password = 'pass1234'
+        )
+
+        self.assertEqual(self.client.post(self.url, {'ids': ['spam']}).status_code, 400)
+        self.assertEqual(self.client.post(self.url, {}).status_code, 400)
+
+    def test_command_deletes_matching_comments_in_batches(self):
+        out = StringIO()
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('moderate_comments', '--as', 'mod', '--contains', 'Buy now',
+                         '--batch-size', '4', stdout=out)
+
+        self.assertEqual(self._active_ids(), {self.legit.pk})
+        self.assertIn('Soft-deleted 4/6', out.getvalue())
+        self.assertIn('Soft-deleted 6 comments', out.getvalue())
+        self.assertEqual(AuditEntry.objects.filter(actor=self.moderator).count(), 6)
+
+    def test_command_respects_permissions_and_dry_run(self):
+        out = StringIO()
+        call_command('moderate_comments', '--as', 'owner', '--task', str(self.tasks[0].pk),
+                     '--dry-run', stdout=out)
+
+        # Without the RBAC permission 'owner' may only delete their own comment
+        self.assertIn('Found 1 comments owner may delete.', out.getvalue())
+        self.assertEqual(len(self._active_ids()), 7)
+
+    def test_command_requires_a_filter(self):
+        with self.assertRaises(CommandError):
+            call_command('moderate_comments', '--as', 'mod', stdout=StringIO())
@@ -0,0 +1,79 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+
+from tasks.models import Task
+from comments.models import Comment
+
+User = get_user_model()
+
+
+@override_settings(COMMENTS_PAGE_SIZE=2)
+class CommentPaginationTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username = 'owner',
+            password = 'pass1234'
+        )
+        self.task = Task.objects.create(
+            title = 'Long Thread',
+            description = 'Task Description',
+            owner = self.owner
+        )
+        self.comments = [
+            Comment.objects.create(
+                task = self.task,
+                author = self.owner,
+                content = f'Comment number {i}'
+            )
+            for i in range(5)
+        ]
+        # Identical timestamps force the id tie-breaker to do the work
+        Comment.all_objects.filter(task=self.task).update(created_at=timezone.now())
+
+        self.client.login(
+            username = 'owner',
+            password = 'pass1234'
+        )
+
+    def _ids(self, response):
+        return [item['comment'].pk for item in response.context['comments']]
+
+    def test_detail_page_shows_first_page_and_load_more_link(self):
+        response = self.client.get(reverse('tasks:task-detail', kwargs={'pk': self.task.pk}))
+
+        self.assertEqual(self._ids(response), [c.pk for c in self.comments[:2]])
+        self.assertContains(response, reverse('tasks:comments:comment-list', kwargs={'task_id': self.task.pk}))
+        self.assertNotContains(response, 'Comment number 2')
+
+    def test_load_more_walks_every_active_comment_once(self):
+        self.comments[3].soft_delete(by_user=self.owner)
+
+        response = self.client.get(reverse('tasks:task-detail', kwargs={'pk': self.task.pk}))
+        seen = self._ids(response)
+        cursor = response.context['comments_next_cursor']
+
+        url = reverse('tasks:comments:comment-list', kwargs={'task_id': self.task.pk})
+        while cursor:
+            response = self.client.get(url, {'cursor': cursor})
+            self.assertEqual(response.status_code, 200)
+            seen += self._ids(response)
+            cursor = response.context['comments_next_cursor']
+
+        expected = [c.pk for i, c in enumerate(self.comments) if i != 3]
+        self.assertEqual(seen, expected)
+
+    def test_invalid_cursor_returns_404(self):
+        url = reverse('tasks:comments:comment-list', kwargs={'task_id': self.task.pk})
+
+        response = self.client.get(url, {'cursor': 'not-a-cursor'})
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_unknown_task_returns_404(self):
+        url = reverse('tasks:comments:comment-list', kwargs={'task_id': self.task.pk + 999})
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,128 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.contrib.auth import get_user_model
+
+from comments.models import Comment
+from tasks.models import Task
+from rbac.models import AuditEntry
+
+User = get_user_model()
+
+
+class CommentPurgeBatchTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username = 'owner',
+            password = 'pass1234'
+        )
+        self.task = Task.objects.create(
+            title = 'Test Task',
+            description = 'Task description',
+            owner = self.owner
+        )
+        self.old = []
+        for i in range(5):
+            comment = Comment.objects.create(
+                task = self.task,
+                author = self.owner,
+                content = f'Old comment {i}'
+            )
+            with self.captureOnCommitCallbacks(execute=True):
+                comment.soft_delete(by_user=self.owner)
+            self.old.append(comment)
+        Comment.all_objects.filter(pk__in=[c.pk for c in self.old]).update(
+            deleted_at=timezone.now() - timedelta(days=40)
+        )
+
+        self.active = Comment.objects.create(
+            task = self.task,
+            author = self.owner,
+            content = 'Active comment'
+        )
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.checkpoint = os.path.join(self.tmpdir.name, 'purge.json')
+
+    def _purge(self, *args):
+        out = StringIO()
+        call_command('purge_deleted_comments', '--days', '30', *args, stdout=out)
+        return out.getvalue()
+
+    def test_purges_in_batches_and_reports_progress(self):
+        output = self._purge('--batch-size', '2')
+
+        self.assertFalse(Comment.all_objects.filter(pk__in=[c.pk for c in self.old]).exists())
+        self.assertTrue(Comment.objects.filter(pk=self.active.pk).exists())
+        self.assertIn('Purged 2/5', output)
+        self.assertIn('Purged 5/5', output)
+
+    def test_batch_deletes_without_loading_rows(self):
+        # count; savepoint, locked select of ids, single DELETE, tombstone
+        # INSERT, recompute counts, release; savepoint, final empty select,
+        # release
+        with self.assertNumQueries(10):
+            self._purge('--batch-size', '5')
+
+    def test_resumes_from_checkpoint(self):
+        cutoff = timezone.now() - timedelta(days=30)
+        with open(self.checkpoint, 'w') as fh:
+            json.dump({'cutoff': cutoff.isoformat(), 'last_pk': self.old[2].pk, 'purged': 3}, fh)
+
+        output = self._purge('--batch-size', '1', '--checkpoint', self.checkpoint)
+
+        remaining = set(Comment.all_objects.values_list('pk', flat=True))
+        self.assertEqual(remaining, {c.pk for c in self.old[:3]} | {self.active.pk})
+        self.assertIn('Purged 5 comments', output)
+        self.assertIn(f'deleted before {cutoff.isoformat()}', output)
+        self.assertFalse(os.path.exists(self.checkpoint))
+
+    def test_checkpoint_from_other_days_is_refused(self):
+        cutoff = timezone.now() - timedelta(days=7)
+        with open(self.checkpoint, 'w') as fh:
+            json.dump({'days': 7, 'cutoff': cutoff.isoformat(), 'last_pk': 0, 'purged': 0}, fh)
+
+        with self.assertRaisesMessage(CommandError, '--days 7'):
+            self._purge('--checkpoint', self.checkpoint)
+
+        self.assertEqual(Comment.all_objects.count(), 6)
+        self.assertTrue(os.path.exists(self.checkpoint))
+
+    def test_checkpoint_is_written_after_each_batch(self):
+        written = []
+
+        from comments.management.commands import purge_deleted_comments
+
+        class RecordingCommand(purge_deleted_comments.Command):
+            def save_checkpoint(self, path, cutoff, last_pk, purged):
+                super().save_checkpoint(path, cutoff, last_pk, purged)
+                with open(path) as fh:
+                    written.append(json.load(fh))
+
+        call_command(RecordingCommand(), '--days', '30', '--batch-size', '2',
+                     '--checkpoint', self.checkpoint, stdout=StringIO())
+
+        self.assertEqual([state['purged'] for state in written], [2, 4, 5])
+        self.assertEqual(written[-1]['last_pk'], self.old[-1].pk)
+        self.assertEqual(written[-1]['days'], 30)
+
+    def test_audit_entries_are_kept_unless_requested(self):
+        ids = [c.pk for c in self.old]
+
+        self._purge('--batch-size', '2')
+        self.assertEqual(AuditEntry.objects.filter(target_object_id__in=ids).count(), 5)
+
+    def test_purge_audit_removes_entries_for_purged_comments(self):
+        ids = [c.pk for c in self.old]
+
+        self._purge('--batch-size', '2', '--purge-audit')
+
+        self.assertFalse(AuditEntry.objects.filter(target_object_id__in=ids).exists())
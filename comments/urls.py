@@ -1,10 +1,11 @@
 from django.urls import path
-from .views import CommentCreateView, CommentDeleteView, CommentUpdateView
+from .views import CommentCreateView, CommentDeleteView, CommentUpdateView, CommentListView
 
 
 app_name = 'comments'
 
 urlpatterns = [
+    path('', CommentListView.as_view(), name='comment-list'),
     path('add/', CommentCreateView.as_view(), name='comment-add'),
     path('<int:pk>/edit/', CommentUpdateView.as_view(), name='comment-edit'),
     path('<int:pk>/delete/', CommentDeleteView.as_view(), name='comment-delete'),
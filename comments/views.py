@@ -1,11 +1,67 @@
-from django.views.generic import CreateView, DeleteView, UpdateView
+from django.views.generic import CreateView, DeleteView, UpdateView, TemplateView, View
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.urls import reverse_lazy
 from django.shortcuts import get_object_or_404
-from django.http import Http404, HttpResponseRedirect
+from django.http import Http404, HttpResponseRedirect, JsonResponse
+from django.conf import settings
+from django.db import transaction
 
+from .forms import CommentModerationForm
 from .models import Comment
+from .permissions import CommentPermissions
 from tasks.models import Task
+from taskflow.pagination import KeysetPaginator, InvalidCursor
+
+
+def comment_page(task, cursor=None):
+    """
+    One keyset page of the task's active comments, as (comments, next
+    cursor). Nothing in it depends on the viewer, so it can be cached.
+    """
+    paginator = KeysetPaginator(('created_at', 'id'), per_page=settings.COMMENTS_PAGE_SIZE)
+    comments_qs = (
+        Comment.objects
+        .filter(task=task)
+        .select_related('author', 'task__owner')
+    )
+
+    try:
+        page = paginator.paginate(comments_qs, cursor)
+    except InvalidCursor:
+        raise Http404
+
+    return list(page.object_list), page.next_cursor
+
+
+def comment_page_context(task, user, cursor=None, *, page=None):
+    """
+    Template context for one keyset page of the task's active comments,
+    with the viewer's edit/delete flags. 'page' is a comment_page() result
+    to use instead of querying.
+    """
+    comments, next_cursor = page or comment_page(task, cursor)
+
+    return {
+        'comments': CommentPermissions(user).annotate(comments),
+        'comments_cursor': cursor,
+        'comments_next_cursor': next_cursor,
+        'comment_fragment_timeout': settings.COMMENTS_FRAGMENT_CACHE_TIMEOUT,
+    }
+
+
+class CommentListView(LoginRequiredMixin, TemplateView):
+    """
+    "Load more" fragment: the next page of comments after ?cursor=.
+    """
+    template_name = 'comments/comment_list.html'
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        task = get_object_or_404(Task, pk=self.kwargs['task_id'])
+        context['task'] = task
+        context.update(comment_page_context(task, self.request.user, self.request.GET.get('cursor')))
+        return context
+
 
 
 class CommentCreateView(LoginRequiredMixin, CreateView):
@@ -88,15 +144,46 @@ class CommentUpdateView(LoginRequiredMixin, UpdateView):
         return comment
     
     def form_valid(self, form):
-        # The super().form_valid will set self.object to the updated object
-        response = super().form_valid(form)
-        # Mark edited once only
-        self.object.mark_edited()
-        self.object.save(update_fields=['edited_at'])
+        # One transaction, as in Comment.save() and soft_delete()
+        with transaction.atomic():
+            # The super().form_valid will set self.object to the updated object
+            response = super().form_valid(form)
+            # Mark edited once only
+            self.object.mark_edited()
+            self.object.save(update_fields=['edited_at'])
+            Task.objects.record_comment_activity(self.object.task_id)
         return response
     
     def get_success_url(self):
         return reverse_lazy(
             'tasks:task-detail',
             kwargs={'pk': self.object.task.pk},
-        )
\ No newline at end of file
+        )
+
+
+class CommentModerationView(LoginRequiredMixin, View):
+    """
+    Soft-delete many comments at once (one UPDATE, one audit insert).
+
+    Scoped by Comment.objects.deletable_by(): moderators with the RBAC
+    'comments.delete_comment' permission may delete any comment, everyone
+    else only their own. Other ids are skipped. Responds with JSON.
+    """
+
+    def post(self, request, *args, **kwargs):
+        form = CommentModerationForm(request.POST)
+        if not form.is_valid():
+            return JsonResponse({'errors': form.errors}, status=400)
+
+        requested = form.cleaned_data['ids']
+        deleted = (
+            Comment.objects
+            .deletable_by(request.user)
+            .filter(pk__in=requested)
+            .soft_delete(by_user=request.user)
+        )
+
+        return JsonResponse({
+            'ids': sorted(deleted),
+            'skipped': sorted(set(requested) - set(deleted)),
+        })
@@ -0,0 +1,249 @@
+"""
+Cold storage for old audit entries.
+
+archive_entries() moves AuditEntry rows into append-only segment files:
+
+    audit-<first timestamp>-<first id>.ndjson.gz
+        NDJSON lines (the rbac.export format), compressed as a series of
+        independent gzip members of up to 'block_size' lines each. The file
+        is still an ordinary gzip stream (zcat reads it whole), but a single
+        member can be decompressed on its own.
+
+    audit-<first timestamp>-<first id>.idx
+        Sorted fixed-width records (content type id, object id, member
+        offset, member length), one per target per member. Read through
+        mmap and binary searched, so finding an object's entries costs
+        O(log n) page reads per segment and only the matching members are
+        decompressed.
+
+Segment and index are written to temporary files, fsynced and renamed into
+place before the rows are deleted from the database. A crash in between can
+archive a row twice; AuditArchive.history() drops duplicates by entry id.
+"""
+import bisect
+import gzip
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+from .export import iter_entries, to_json_line
+from .models import AuditEntry
+
+INDEX_RECORD = struct.Struct('<IQQI')  # content type id, object id, offset, length
+SEGMENT_SUFFIX = '.ndjson.gz'
+INDEX_SUFFIX = '.idx'
+
+
+class SegmentIndex:
+    """
+    Read-only view of one sidecar index file.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self._count = size // INDEX_RECORD.size
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, position):
+        # bisect compares keys only: (content type id, object id)
+        return INDEX_RECORD.unpack_from(self._mmap, position * INDEX_RECORD.size)[:2]
+
+    def blocks(self, content_type_id, object_id):
+        """
+        Return [(offset, length)] of the members holding entries for the target.
+        """
+        key = (content_type_id, object_id)
+        position = bisect.bisect_left(self, key)
+        blocks = []
+        while position < self._count:
+            ct_id, obj_id, offset, length = INDEX_RECORD.unpack_from(
+                self._mmap, position * INDEX_RECORD.size
+            )
+            if (ct_id, obj_id) != key:
+                break
+            blocks.append((offset, length))
+            position += 1
+        return blocks
+
+    def close(self):
+        if self._count:
+            self._mmap.close()
+        self._file.close()
+
+
+class SegmentWriter:
+    """
+    Write one segment and its index; nothing is visible until commit().
+    """
+
+    def __init__(self, directory, first_entry, *, block_size):
+        stamp = first_entry['timestamp'][:19].replace('-', '').replace(':', '')
+        stem = f"audit-{stamp}-{first_entry['id']}"
+        self.segment_path = Path(directory) / f'{stem}{SEGMENT_SUFFIX}'
+        self.index_path = Path(directory) / f'{stem}{INDEX_SUFFIX}'
+        self.block_size = block_size
+
+        self._file = open(f'{self.segment_path}.tmp', 'wb')
+        self._block, self._block_keys = [], set()
+        self._records = []
+        self.ids = []
+
+    def add(self, entry, content_type_id):
+        self._block.append(to_json_line(entry))
+        self._block_keys.add((content_type_id, entry['target_id']))
+        self.ids.append(entry['id'])
+        if len(self._block) >= self.block_size:
+            self._flush_block()
+
+    def _flush_block(self):
+        if not self._block:
+            return
+        data = gzip.compress(''.join(self._block).encode(), mtime=0)
+        offset = self._file.tell()
+        self._file.write(data)
+        self._records.extend((ct_id, obj_id, offset, len(data)) for ct_id, obj_id in self._block_keys)
+        self._block, self._block_keys = [], set()
+
+    def commit(self):
+        self._flush_block()
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+
+        with open(f'{self.index_path}.tmp', 'wb') as fh:
+            for record in sorted(self._records):
+                fh.write(INDEX_RECORD.pack(*record))
+            fh.flush()
+            os.fsync(fh.fileno())
+
+        # The index is renamed last: a segment without one is never read
+        os.replace(f'{self.segment_path}.tmp', self.segment_path)
+        os.replace(f'{self.index_path}.tmp', self.index_path)
+
+    def abort(self):
+        self._file.close()
+        for path in (f'{self.segment_path}.tmp', f'{self.index_path}.tmp'):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def _content_type_id(target_type, cache):
+    if target_type not in cache:
+        app_label, model = target_type.split('.', 1)
+        cache[target_type] = ContentType.objects.get_by_natural_key(app_label, model).pk
+    return cache[target_type]
+
+
+def _delete_archived(ids, batch_size):
+    for start in range(0, len(ids), batch_size):
+        with transaction.atomic():
+            AuditEntry.objects.filter(pk__in=ids[start:start + batch_size]).delete()
+
+
+def archive_entries(directory, cutoff, *, segment_size=100_000, block_size=256,
+                    batch_size=1000, chunk_size=2000, on_segment=None):
+    """
+    Move entries older than 'cutoff' into new segments under 'directory'.
+    Returns the number of archived entries.
+    """
+    os.makedirs(directory, exist_ok=True)
+    content_types = {}
+    archived = 0
+    remaining = AuditEntry.objects.older_than(cutoff)
+
+    while True:
+        # One query per segment, so a segment's rows are only deleted once
+        # the segment is safely on disk.
+        entries = iter_entries(remaining, chunk_size=chunk_size)
+        writer = None
+        try:
+            for entry in entries:
+                if writer is None:
+                    writer = SegmentWriter(directory, entry, block_size=block_size)
+                writer.add(entry, _content_type_id(entry['target_type'], content_types))
+                if len(writer.ids) >= segment_size:
+                    break
+            if writer is None:
+                return archived
+            writer.commit()
+        except BaseException:
+            if writer is not None:
+                writer.abort()
+            raise
+        finally:
+            entries.close()
+
+        _delete_archived(writer.ids, batch_size)
+        archived += len(writer.ids)
+
+        # Continue after the last archived row rather than relying on the
+        # delete, so rows that could not be deleted are not archived again.
+        last = parse_datetime(entry['timestamp'])
+        remaining = AuditEntry.objects.older_than(cutoff).filter(
+            Q(timestamp__gt=last) | Q(timestamp=last, id__gt=entry['id'])
+        )
+        if on_segment:
+            on_segment(writer.segment_path, len(writer.ids))
+
+
+class AuditArchive:
+    """
+    Lookups over the segments in 'directory'.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+
+    def segments(self):
+        if not self.directory.exists():
+            return []
+        return sorted(
+            path for path in self.directory.glob(f'audit-*{SEGMENT_SUFFIX}')
+            if path.with_name(path.name[:-len(SEGMENT_SUFFIX)] + INDEX_SUFFIX).exists()
+        )
+
+    def history(self, target=None, *, content_type_id=None, object_id=None):
+        """
+        Archived entries (dicts in the rbac.export format) for a model
+        instance, or a content type id / object id pair, oldest first.
+        """
+        if target is not None:
+            content_type_id = ContentType.objects.get_for_model(target).pk
+            object_id = target.pk
+        target_type = None
+        found = {}
+
+        for segment in self.segments():
+            index = SegmentIndex(segment.with_name(segment.name[:-len(SEGMENT_SUFFIX)] + INDEX_SUFFIX))
+            try:
+                blocks = index.blocks(content_type_id, object_id)
+            finally:
+                index.close()
+            if not blocks:
+                continue
+
+            if target_type is None:
+                content_type = ContentType.objects.get_for_id(content_type_id)
+                target_type = f'{content_type.app_label}.{content_type.model}'
+
+            with open(segment, 'rb') as fh:
+                for offset, length in blocks:
+                    fh.seek(offset)
+                    for line in gzip.decompress(fh.read(length)).splitlines():
+                        entry = json.loads(line)
+                        if entry['target_id'] == object_id and entry['target_type'] == target_type:
+                            found[entry['id']] = entry
+
+        return sorted(found.values(), key=lambda entry: (entry['timestamp'], entry['id']))
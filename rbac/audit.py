@@ -0,0 +1,164 @@
+"""
+Buffered audit writes.
+
+record() collects AuditEntry rows for the current transaction and writes
+them with one bulk_create() from transaction.on_commit(), so a request or
+bulk action that audits many objects pays one INSERT instead of one per
+entry, and a rolled back transaction leaves no audit rows behind.
+
+Outside a transaction (autocommit) entries are written immediately. Setting
+AUDIT_BUFFER_MODE = 'sync' writes every entry immediately, inside the
+caller's transaction, as before.
+"""
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from .models import AuditEntry
+
+logger = logging.getLogger(__name__)
+
+MODE_DEFERRED = 'deferred'
+MODE_SYNC = 'sync'
+
+_local = threading.local()
+
+
+class AuditMetrics:
+    """
+    Process-wide flush counters (thread-safe).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.flushes = 0
+            self.entries_written = 0
+            self.failed_flushes = 0
+            self.entries_lost = 0
+            self.flush_seconds = 0.0
+            self.largest_flush = 0
+
+    def record_flush(self, count, seconds):
+        with self._lock:
+            self.flushes += 1
+            self.entries_written += count
+            self.flush_seconds += seconds
+            self.largest_flush = max(self.largest_flush, count)
+
+    def record_failure(self, count):
+        with self._lock:
+            self.failed_flushes += 1
+            self.entries_lost += count
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'flushes': self.flushes,
+                'entries_written': self.entries_written,
+                'failed_flushes': self.failed_flushes,
+                'entries_lost': self.entries_lost,
+                'flush_seconds': self.flush_seconds,
+                'largest_flush': self.largest_flush,
+            }
+
+
+metrics = AuditMetrics()
+
+
+class AuditBuffer:
+    """
+    Pending entries of one transaction (or savepoint) on one database.
+    """
+
+    def __init__(self, using):
+        self.using = using
+        self.entries = []
+        self.flushed = False
+
+    def is_pending(self):
+        # Committed, rolled back, or already flushed buffers are done with.
+        if self.flushed:
+            return False
+        run_on_commit = connections[self.using].run_on_commit
+        return any(callback[1] == self.flush for callback in run_on_commit)
+
+    def flush(self):
+        self.flushed = True
+        entries, self.entries = self.entries, []
+        if not entries:
+            return
+        try:
+            write_entries(entries, using=self.using)
+        except Exception:
+            # Already logged and counted; the business transaction has
+            # committed and must not be reported as failed.
+            pass
+
+
+def write_entries(entries, using=DEFAULT_DB_ALIAS):
+    """
+    Insert 'entries' with one bulk_create, recording flush metrics.
+    """
+    started = time.perf_counter()
+    try:
+        AuditEntry.objects.using(using).bulk_create(
+            entries, batch_size=getattr(settings, 'AUDIT_BUFFER_BATCH_SIZE', 1000)
+        )
+    except Exception:
+        metrics.record_failure(len(entries))
+        logger.exception('Failed to write %d audit entries', len(entries))
+        raise
+
+    elapsed = time.perf_counter() - started
+    metrics.record_flush(len(entries), elapsed)
+    logger.debug('Wrote %d audit entries in %.1f ms', len(entries), elapsed * 1000)
+
+
+def _current_buffer(using):
+    connection = connections[using]
+    buffers = getattr(_local, 'buffers', None)
+    if buffers is None:
+        buffers = _local.buffers = {}
+
+    # A savepoint gets its own buffer, so rolling it back discards its
+    # entries together with its on_commit callback.
+    key = (using, tuple(connection.savepoint_ids))
+    buffer = buffers.get(key)
+    if buffer is None or not buffer.is_pending():
+        for stale in [k for k, b in buffers.items() if not b.is_pending()]:
+            del buffers[stale]
+
+        buffer = buffers[key] = AuditBuffer(using)
+        transaction.on_commit(buffer.flush, using=using, robust=True)
+
+    return buffer
+
+
+def record(*, actor, action, target, payload=None, timestamp=None, using=DEFAULT_DB_ALIAS):
+    """
+    Audit 'action' on 'target'; written when the current transaction commits.
+    """
+    entry = AuditEntry.objects.build_entry(
+        actor=actor, action=action, target=target, payload=payload, timestamp=timestamp
+    )
+    record_entries([entry], using=using)
+    return entry
+
+
+def record_entries(entries, using=DEFAULT_DB_ALIAS):
+    """
+    Buffer already built (unsaved) AuditEntry instances.
+    """
+    mode = getattr(settings, 'AUDIT_BUFFER_MODE', MODE_DEFERRED)
+    if mode == MODE_SYNC or not connections[using].in_atomic_block:
+        write_entries(list(entries), using=using)
+        return
+
+    _current_buffer(using).entries.extend(entries)
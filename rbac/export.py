@@ -0,0 +1,82 @@
+"""
+Streaming serialization of audit entries.
+
+Rows are read with QuerySet.values() and iterator(chunk_size=...): no model
+instances are built, and on PostgreSQL the iterator uses a server-side
+cursor, so memory stays flat however many entries are exported.
+"""
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .models import AuditEntry
+
+FIELDS = ['id', 'timestamp', 'actor_id', 'actor', 'action', 'target_type', 'target_id', 'payload']
+
+_COLUMNS = {
+    'id': 'id',
+    'timestamp': 'timestamp',
+    'actor_id': 'actor_id',
+    'actor': 'actor__username',
+    'action': 'action',
+    'target_app_label': 'target_content_type__app_label',
+    'target_model': 'target_content_type__model',
+    'target_id': 'target_object_id',
+    'payload': 'payload',
+}
+
+
+def iter_entries(queryset=None, *, chunk_size=2000):
+    """
+    Yield audit entries as plain dicts (see FIELDS) in (timestamp, id) order.
+    """
+    if queryset is None:
+        queryset = AuditEntry.objects.all()
+
+    rows = (
+        queryset
+        .order_by('timestamp', 'id')
+        .values_list(*_COLUMNS.values())
+        .iterator(chunk_size=chunk_size)
+    )
+    for row in rows:
+        values = dict(zip(_COLUMNS, row))
+        yield {
+            'id': values['id'],
+            'timestamp': values['timestamp'].isoformat(),
+            'actor_id': values['actor_id'],
+            'actor': values['actor'],
+            'action': values['action'],
+            'target_type': f"{values['target_app_label']}.{values['target_model']}",
+            'target_id': values['target_id'],
+            'payload': values['payload'],
+        }
+
+
+def to_json_line(entry):
+    return json.dumps(entry, cls=DjangoJSONEncoder, separators=(',', ':')) + '\n'
+
+
+def write_ndjson(entries, stream):
+    count = 0
+    for entry in entries:
+        stream.write(to_json_line(entry))
+        count += 1
+    return count
+
+
+def write_csv(entries, stream):
+    writer = csv.DictWriter(stream, fieldnames=FIELDS, lineterminator='\n')
+    writer.writeheader()
+    count = 0
+    for entry in entries:
+        writer.writerow({**entry, 'payload': json.dumps(entry['payload'], cls=DjangoJSONEncoder)})
+        count += 1
+    return count
+
+
+WRITERS = {
+    'ndjson': write_ndjson,
+    'csv': write_csv,
+}
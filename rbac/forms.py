@@ -0,0 +1,44 @@
+from django import forms
+from django.contrib.contenttypes.models import ContentType
+
+from .models import AuditEntry
+
+
+class AuditFilterForm(forms.Form):
+    """
+    Audit log filters (GET parameters). Invalid values are ignored, like
+    the task list filters.
+    """
+    actor = forms.CharField(required=False, help_text='Username')
+    action = forms.ChoiceField(choices=[('', 'any')] + AuditEntry.ACTION_CHOICES, required=False)
+    target_type = forms.CharField(required=False, help_text='app_label.model, e.g. comments.comment')
+    since = forms.DateTimeField(required=False)
+    until = forms.DateTimeField(required=False)
+
+    def _cleaned(self, name):
+        if not self.is_bound:
+            return None
+        self.is_valid()
+        return self.cleaned_data.get(name)
+
+    def _content_type(self):
+        value = self._cleaned('target_type')
+        if not value or '.' not in value:
+            return None
+        app_label, model = value.lower().split('.', 1)
+        try:
+            return ContentType.objects.get_by_natural_key(app_label, model)
+        except ContentType.DoesNotExist:
+            return None
+
+    def filter_queryset(self, queryset):
+        filters = {
+            'actor__username': self._cleaned('actor'),
+            'action': self._cleaned('action'),
+            'target_content_type': self._content_type(),
+        }
+        queryset = queryset.filter(**{
+            lookup: value for lookup, value in filters.items() if value
+        })
+        # Timestamp bounds let PostgreSQL skip partitions outside the range
+        return queryset.between(self._cleaned('since'), self._cleaned('until'))
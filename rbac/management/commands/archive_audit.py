@@ -0,0 +1,43 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from rbac.archive import archive_entries
+from rbac.models import AuditEntry
+
+
+class Command(BaseCommand):
+    help = 'Move old audit entries into compressed, indexed archive segments'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.AUDIT_ARCHIVE_AFTER_DAYS,
+                            help='Archive entries older than this many days')
+        parser.add_argument('--dir', default=str(settings.AUDIT_ARCHIVE_DIR),
+                            help='Directory holding the archive segments')
+        parser.add_argument('--segment-size', type=int, default=100_000,
+                            help='Maximum entries per segment file')
+        parser.add_argument('--block-size', type=int, default=256,
+                            help='Entries per independently compressed block')
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Archived rows deleted per transaction')
+        parser.add_argument('--dry-run', action='store_true')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+
+        if options['dry_run']:
+            count = AuditEntry.objects.older_than(cutoff).count()
+            self.stdout.write(f'Would archive {count} audit entries older than {cutoff:%Y-%m-%d}.')
+            return
+
+        archived = archive_entries(
+            options['dir'],
+            cutoff,
+            segment_size=options['segment_size'],
+            block_size=options['block_size'],
+            batch_size=options['batch_size'],
+            on_segment=lambda path, count: self.stdout.write(f'Wrote {count} entries to {path}'),
+        )
+        self.stdout.write(self.style.SUCCESS(f'Archived {archived} audit entries older than {cutoff:%Y-%m-%d}'))
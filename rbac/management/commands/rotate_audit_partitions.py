@@ -0,0 +1,59 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+from rbac import partitioning
+from rbac.models import AuditEntry
+
+
+class Command(BaseCommand):
+    help = 'Create upcoming monthly audit partitions and drop expired audit entries'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.AUDIT_RETENTION_DAYS,
+                            help='Keep audit entries newer than this many days')
+        parser.add_argument('--months-ahead', type=int, default=settings.AUDIT_PARTITIONS_AHEAD,
+                            help='Monthly partitions to create ahead of the current month')
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Rows per DELETE where whole partitions cannot be dropped')
+        parser.add_argument('--dry-run', action='store_true')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        dry_run = options['dry_run']
+
+        if partitioning.is_supported(connection) and partitioning.is_partitioned(connection):
+            if not dry_run:
+                for name in partitioning.ensure_partitions(connection, months_ahead=options['months_ahead']):
+                    self.stdout.write(f'Created partition {name}')
+
+            dropped = partitioning.drop_expired_partitions(connection, cutoff, dry_run=dry_run)
+            for name in dropped:
+                self.stdout.write(f'{"Would drop" if dry_run else "Dropped"} partition {name}')
+
+            # The month straddling the cutoff is kept whole; only rows older
+            # than every remaining monthly partition (which can only be in
+            # the default partition) are deleted row by row.
+            remaining = [
+                start for name, start, _ in partitioning.list_partitions(connection)
+                if name not in dropped
+            ]
+            if remaining:
+                cutoff = min(cutoff, remaining[0])
+        else:
+            self.stdout.write('Audit table is not partitioned; deleting expired entries in batches.')
+
+        if dry_run:
+            count = AuditEntry.objects.older_than(cutoff).count()
+            self.stdout.write(f'Would delete {count} audit entries older than {cutoff:%Y-%m-%d}.')
+            return
+
+        deleted = partitioning.delete_expired_entries(
+            cutoff,
+            batch_size=options['batch_size'],
+            on_batch=lambda done: self.stdout.write(f'Deleted {done} audit entries...'),
+        )
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} audit entries older than {cutoff:%Y-%m-%d}'))
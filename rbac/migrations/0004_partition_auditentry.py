@@ -0,0 +1,27 @@
+from django.db import migrations
+
+
+def partition_audit_table(apps, schema_editor):
+    from rbac.partitioning import ensure_partitions, is_supported, partition_table
+
+    connection = schema_editor.connection
+    if is_supported(connection):
+        partition_table(connection)
+        ensure_partitions(connection)
+
+
+def unpartition_audit_table(apps, schema_editor):
+    from rbac.partitioning import unpartition_table
+
+    unpartition_table(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rbac', '0003_alter_auditentry_timestamp'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_audit_table, unpartition_audit_table),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:30
+
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('rbac', '0004_partition_auditentry'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # Plain (not concurrent) index: CREATE INDEX CONCURRENTLY is not
+        # supported on a partitioned table.
+        migrations.AddIndex(
+            model_name='auditentry',
+            index=models.Index(fields=['timestamp', 'id'], name='audit_timestamp_id_idx'),
+        ),
+        migrations.AlterField(
+            model_name='auditentry',
+            name='timestamp',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
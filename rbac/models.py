@@ -36,13 +36,35 @@ class Membership(models.Model):
         return f"{self.user} -> {self.role}"
         
 
-class AuditEntryManager(models.Manager):
-    def create_entry(self, *, actor, action, target, payload=None, timestamp=None):
+class AuditEntryQuerySet(models.QuerySet):
+    """
+    Time-bounded lookups. On PostgreSQL the audit table is partitioned by
+    month (see rbac.partitioning), so a timestamp filter limits the scan
+    to the matching partitions.
+    """
+
+    def between(self, start=None, end=None):
         """
-        Create an AuditEntry for 'target' (a Django model instance).
+        Entries with start <= timestamp < end (either bound optional).
+        """
+        qs = self
+        if start is not None:
+            qs = qs.filter(timestamp__gte=start)
+        if end is not None:
+            qs = qs.filter(timestamp__lt=end)
+        return qs
+
+    def older_than(self, cutoff):
+        return self.filter(timestamp__lt=cutoff)
+
+
+class AuditEntryManager(models.Manager.from_queryset(AuditEntryQuerySet)):
+    def build_entry(self, *, actor, action, target, payload=None, timestamp=None):
+        """
+        Build an unsaved AuditEntry for 'target' (a Django model instance).
         """
         ct = ContentType.objects.get_for_model(target)
-        return self.create(
+        return self.model(
             actor = actor,
             action = action,
             target_content_type = ct,
@@ -50,6 +72,35 @@ class AuditEntryManager(models.Manager):
             payload = payload or {},
             timestamp = timestamp or timezone.now()
         )
+
+    def build_entries(self, *, actor, action, model, object_ids, payload=None, timestamp=None):
+        """
+        Build one unsaved AuditEntry per id in 'object_ids' (instances of
+        'model'), without loading the targets.
+        """
+        ct = ContentType.objects.get_for_model(model)
+        timestamp = timestamp or timezone.now()
+        return [
+            self.model(
+                actor = actor,
+                action = action,
+                target_content_type = ct,
+                target_object_id = object_id,
+                payload = payload or {},
+                timestamp = timestamp
+            )
+            for object_id in object_ids
+        ]
+
+    def create_entry(self, *, actor, action, target, payload=None, timestamp=None):
+        """
+        Create an AuditEntry for 'target' (a Django model instance).
+        """
+        entry = self.build_entry(
+            actor=actor, action=action, target=target, payload=payload, timestamp=timestamp
+        )
+        entry.save(using=self._db)
+        return entry
     
 class AuditEntry(models.Model):
     """
@@ -79,14 +130,18 @@ class AuditEntry(models.Model):
     target_object_id = models.PositiveIntegerField()
     target = GenericForeignKey('target_content_type', 'target_object_id')
 
-    timestamp = models.DateTimeField(default=timezone.now(), db_index=True)
+    timestamp = models.DateTimeField(default=timezone.now)
     payload = models.JSONField(default=dict, editable=False)
 
     objects = AuditEntryManager()
 
     class Meta:
         ordering = ['-timestamp']
-        indexes = [models.Index(fields=['target_content_type', 'target_object_id'])]    
+        indexes = [
+            models.Index(fields=['target_content_type', 'target_object_id']),
+            # Serves time-range filters and the audit log's keyset ordering
+            models.Index(fields=['timestamp', 'id'], name='audit_timestamp_id_idx'),
+        ]
         
     def __str__(self):
         return f"AuditEntry({self.action}) on {self.target_content_type}#{self.target_object_id} by {self.actor} @ {self.timestamp}"
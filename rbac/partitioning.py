@@ -0,0 +1,297 @@
+"""
+Monthly range partitioning of the audit log (PostgreSQL only).
+
+rbac_auditentry is converted to a table PARTITIONED BY RANGE (timestamp)
+with one child table per calendar month, named rbac_auditentry_pYYYYMM,
+plus a default partition that catches rows outside every month created so
+far. Queries that filter on timestamp only scan the matching months, and
+retention drops whole months instead of running DELETE.
+
+PostgreSQL requires the partition key in every unique constraint, so the
+table's primary key becomes (id, timestamp). ids still come from a single
+sequence and stay unique; the model keeps treating 'id' as its primary key.
+
+Other databases keep a regular table; delete_expired_entries() is the
+retention fallback there.
+"""
+import re
+from datetime import datetime, timezone as dt_timezone
+
+from django.db import transaction
+
+from .models import AuditEntry
+
+TABLE = AuditEntry._meta.db_table
+DEFAULT_PARTITION = f'{TABLE}_default'
+PARTITION_RE = re.compile(rf'^{TABLE}_p(\d{{4}})(\d{{2}})$')
+
+
+def is_supported(connection):
+    return connection.vendor == 'postgresql'
+
+
+def month_start(value):
+    """
+    First instant (UTC) of the month containing 'value'.
+    """
+    value = value.astimezone(dt_timezone.utc)
+    return datetime(value.year, value.month, 1, tzinfo=dt_timezone.utc)
+
+
+def add_months(start, months):
+    index = start.year * 12 + start.month - 1 + months
+    return start.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(start):
+    return f'{TABLE}_p{start.year:04d}{start.month:02d}'
+
+
+def is_partitioned(connection):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass',
+            [TABLE],
+        )
+        return cursor.fetchone() is not None
+
+
+def list_partitions(connection):
+    """
+    Return [(name, start, end)] for the monthly partitions, oldest first.
+    The default partition is not included.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT c.relname FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = %s::regclass
+            """,
+            [TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    partitions = []
+    for name in names:
+        match = PARTITION_RE.match(name)
+        if match:
+            start = datetime(int(match[1]), int(match[2]), 1, tzinfo=dt_timezone.utc)
+            partitions.append((name, start, add_months(start, 1)))
+    return sorted(partitions, key=lambda partition: partition[1])
+
+
+def _create_partition(cursor, start):
+    """
+    Create the partition for the month beginning at 'start', moving any rows
+    of that month out of the default partition first (PostgreSQL refuses to
+    attach a partition whose range the default partition already holds).
+    """
+    name, end = partition_name(start), add_months(start, 1)
+    qn = cursor.db.ops.quote_name
+
+    cursor.execute(
+        f'CREATE TABLE {qn(name)} (LIKE {qn(TABLE)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+    )
+    cursor.execute(
+        f"""
+        WITH moved AS (
+            DELETE FROM {qn(DEFAULT_PARTITION)}
+            WHERE timestamp >= %s AND timestamp < %s
+            RETURNING *
+        )
+        INSERT INTO {qn(name)} SELECT * FROM moved
+        """,
+        [start, end],
+    )
+    cursor.execute(
+        f'ALTER TABLE {qn(TABLE)} ATTACH PARTITION {qn(name)} FOR VALUES FROM (%s) TO (%s)',
+        [start, end],
+    )
+    return name
+
+
+def ensure_partitions(connection, *, months_ahead=3, now=None):
+    """
+    Create the partitions from the current month through 'months_ahead'
+    months ahead. Returns the names of the partitions created.
+    """
+    start = month_start(now or datetime.now(dt_timezone.utc))
+    existing = {name for name, _, _ in list_partitions(connection)}
+    created = []
+
+    for offset in range(months_ahead + 1):
+        month = add_months(start, offset)
+        if partition_name(month) in existing:
+            continue
+        with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+            created.append(_create_partition(cursor, month))
+    return created
+
+
+def drop_expired_partitions(connection, cutoff, *, dry_run=False):
+    """
+    Drop every monthly partition that ends on or before 'cutoff'. Returns
+    the names of the dropped partitions. Months straddling the cutoff are
+    kept whole.
+    """
+    expired = [name for name, _, end in list_partitions(connection) if end <= cutoff]
+    if dry_run:
+        return expired
+
+    qn = connection.ops.quote_name
+    for name in expired:
+        with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+            cursor.execute(f'ALTER TABLE {qn(TABLE)} DETACH PARTITION {qn(name)}')
+            cursor.execute(f'DROP TABLE {qn(name)}')
+    return expired
+
+
+def delete_expired_entries(cutoff, *, batch_size=1000, using='default', on_batch=None):
+    """
+    Delete entries older than 'cutoff' in short primary-key batches, for
+    tables (or the default partition) that cannot be dropped wholesale.
+    Returns the number of deleted rows.
+    """
+    qs = AuditEntry.objects.using(using).older_than(cutoff)
+    deleted = 0
+
+    while True:
+        ids = list(qs.order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            return deleted
+
+        with transaction.atomic(using=using):
+            count, _ = AuditEntry.objects.using(using).filter(pk__in=ids).delete()
+        deleted += count
+        if on_batch:
+            on_batch(deleted)
+
+
+def _describe_table(cursor):
+    """
+    Return (primary key name, [(index name, definition)], [(foreign key
+    name, definition)]) for the audit table, so they can be replayed on
+    the rebuilt table under their original names.
+    """
+    cursor.execute(
+        "SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'p'",
+        [TABLE],
+    )
+    primary_key = cursor.fetchone()[0]
+    cursor.execute(
+        """
+        SELECT indexname, replace(indexdef, ' ON ONLY ', ' ON ') FROM pg_indexes
+        WHERE tablename = %s AND indexname NOT IN (
+            SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass
+        )
+        """,
+        [TABLE, TABLE],
+    )
+    indexes = cursor.fetchall()
+    cursor.execute(
+        """
+        SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint
+        WHERE conrelid = %s::regclass AND contype = 'f'
+        """,
+        [TABLE],
+    )
+    return primary_key, indexes, cursor.fetchall()
+
+
+def _restore_table_definition(cursor, indexes, foreign_keys):
+    qn = cursor.db.ops.quote_name
+    for name, definition in foreign_keys:
+        cursor.execute(f'ALTER TABLE {qn(TABLE)} ADD CONSTRAINT {qn(name)} {definition}')
+    for _, definition in indexes:
+        cursor.execute(definition)
+
+
+def partition_table(connection):
+    """
+    Convert the regular rbac_auditentry table to a partitioned one, keeping
+    its rows, indexes and foreign keys. Must run inside a transaction.
+    """
+    if not is_supported(connection) or is_partitioned(connection):
+        return
+
+    qn = connection.ops.quote_name
+    legacy = f'{TABLE}_unpartitioned'
+    sequence = f'{TABLE}_id_seq'
+
+    with connection.cursor() as cursor:
+        primary_key, indexes, foreign_keys = _describe_table(cursor)
+        cursor.execute(f'SELECT min(timestamp), max(timestamp) FROM {qn(TABLE)}')
+        oldest, newest = cursor.fetchone()
+
+        cursor.execute(f'ALTER TABLE {qn(TABLE)} RENAME TO {qn(legacy)}')
+        cursor.execute(
+            f'ALTER TABLE {qn(legacy)} RENAME CONSTRAINT {qn(primary_key)} TO {qn(legacy + "_pkey")}'
+        )
+        cursor.execute(
+            f"""
+            CREATE TABLE {qn(TABLE)} (
+                LIKE {qn(legacy)} INCLUDING CONSTRAINTS,
+                CONSTRAINT {qn(primary_key)} PRIMARY KEY (id, timestamp)
+            ) PARTITION BY RANGE (timestamp)
+            """
+        )
+        cursor.execute(f'CREATE TABLE {qn(DEFAULT_PARTITION)} PARTITION OF {qn(TABLE)} DEFAULT')
+
+        if oldest is not None:
+            month, last = month_start(oldest), month_start(newest)
+            while month <= last:
+                _create_partition(cursor, month)
+                month = add_months(month, 1)
+
+        cursor.execute(f'INSERT INTO {qn(TABLE)} SELECT * FROM {qn(legacy)}')
+        cursor.execute(f'DROP TABLE {qn(legacy)}')
+
+        # Identity columns are not allowed on partitioned tables before
+        # PostgreSQL 17; a plain sequence works everywhere.
+        cursor.execute(f'CREATE SEQUENCE {qn(sequence)} OWNED BY {qn(TABLE)}.id')
+        cursor.execute(
+            f'ALTER TABLE {qn(TABLE)} ALTER COLUMN id SET DEFAULT nextval(%s::regclass)',
+            [sequence],
+        )
+        cursor.execute(
+            f'SELECT setval(%s, coalesce(max(id), 0) + 1, false) FROM {qn(TABLE)}',
+            [sequence],
+        )
+        _restore_table_definition(cursor, indexes, foreign_keys)
+
+
+def unpartition_table(connection):
+    """
+    Reverse of partition_table(): copy every row back into a regular table.
+    """
+    if not is_supported(connection) or not is_partitioned(connection):
+        return
+
+    qn = connection.ops.quote_name
+    partitioned = f'{TABLE}_partitioned'
+
+    with connection.cursor() as cursor:
+        primary_key, indexes, foreign_keys = _describe_table(cursor)
+
+        cursor.execute(f'ALTER TABLE {qn(TABLE)} RENAME TO {qn(partitioned)}')
+        cursor.execute(
+            f'ALTER TABLE {qn(partitioned)} RENAME CONSTRAINT {qn(primary_key)} TO {qn(partitioned + "_pkey")}'
+        )
+        cursor.execute(
+            f"""
+            CREATE TABLE {qn(TABLE)} (
+                LIKE {qn(partitioned)} INCLUDING CONSTRAINTS,
+                CONSTRAINT {qn(primary_key)} PRIMARY KEY (id)
+            )
+            """
+        )
+        cursor.execute(f'INSERT INTO {qn(TABLE)} SELECT * FROM {qn(partitioned)}')
+        cursor.execute(f'DROP TABLE {qn(partitioned)}')
+
+        cursor.execute(f'ALTER TABLE {qn(TABLE)} ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY')
+        cursor.execute(
+            f"SELECT setval(pg_get_serial_sequence(%s, 'id'), coalesce(max(id), 0) + 1, false) FROM {qn(TABLE)}",
+            [TABLE],
+        )
+        _restore_table_definition(cursor, indexes, foreign_keys)
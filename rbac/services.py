@@ -1,21 +1,62 @@
+from django.conf import settings
 from django.contrib.auth.models import Permission
+from django.core.cache import cache
+from django.db import transaction
+
+from taskflow.cache import get_versions, bump_version
+
+GLOBAL_VERSION_KEY = 'rbac:perms:version'
+
+# Bumped on every invalidation in this process; per-request memos stored on
+# the user instance are only trusted while it is unchanged.
+_generation = 0
+
+
+def _user_version_key(user_id):
+    return f'rbac:perms:version:user:{user_id}'
+
+
+def _load_user_permissions(user):
+    """
+    Resolve the permission set from the database in a single joined query
+    over Membership -> Role -> Permission -> ContentType.
+    """
+    rows = (
+        Permission.objects
+        .filter(rbac_roles__membership__user=user)
+        .values_list('content_type__app_label', 'codename')
+        .distinct()
+    )
+
+    return frozenset(f"{app_label}.{codename}" for app_label, codename in rows)
 
 
 def get_user_permissions(user):
     """
     Return a set of permission codenames granted via RBAC roles.
+
+    Lookups go through a per-request memo on the user instance, then a shared
+    cache entry keyed by user and permission version, and only hit the
+    database when both miss.
     """
     if not user or user.is_anonymous:
-        return set()
-    
-    perms = set()
-
-    for membership in user.memberships.select_related('role').all():
-        role = membership.role
-        # role.permissions is a ManyToMany to Permission
-        for p in role.permissions.select_related('content_type').all():
-            perms.add(f"{p.content_type.app_label}.{p.codename}")
-            
+        return frozenset()
+
+    memo = getattr(user, '_rbac_perm_cache', None)
+    if memo is not None and memo[0] == _generation:
+        return memo[1]
+
+    global_version, user_version = get_versions(
+        GLOBAL_VERSION_KEY, _user_version_key(user.pk)
+    )
+    key = f'rbac:perms:{user.pk}:{global_version}:{user_version}'
+
+    perms = cache.get(key)
+    if perms is None:
+        perms = _load_user_permissions(user)
+        cache.set(key, perms, getattr(settings, 'RBAC_PERMISSION_CACHE_TIMEOUT', 300))
+
+    user._rbac_perm_cache = (_generation, perms)
     return perms
 
 def user_has_perm(user, perm_codename):
@@ -25,8 +66,31 @@ def user_has_perm(user, perm_codename):
     """
     if not user or user.is_anonymous:
         return False
-    
+
     if user.is_superuser:
         return True
-    
-    return perm_codename in get_user_permissions(user)
\ No newline at end of file
+
+    return perm_codename in get_user_permissions(user)
+
+
+def _invalidate(key):
+    global _generation
+    _generation += 1
+    bump_version(key)
+    # Bump again once the change is visible to other connections, so a
+    # reader that cached the pre-commit state in between is invalidated too.
+    transaction.on_commit(lambda: bump_version(key))
+
+
+def invalidate_user_permissions(user_id):
+    """
+    Drop the cached permission set of a single user.
+    """
+    _invalidate(_user_version_key(user_id))
+
+
+def invalidate_all_permissions():
+    """
+    Drop every cached permission set (role definitions changed).
+    """
+    _invalidate(GLOBAL_VERSION_KEY)
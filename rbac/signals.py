@@ -0,0 +1,31 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from .models import Role, Membership
+from .services import invalidate_user_permissions, invalidate_all_permissions
+
+User = get_user_model()
+
+
+@receiver([post_save, post_delete], sender=Membership)
+def membership_changed(sender, instance, **kwargs):
+    invalidate_user_permissions(instance.user_id)
+
+
+@receiver(m2m_changed, sender=Role.permissions.through)
+def role_permissions_changed(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate_all_permissions()
+
+
+@receiver(post_delete, sender=Role)
+def role_deleted(sender, instance, **kwargs):
+    invalidate_all_permissions()
+
+
+@receiver(post_save, sender=User)
+def user_created(sender, instance, created, **kwargs):
+    # A new user may reuse the primary key of a deleted (or rolled back) one
+    if created:
+        invalidate_user_permissions(instance.pk)
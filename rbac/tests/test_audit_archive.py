@@ -0,0 +1,116 @@
+import gzip
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+from django.core.management import call_command
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+
+from tasks.models import Task
+from rbac import archive
+from rbac.models import AuditEntry
+
+User = get_user_model()
+
+
+class AuditArchiveTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username = 'owner',
+            password = 'pass1234'
+        )
+        self.tasks = [
+            Task.objects.create(
+                title = f'Task {i}',
+                description = 'Task description',
+                owner = self.user
+            )
+            for i in range(3)
+        ]
+        now = timezone.now()
+        self.old = []
+        for i in range(12):
+            self.old.append(AuditEntry.objects.create_entry(
+                actor = self.user,
+                action = AuditEntry.ACTION_EDIT,
+                target = self.tasks[i % 3],
+                payload = {'step': i},
+                timestamp = now - timedelta(days=200 - i),
+            ))
+        self.recent = AuditEntry.objects.create_entry(
+            actor = self.user,
+            action = AuditEntry.ACTION_EDIT,
+            target = self.tasks[0],
+            timestamp = now,
+        )
+
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.dir = Path(tmpdir.name)
+
+    def _archive(self, *args):
+        out = StringIO()
+        call_command('archive_audit', '--days', '90', '--dir', str(self.dir), *args, stdout=out)
+        return out.getvalue()
+
+    def test_moves_old_entries_into_segments(self):
+        output = self._archive('--segment-size', '5', '--block-size', '2')
+
+        self.assertEqual(list(AuditEntry.objects.values_list('pk', flat=True)), [self.recent.pk])
+        self.assertEqual(len(list(self.dir.glob('*.ndjson.gz'))), 3)
+        self.assertEqual(len(list(self.dir.glob('*.idx'))), 3)
+        self.assertIn('Archived 12 audit entries', output)
+
+        # Segments are plain gzip streams holding every archived entry once
+        ids = []
+        for segment in sorted(self.dir.glob('*.ndjson.gz')):
+            with gzip.open(segment, 'rt') as fh:
+                ids += [json.loads(line)['id'] for line in fh]
+        self.assertEqual(ids, [entry.pk for entry in self.old])
+
+    def test_history_of_object_reads_only_matching_blocks(self):
+        self._archive('--segment-size', '5', '--block-size', '2')
+        store = archive.AuditArchive(self.dir)
+
+        with mock.patch('rbac.archive.gzip.decompress', wraps=gzip.decompress) as decompress:
+            history = store.history(self.tasks[1])
+
+        expected = [entry.pk for entry in self.old if entry.target_object_id == self.tasks[1].pk]
+        self.assertEqual([entry['id'] for entry in history], expected)
+        self.assertEqual(history[0]['payload'], {'step': 1})
+        # 4 entries for the task across 6 blocks of 2 lines, each in its own block
+        self.assertEqual(decompress.call_count, 4)
+
+    def test_history_for_unknown_object_is_empty(self):
+        self._archive()
+        content_type = ContentType.objects.get_for_model(Task)
+
+        self.assertEqual(
+            archive.AuditArchive(self.dir).history(content_type_id=content_type.pk, object_id=999999),
+            [],
+        )
+
+    def test_duplicates_from_an_interrupted_run_are_dropped(self):
+        with mock.patch('rbac.archive._delete_archived'):
+            archive.archive_entries(self.dir, timezone.now() - timedelta(days=90), segment_size=100)
+        expected = [entry.pk for entry in self.old if entry.target_object_id == self.tasks[0].pk]
+        # The crash happened after deleting the first archived row
+        self.old[0].delete()
+        self._archive()
+        self.assertEqual(len(list(self.dir.glob('*.ndjson.gz'))), 2)
+
+        history = archive.AuditArchive(self.dir).history(self.tasks[0])
+        self.assertEqual([entry['id'] for entry in history], expected)
+
+    def test_dry_run_keeps_entries(self):
+        output = self._archive('--dry-run')
+
+        self.assertEqual(AuditEntry.objects.count(), 13)
+        self.assertIn('Would archive 12 audit entries', output)
+        self.assertEqual(list(self.dir.iterdir()), [])
@@ -0,0 +1,112 @@
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+
+from tasks.models import Task
+from comments.models import Comment
+from rbac import audit
+from rbac.models import AuditEntry
+
+User = get_user_model()
+
+
+class AuditBufferTests(TestCase):
+    def setUp(self):
+        audit.metrics.reset()
+        self.user = User.objects.create_user(
+            username = 'owner',
+            password = 'pass1234'
+        )
+        self.task = Task.objects.create(
+            title = 'Test Task',
+            description = 'Task description',
+            owner = self.user
+        )
+        self.comments = [
+            Comment.objects.create(
+                task = self.task,
+                author = self.user,
+                content = f'Comment {i}'
+            )
+            for i in range(5)
+        ]
+
+    def _record(self, target):
+        return audit.record(
+            actor = self.user,
+            action = AuditEntry.ACTION_DELETE,
+            target = target,
+        )
+
+    def test_entries_are_written_with_one_insert_on_commit(self):
+        ContentType.objects.get_for_model(Comment)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            with self.assertNumQueries(0):
+                for comment in self.comments:
+                    self._record(comment)
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(AuditEntry.objects.count(), 0)
+
+        with self.assertNumQueries(1):
+            callbacks[0]()
+
+        self.assertEqual(AuditEntry.objects.count(), 5)
+        self.assertEqual(audit.metrics.snapshot()['flushes'], 1)
+        self.assertEqual(audit.metrics.snapshot()['entries_written'], 5)
+
+    def test_soft_deletes_in_one_transaction_share_a_flush(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                for comment in self.comments:
+                    comment.soft_delete(by_user=self.user)
+
+        self.assertEqual(AuditEntry.objects.count(), 5)
+        self.assertEqual(audit.metrics.snapshot()['flushes'], 1)
+
+    def test_rolled_back_savepoint_discards_its_entries(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self._record(self.comments[0])
+            try:
+                with transaction.atomic():
+                    self._record(self.comments[1])
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+
+        self.assertEqual(
+            list(AuditEntry.objects.values_list('target_object_id', flat=True)),
+            [self.comments[0].pk],
+        )
+
+    @override_settings(AUDIT_BUFFER_MODE='sync')
+    def test_sync_mode_writes_immediately(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self._record(self.comments[0])
+
+        self.assertEqual(callbacks, [])
+        self.assertEqual(AuditEntry.objects.count(), 1)
+
+    def test_failed_flush_is_counted_and_does_not_raise(self):
+        entry = AuditEntry.objects.build_entry(
+            actor = self.user,
+            action = AuditEntry.ACTION_DELETE,
+            target = self.comments[0],
+        )
+        entry.target_object_id = None  # violates NOT NULL
+
+        with self.assertLogs('rbac.audit', level='ERROR'):
+            with self.captureOnCommitCallbacks(execute=True):
+                with transaction.atomic():
+                    audit.record_entries([entry])
+
+        snapshot = audit.metrics.snapshot()
+        self.assertEqual(snapshot['failed_flushes'], 1)
+        self.assertEqual(snapshot['entries_lost'], 1)
+
+    def test_timestamp_default_is_evaluated_per_entry(self):
+        field = AuditEntry._meta.get_field('timestamp')
+        self.assertIs(field.default, timezone.now)
@@ -0,0 +1,86 @@
+import csv
+import gzip
+import json
+import os
+import tempfile
+from io import StringIO
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.contrib.auth import get_user_model
+
+from tasks.models import Task
+from rbac.models import AuditEntry
+
+User = get_user_model()
+
+
+class AuditExportTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username = 'owner',
+            password = 'pass1234'
+        )
+        self.task = Task.objects.create(
+            title = 'Test Task',
+            description = 'Task description',
+            owner = self.user
+        )
+        self.now = timezone.now()
+        self.entries = [
+            AuditEntry.objects.create_entry(
+                actor = self.user if i % 2 else None,
+                action = AuditEntry.ACTION_EDIT,
+                target = self.task,
+                payload = {'step': i},
+                timestamp = self.now - timedelta(days=5 - i),
+            )
+            for i in range(5)
+        ]
+
+    def _export(self, *args):
+        out, err = StringIO(), StringIO()
+        call_command('export_audit', *args, stdout=out, stderr=err)
+        return out.getvalue(), err.getvalue()
+
+    def test_ndjson_to_stdout_in_timestamp_order(self):
+        output, stats = self._export('--chunk-size', '2')
+
+        rows = [json.loads(line) for line in output.splitlines()]
+        self.assertEqual([row['id'] for row in rows], [entry.pk for entry in self.entries])
+        self.assertEqual(rows[1]['actor'], 'owner')
+        self.assertIsNone(rows[0]['actor'])
+        self.assertEqual(rows[0]['target_type'], 'tasks.task')
+        self.assertEqual(rows[0]['target_id'], self.task.pk)
+        self.assertEqual(rows[3]['payload'], {'step': 3})
+        self.assertIn('Exported 5 audit entries', stats)
+        self.assertIn('rows/s', stats)
+
+    def test_csv_with_time_range(self):
+        output, _ = self._export(
+            '--format', 'csv',
+            '--since', (self.now - timedelta(days=3, hours=1)).isoformat(),
+            '--until', (self.now - timedelta(days=1, hours=12)).isoformat(),
+        )
+
+        rows = list(csv.DictReader(StringIO(output)))
+        self.assertEqual([int(row['id']) for row in rows], [entry.pk for entry in self.entries[2:4]])
+        self.assertEqual(json.loads(rows[0]['payload']), {'step': 2})
+
+    def test_gzip_file_output(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'audit.ndjson.gz')
+            output, _ = self._export('--output', path)
+
+            with gzip.open(path, 'rt', encoding='utf-8') as fh:
+                rows = [json.loads(line) for line in fh]
+
+        self.assertEqual(output, '')
+        self.assertEqual(len(rows), 5)
+
+    def test_invalid_timestamp(self):
+        with self.assertRaises(CommandError):
+            self._export('--since', 'yesterday')
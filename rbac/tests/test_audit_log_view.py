@@ -0,0 +1,135 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+
+from tasks.models import Task
+from comments.models import Comment
+from rbac.models import AuditEntry, Role, Membership
+
+User = get_user_model()
+
+
+@override_settings(AUDIT_PAGE_SIZE=4)
+class AuditLogViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.auditor = User.objects.create_user(
+            username = 'auditor',
+            password = 'pass1234'
+        )
+        self.other = User.objects.create_user(
+            username = 'other',
+            password = 'pass1234'
+        )
+        role = Role.objects.create(
+            name = 'Auditor',
+            slug = 'auditor'
+        )
+        role.permissions.add(Permission.objects.get(codename='view_auditentry'))
+        Membership.objects.create(user=self.auditor, role=role)
+
+        self.task = Task.objects.create(
+            title = 'Test Task',
+            description = 'Task description',
+            owner = self.other
+        )
+        self.now = timezone.now()
+        self.entries = []
+        for i in range(10):
+            comment = Comment.objects.create(
+                task = self.task,
+                author = self.other,
+                content = f'Comment {i}'
+            )
+            target = self.task if i % 2 else comment
+            self.entries.append(AuditEntry.objects.create_entry(
+                actor = self.auditor if i < 3 else self.other,
+                action = AuditEntry.ACTION_EDIT if i % 3 else AuditEntry.ACTION_DELETE,
+                target = target,
+                timestamp = self.now - timedelta(hours=10 - i),
+            ))
+
+        self.url = reverse('audit:audit-log')
+        self.json_url = reverse('audit:audit-log-json')
+        self.client.login(
+            username = 'auditor',
+            password = 'pass1234'
+        )
+
+    def _walk(self, params=None):
+        params = dict(params or {})
+        ids = []
+        while True:
+            response = self.client.get(self.json_url, params)
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            ids += [result['id'] for result in data['results']]
+            if not data['next_cursor']:
+                return ids
+            params['cursor'] = data['next_cursor']
+
+    def test_requires_permission(self):
+        self.client.login(
+            username = 'other',
+            password = 'pass1234'
+        )
+
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+        self.assertEqual(self.client.get(self.json_url).status_code, 404)
+
+    def test_pages_walk_every_entry_newest_first(self):
+        self.assertEqual(self._walk(), [entry.pk for entry in reversed(self.entries)])
+
+    def test_html_view_renders_targets(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Test Task')
+        self.assertContains(response, 'class="next-page"')
+
+    def test_filters(self):
+        expected = [
+            entry.pk for entry in reversed(self.entries)
+            if entry.actor == self.other and entry.action == AuditEntry.ACTION_EDIT
+            and entry.target_content_type.model == 'task'
+            and entry.timestamp >= self.now - timedelta(hours=6)
+        ]
+
+        ids = self._walk({
+            'actor': 'other',
+            'action': AuditEntry.ACTION_EDIT,
+            'target_type': 'tasks.task',
+            'since': (self.now - timedelta(hours=6)).isoformat(),
+        })
+
+        self.assertEqual(ids, expected)
+        self.assertTrue(ids)
+
+    def test_deleted_target_is_reported_as_none(self):
+        Comment.all_objects.filter(pk=self.entries[-2].target_object_id).delete()
+
+        results = self.client.get(self.json_url).json()['results']
+
+        self.assertEqual(results[1]['target_type'], 'comments.comment')
+        self.assertIsNone(results[1]['target'])
+
+    def test_query_count_does_not_grow_with_page_size(self):
+        def count(page_size):
+            with override_settings(AUDIT_PAGE_SIZE=page_size):
+                self.client.get(self.json_url)  # warm session, permission and content type caches
+                with CaptureQueriesContext(connection) as ctx:
+                    response = self.client.get(self.json_url)
+            self.assertEqual(len(response.json()['results']), page_size)
+            return len(ctx.captured_queries)
+
+        self.assertEqual(count(2), count(10))
+
+    def test_invalid_cursor_is_404(self):
+        self.assertEqual(self.client.get(self.json_url, {'cursor': 'nope'}).status_code, 404)
@@ -0,0 +1,91 @@
+import unittest
+from io import StringIO
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+from django.core.management import call_command
+from django.contrib.auth import get_user_model
+
+from tasks.models import Task
+from rbac import partitioning
+from rbac.models import AuditEntry
+
+User = get_user_model()
+
+
+class PartitionNamingTests(unittest.TestCase):
+    def test_month_arithmetic(self):
+        start = partitioning.month_start(datetime(2026, 11, 17, 8, 30, tzinfo=dt_timezone.utc))
+
+        self.assertEqual(start, datetime(2026, 11, 1, tzinfo=dt_timezone.utc))
+        self.assertEqual(partitioning.add_months(start, 2), datetime(2027, 1, 1, tzinfo=dt_timezone.utc))
+        self.assertEqual(partitioning.add_months(start, -11), datetime(2025, 12, 1, tzinfo=dt_timezone.utc))
+        self.assertEqual(partitioning.partition_name(start), 'rbac_auditentry_p202611')
+
+
+class AuditRetentionTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username = 'owner',
+            password = 'pass1234'
+        )
+        self.task = Task.objects.create(
+            title = 'Test Task',
+            description = 'Task description',
+            owner = self.user
+        )
+        now = timezone.now()
+        for days in (400, 380, 370, 10, 0):
+            AuditEntry.objects.create_entry(
+                actor = self.user,
+                action = AuditEntry.ACTION_EDIT,
+                target = self.task,
+                timestamp = now - timedelta(days=days),
+            )
+
+    def _rotate(self, *args):
+        out = StringIO()
+        call_command('rotate_audit_partitions', '--days', '365', *args, stdout=out)
+        return out.getvalue()
+
+    def test_between_and_older_than(self):
+        now = timezone.now()
+
+        self.assertEqual(AuditEntry.objects.older_than(now - timedelta(days=365)).count(), 3)
+        self.assertEqual(AuditEntry.objects.between(now - timedelta(days=390), now - timedelta(days=5)).count(), 3)
+        self.assertEqual(AuditEntry.objects.between(end=now - timedelta(days=375)).count(), 2)
+
+    def test_expired_entries_are_deleted_in_batches(self):
+        output = self._rotate('--batch-size', '2')
+
+        self.assertEqual(AuditEntry.objects.count(), 2)
+        self.assertIn('Deleted 2 audit entries...', output)
+        self.assertIn('Deleted 3 audit entries older than', output)
+
+    def test_dry_run_deletes_nothing(self):
+        output = self._rotate('--dry-run')
+
+        self.assertEqual(AuditEntry.objects.count(), 5)
+        self.assertIn('Would delete 3 audit entries', output)
+
+
+@unittest.skipUnless(connection.vendor == 'postgresql', 'Partitioning requires PostgreSQL')
+class PostgresPartitionTests(TestCase):
+    def test_table_is_partitioned_with_upcoming_months(self):
+        self.assertTrue(partitioning.is_partitioned(connection))
+
+        partitioning.ensure_partitions(connection, months_ahead=2)
+        names = [name for name, _, _ in partitioning.list_partitions(connection)]
+        current = partitioning.month_start(timezone.now())
+        for offset in range(3):
+            self.assertIn(partitioning.partition_name(partitioning.add_months(current, offset)), names)
+
+    def test_expired_months_are_dropped(self):
+        old_month = partitioning.add_months(partitioning.month_start(timezone.now()), -24)
+        partitioning.ensure_partitions(connection, months_ahead=0, now=old_month)
+
+        dropped = partitioning.drop_expired_partitions(connection, partitioning.add_months(old_month, 1))
+
+        self.assertEqual(dropped, [partitioning.partition_name(old_month)])
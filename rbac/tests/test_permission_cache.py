@@ -0,0 +1,96 @@
+from django.test import TestCase
+from django.core.cache import cache
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.auth import get_user_model
+
+from comments.models import Comment
+from rbac.models import Role, Membership
+from rbac.services import get_user_permissions, user_has_perm
+
+User = get_user_model()
+
+
+class PermissionCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username = 'moderator',
+            password = 'x'
+        )
+        ct = ContentType.objects.get_for_model(Comment)
+        self.delete_perm = Permission.objects.get(content_type=ct, codename='delete_comment')
+        self.change_perm = Permission.objects.get(content_type=ct, codename='change_comment')
+
+        self.role = Role.objects.create(
+            name = 'Moderator',
+            slug = 'moderator'
+        )
+        self.role.permissions.add(self.delete_perm)
+        Membership.objects.create(user=self.user, role=self.role)
+
+    def _fresh_user(self):
+        # A new instance, as request.user would be on the next request
+        return User.objects.get(pk=self.user.pk)
+
+    def test_repeated_checks_in_one_request_cost_no_queries(self):
+        user = self._fresh_user()
+        self.assertTrue(user_has_perm(user, 'comments.delete_comment'))
+
+        with self.assertNumQueries(0):
+            user_has_perm(user, 'comments.delete_comment')
+            user_has_perm(user, 'comments.change_comment')
+
+    def test_permissions_are_shared_across_requests(self):
+        get_user_permissions(self._fresh_user())
+
+        user = self._fresh_user()
+        with self.assertNumQueries(0):
+            self.assertTrue(user_has_perm(user, 'comments.delete_comment'))
+
+    def test_new_membership_invalidates_cache(self):
+        user = self._fresh_user()
+        self.assertFalse(user_has_perm(user, 'comments.change_comment'))
+
+        editor = Role.objects.create(
+            name = 'Editor',
+            slug = 'editor'
+        )
+        editor.permissions.add(self.change_perm)
+        Membership.objects.create(user=self.user, role=editor)
+
+        self.assertTrue(user_has_perm(user, 'comments.change_comment'))
+        self.assertTrue(user_has_perm(self._fresh_user(), 'comments.change_comment'))
+
+    def test_removed_membership_invalidates_cache(self):
+        user = self._fresh_user()
+        self.assertTrue(user_has_perm(user, 'comments.delete_comment'))
+
+        Membership.objects.filter(user=self.user).get().delete()
+
+        self.assertFalse(user_has_perm(user, 'comments.delete_comment'))
+        self.assertFalse(user_has_perm(self._fresh_user(), 'comments.delete_comment'))
+
+    def test_role_permission_change_invalidates_cache(self):
+        user = self._fresh_user()
+        self.assertFalse(user_has_perm(user, 'comments.change_comment'))
+
+        self.role.permissions.add(self.change_perm)
+        self.assertTrue(user_has_perm(user, 'comments.change_comment'))
+
+        self.role.permissions.remove(self.delete_perm)
+        self.assertFalse(user_has_perm(user, 'comments.delete_comment'))
+
+        self.role.permissions.set([self.delete_perm])
+        self.assertTrue(user_has_perm(user, 'comments.delete_comment'))
+        self.assertFalse(user_has_perm(user, 'comments.change_comment'))
+
+        self.role.permissions.clear()
+        self.assertFalse(user_has_perm(self._fresh_user(), 'comments.delete_comment'))
+
+    def test_role_deletion_invalidates_cache(self):
+        self.assertTrue(user_has_perm(self._fresh_user(), 'comments.delete_comment'))
+
+        self.role.delete()
+
+        self.assertFalse(user_has_perm(self._fresh_user(), 'comments.delete_comment'))
@@ -0,0 +1,70 @@
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from django.contrib.auth.models import Permission
+from django.contrib.auth import get_user_model
+
+from rbac.models import Role, Membership
+from rbac.services import get_user_permissions
+
+User = get_user_model()
+
+
+class PermissionResolutionQueryCountTests(TestCase):
+    """
+    Benchmark: resolving a user's permissions costs the same number of
+    queries whether the user holds one role or many.
+    """
+    def setUp(self):
+        self.permissions = list(Permission.objects.order_by('pk')[:40])
+
+    def _user_with_roles(self, username, role_count):
+        user = User.objects.create_user(
+            username = username,
+            password = 'x'
+        )
+
+        for i in range(role_count):
+            role = Role.objects.create(
+                name = f'{username}-role-{i}',
+                slug = f'{username}-role-{i}'
+            )
+            role.permissions.add(*self.permissions[i * 2:i * 2 + 2])
+            Membership.objects.create(user=user, role=role)
+
+        return user
+
+    def test_query_count_is_constant_as_roles_grow(self):
+        counts = {}
+
+        for role_count in (1, 5, 20):
+            user = self._user_with_roles(f'user{role_count}', role_count)
+
+            with CaptureQueriesContext(connection) as ctx:
+                perms = get_user_permissions(user)
+
+            counts[role_count] = len(ctx.captured_queries)
+            self.assertEqual(len(perms), role_count * 2)
+
+        self.assertEqual(counts, {1: 1, 5: 1, 20: 1})
+
+    def test_shared_permission_across_roles_is_reported_once(self):
+        user = self._user_with_roles('overlap', 2)
+        shared = self.permissions[0]
+        for membership in user.memberships.all():
+            membership.role.permissions.add(shared)
+
+        perms = get_user_permissions(user)
+
+        label = f'{shared.content_type.app_label}.{shared.codename}'
+        self.assertIn(label, perms)
+        self.assertEqual(len(perms), 4)
+
+    def test_user_without_roles_has_no_permissions(self):
+        user = User.objects.create_user(
+            username = 'norole',
+            password = 'x'
+        )
+
+        with self.assertNumQueries(1):
+            self.assertEqual(get_user_permissions(user), set())
@@ -0,0 +1,9 @@
+from django.urls import path
+from .views import AuditLogView, AuditLogJSONView
+
+app_name = 'audit'
+
+urlpatterns = [
+    path('', AuditLogView.as_view(), name='audit-log'),
+    path('entries.json', AuditLogJSONView.as_view(), name='audit-log-json'),
+]
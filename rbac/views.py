@@ -1,3 +1,90 @@
-from django.shortcuts import render
+from django.views.generic import TemplateView, View
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import Http404, JsonResponse
+from django.conf import settings
+from django.contrib.contenttypes.prefetch import GenericPrefetch
 
-# Create your views here.
+from tasks.models import Task
+from comments.models import Comment
+from taskflow.pagination import KeysetPaginator, InvalidCursor
+from .forms import AuditFilterForm
+from .models import AuditEntry
+from .services import user_has_perm
+
+
+def audit_log_page(params):
+    """
+    One keyset page of audit entries, newest first, filtered by 'params'.
+
+    Targets are prefetched through the GenericForeignKey with one query per
+    content type on the page (including soft-deleted comments, with the
+    author their __str__ needs), so the cost of a page does not grow with
+    the number of entries it holds.
+    """
+    filter_form = AuditFilterForm(params)
+    queryset = filter_form.filter_queryset(
+        AuditEntry.objects
+        .select_related('actor', 'target_content_type')
+        .prefetch_related(GenericPrefetch('target', [
+            Task.objects.all(),
+            Comment.all_objects.select_related('author'),
+        ]))
+    )
+    paginator = KeysetPaginator(('-timestamp', '-id'), per_page=settings.AUDIT_PAGE_SIZE)
+
+    try:
+        page = paginator.paginate(queryset, params.get('cursor'))
+    except InvalidCursor:
+        raise Http404
+
+    return filter_form, page
+
+
+def serialize_entry(entry):
+    content_type = entry.target_content_type
+    return {
+        'id': entry.pk,
+        'timestamp': entry.timestamp.isoformat(),
+        'actor': entry.actor.username if entry.actor else None,
+        'action': entry.action,
+        'target_type': f'{content_type.app_label}.{content_type.model}',
+        'target_id': entry.target_object_id,
+        # None once the target has been deleted
+        'target': str(entry.target) if entry.target is not None else None,
+        'payload': entry.payload,
+    }
+
+
+class AuditLogAccessMixin(LoginRequiredMixin):
+    """
+    Restrict to users granted rbac.view_auditentry; everyone else gets a 404
+    so the log's existence isn't revealed.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.user.is_authenticated and not user_has_perm(request.user, 'rbac.view_auditentry'):
+            raise Http404
+        return super().dispatch(request, *args, **kwargs)
+
+
+class AuditLogView(AuditLogAccessMixin, TemplateView):
+    template_name = 'rbac/audit_log.html'
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        filter_form, page = audit_log_page(self.request.GET)
+        context.update({
+            'filter_form': filter_form,
+            'entries': page,
+            'next_cursor': page.next_cursor,
+        })
+        return context
+
+
+class AuditLogJSONView(AuditLogAccessMixin, View):
+    def get(self, request, *args, **kwargs):
+        _, page = audit_log_page(request.GET)
+        return JsonResponse({
+            'results': [serialize_entry(entry) for entry in page],
+            'next_cursor': page.next_cursor,
+        })
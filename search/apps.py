@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+class SearchConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'search'
+
+    def ready(self):
+        from .schema import ensure_search_schema
+
+        # Not limited to sender=self: post_migrate skips apps without models
+        post_migrate.connect(ensure_search_schema, dispatch_uid='search.ensure_search_schema')
@@ -0,0 +1,186 @@
+import base64
+import json
+import re
+from collections import namedtuple
+
+from django.db import connection
+from django.db.models import Q
+
+from taskflow.pagination import InvalidCursor, KeysetPage
+from tasks.models import Task
+from comments.models import Comment
+
+
+SearchHit = namedtuple('SearchHit', ['kind', 'object_id', 'task_id', 'rank'])
+
+KIND_TASK = 'task'
+KIND_COMMENT = 'comment'
+
+# Hits are ordered by (rank DESC, kind DESC, object_id DESC): tasks before
+# comments of equal rank, newest first. A page continues from the last
+# hit's position in that order instead of an OFFSET, as KeysetPaginator
+# does for querysets; 'after' is (rank, kind, object_id) or None.
+KEYSET_SQL = """
+    WHERE rank < %s
+       OR (rank = %s AND kind < %s)
+       OR (rank = %s AND kind = %s AND object_id < %s)
+"""
+
+
+def _keyset(after):
+    if after is None:
+        return '', []
+    rank, kind, object_id = after
+    return KEYSET_SQL, [rank, rank, kind, rank, kind, object_id]
+
+
+def encode_cursor(hit):
+    raw = json.dumps([hit.rank, hit.kind, hit.object_id], separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        rank, kind, object_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception as exc:
+        raise InvalidCursor(cursor) from exc
+    if (
+        not isinstance(rank, (int, float)) or isinstance(rank, bool)
+        or kind not in (KIND_TASK, KIND_COMMENT)
+        or not isinstance(object_id, int) or isinstance(object_id, bool)
+    ):
+        raise InvalidCursor(cursor)
+    return float(rank), kind, object_id
+
+
+class PostgresSearchBackend:
+    """
+    Ranked search over the trigger-maintained tsvector columns (see
+    search.schema).
+    """
+    sql = """
+        WITH q AS (SELECT websearch_to_tsquery('english', %s) AS query)
+        SELECT kind, object_id, task_id, rank FROM (
+            SELECT 'task' AS kind, t.id AS object_id, t.id AS task_id,
+                   ts_rank_cd(t.search_vector, q.query)::float8 AS rank
+            FROM tasks_task t, q
+            WHERE t.search_vector @@ q.query
+            UNION ALL
+            SELECT 'comment', c.id, c.task_id, ts_rank_cd(c.search_vector, q.query)::float8
+            FROM comments_comment c, q
+            WHERE c.search_vector @@ q.query AND NOT c.is_deleted
+        ) hits
+        {keyset}
+        ORDER BY rank DESC, kind DESC, object_id DESC
+        LIMIT %s
+    """
+
+    def search(self, query, limit, after=None):
+        keyset, params = _keyset(after)
+        with connection.cursor() as cursor:
+            cursor.execute(self.sql.format(keyset=keyset), [query, *params, limit])
+            return [SearchHit(*row) for row in cursor.fetchall()]
+
+
+class SQLiteSearchBackend:
+    """
+    Ranked search over the FTS5 tables (see search.schema). bm25() scores are
+    negated so that, as on PostgreSQL, a higher rank is a better match.
+    """
+    sql = """
+        SELECT kind, object_id, task_id, rank FROM (
+            SELECT 'task' AS kind, rowid AS object_id, rowid AS task_id,
+                   -bm25(search_task_fts, 10.0, 4.0) AS rank
+            FROM search_task_fts
+            WHERE search_task_fts MATCH %s
+            UNION ALL
+            SELECT 'comment', f.rowid, c.task_id, -bm25(search_comment_fts, 2.0)
+            FROM search_comment_fts f
+            JOIN comments_comment c ON c.id = f.rowid
+            WHERE search_comment_fts MATCH %s
+        )
+        {keyset}
+        ORDER BY rank DESC, kind DESC, object_id DESC
+        LIMIT %s
+    """
+
+    def _match_expression(self, query):
+        # Quote every term so user input can't inject FTS5 query syntax
+        terms = re.findall(r'\w+', query)
+        return ' '.join('"%s"' % term for term in terms)
+
+    def search(self, query, limit, after=None):
+        expression = self._match_expression(query)
+        if not expression:
+            return []
+
+        keyset, params = _keyset(after)
+        with connection.cursor() as cursor:
+            cursor.execute(self.sql.format(keyset=keyset), [expression, expression, *params, limit])
+            return [SearchHit(*row) for row in cursor.fetchall()]
+
+
+class BasicSearchBackend:
+    """
+    Unranked substring fallback for databases without a full-text index.
+    Every hit ranks 0, so the order is tasks then comments, newest first.
+    """
+
+    def search(self, query, limit, after=None):
+        terms = re.findall(r'\w+', query)
+        if not terms:
+            return []
+
+        task_q, comment_q = Q(), Q()
+        for term in terms:
+            task_q &= Q(title__icontains=term) | Q(description__icontains=term)
+            comment_q &= Q(content__icontains=term)
+
+        tasks = Task.objects.filter(task_q)
+        comments = Comment.objects.filter(comment_q)
+        if after is not None:
+            _, kind, object_id = after
+            if kind == KIND_TASK:
+                tasks = tasks.filter(pk__lt=object_id)
+            else:
+                tasks = tasks.none()
+                comments = comments.filter(pk__lt=object_id)
+
+        hits = [
+            SearchHit(KIND_TASK, pk, pk, 0.0)
+            for pk in tasks.order_by('-pk').values_list('pk', flat=True)[:limit]
+        ]
+        if len(hits) < limit:
+            hits += [
+                SearchHit(KIND_COMMENT, pk, task_id, 0.0)
+                for pk, task_id in comments.order_by('-pk').values_list('pk', 'task_id')[:limit - len(hits)]
+            ]
+        return hits
+
+
+def get_backend():
+    if connection.vendor == 'postgresql':
+        return PostgresSearchBackend()
+    if connection.vendor == 'sqlite':
+        return SQLiteSearchBackend()
+    return BasicSearchBackend()
+
+
+def search(query, per_page, cursor=None):
+    """
+    Return a KeysetPage of ranked SearchHits for tasks and active comments
+    matching 'query', continuing after 'cursor' (the first page if empty).
+    Raises InvalidCursor for a malformed cursor.
+    """
+    after = decode_cursor(cursor) if cursor else None
+    query = query.strip()
+    if not query:
+        return KeysetPage([], None)
+
+    # One extra hit tells whether another page exists
+    hits = get_backend().search(query, per_page + 1, after)
+    if len(hits) > per_page:
+        hits = hits[:per_page]
+        return KeysetPage(hits, encode_cursor(hits[-1]))
+    return KeysetPage(hits, None)
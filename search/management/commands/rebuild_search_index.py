@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from search.schema import rebuild
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index from tasks and active comments'
+
+    def handle(self, *args, **options):
+        if connection.vendor == 'postgresql':
+            # Batched, each batch committing on its own
+            rebuild(connection)
+        elif connection.vendor == 'sqlite':
+            with transaction.atomic():
+                rebuild(connection)
+        else:
+            self.stdout.write('No full-text index on this database; nothing to rebuild.')
+            return
+        self.stdout.write(self.style.SUCCESS('Search index rebuilt'))
@@ -0,0 +1,25 @@
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    from search.schema import install
+
+    install(schema_editor.connection)
+
+
+def drop_search_index(apps, schema_editor):
+    from search.schema import uninstall
+
+    uninstall(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0002_task_list_indexes'),
+        ('comments', '0004_comment_task_created_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,35 @@
+from django.db import migrations
+
+
+def backfill_search_vectors(apps, schema_editor):
+    from search.schema import backfill
+
+    backfill(schema_editor.connection)
+
+
+def create_search_indexes(apps, schema_editor):
+    from search.schema import create_indexes
+
+    create_indexes(schema_editor.connection)
+
+
+def drop_search_indexes(apps, schema_editor):
+    from search.schema import drop_indexes
+
+    drop_indexes(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    # Backfill batches commit one by one; CREATE INDEX CONCURRENTLY can't
+    # run in a transaction
+    atomic = False
+
+    dependencies = [
+        ('search', '0001_search_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_search_vectors, migrations.RunPython.noop),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,256 @@
+"""
+Full-text search storage, maintained by the database itself.
+
+PostgreSQL: nullable tsvector columns on tasks_task and comments_comment,
+set by BEFORE INSERT/UPDATE triggers, each with a GIN index (the comment
+index only covers active rows). The columns are unknown to the models and
+kept current on every write, including QuerySet.update() and bulk_create().
+Installing is split so no step holds a long lock on a large table: adding
+a nullable column and the triggers is instant, existing rows are then
+backfilled in short batches, and the indexes are built CONCURRENTLY (the
+last two from an atomic = False migration).
+
+SQLite: external-content FTS5 tables keyed by the source row id and kept
+in sync by triggers. SQLite drops triggers when Django rebuilds a table
+during a migration, so they are re-created after every migrate.
+"""
+from django.db import connections
+
+
+# table -> (trigger name, columns it reads, tsvector expression over 'row.')
+POSTGRES_VECTORS = {
+    'tasks_task': (
+        'search_task_vector', 'title, description',
+        "setweight(to_tsvector('english', coalesce({row}title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce({row}description, '')), 'B')",
+    ),
+    'comments_comment': (
+        'search_comment_vector', 'content',
+        "setweight(to_tsvector('english', coalesce({row}content, '')), 'C')",
+    ),
+}
+
+
+def _postgres_install():
+    statements = []
+    for table, (name, columns, expression) in POSTGRES_VECTORS.items():
+        statements += [
+            f'ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector',
+            f"""
+            CREATE OR REPLACE FUNCTION {name}() RETURNS trigger AS $$
+            BEGIN
+                NEW.search_vector := {expression.format(row='NEW.')};
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+            """,
+            f'DROP TRIGGER IF EXISTS {name} ON {table}',
+            f"""
+            CREATE TRIGGER {name} BEFORE INSERT OR UPDATE OF {columns} ON {table}
+            FOR EACH ROW EXECUTE FUNCTION {name}()
+            """,
+        ]
+    return statements
+
+
+POSTGRES_INSTALL = _postgres_install()
+
+# CONCURRENTLY can't run inside a transaction. A build that fails leaves an
+# INVALID index behind, which IF NOT EXISTS would keep: drop it and rerun.
+POSTGRES_INDEXES = [
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS task_search_idx ON tasks_task USING GIN (search_vector)',
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS comment_search_idx ON comments_comment
+    USING GIN (search_vector) WHERE NOT is_deleted
+    """,
+]
+
+POSTGRES_DROP_INDEXES = [
+    'DROP INDEX CONCURRENTLY IF EXISTS comment_search_idx',
+    'DROP INDEX CONCURRENTLY IF EXISTS task_search_idx',
+]
+
+POSTGRES_UNINSTALL = [
+    statement
+    for table, (name, _, _) in POSTGRES_VECTORS.items()
+    for statement in (
+        f'DROP TRIGGER IF EXISTS {name} ON {table}',
+        f'DROP FUNCTION IF EXISTS {name}()',
+        f'ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector',
+    )
+]
+
+POSTGRES_BACKFILL_BATCH_SIZE = 5000
+
+SQLITE_TABLES = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS search_task_fts USING fts5(
+        title, description,
+        content='tasks_task', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS search_comment_fts USING fts5(
+        content,
+        content='comments_comment', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+]
+
+SQLITE_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS search_task_ai AFTER INSERT ON tasks_task BEGIN
+        INSERT INTO search_task_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_task_ad AFTER DELETE ON tasks_task BEGIN
+        INSERT INTO search_task_fts(search_task_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_task_au AFTER UPDATE OF title, description ON tasks_task BEGIN
+        INSERT INTO search_task_fts(search_task_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO search_task_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    # Only active comments are indexed
+    """
+    CREATE TRIGGER IF NOT EXISTS search_comment_ai AFTER INSERT ON comments_comment
+    WHEN NOT new.is_deleted BEGIN
+        INSERT INTO search_comment_fts(rowid, content) VALUES (new.id, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_comment_ad AFTER DELETE ON comments_comment
+    WHEN NOT old.is_deleted BEGIN
+        INSERT INTO search_comment_fts(search_comment_fts, rowid, content)
+        VALUES ('delete', old.id, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_comment_au AFTER UPDATE OF content, is_deleted ON comments_comment BEGIN
+        INSERT INTO search_comment_fts(search_comment_fts, rowid, content)
+        SELECT 'delete', old.id, old.content WHERE NOT old.is_deleted;
+        INSERT INTO search_comment_fts(rowid, content)
+        SELECT new.id, new.content WHERE NOT new.is_deleted;
+    END
+    """,
+]
+
+SQLITE_BACKFILL = [
+    "INSERT INTO search_task_fts(search_task_fts) VALUES ('rebuild')",
+    "INSERT INTO search_comment_fts(search_comment_fts) VALUES ('delete-all')",
+    """
+    INSERT INTO search_comment_fts(rowid, content)
+    SELECT id, content FROM comments_comment WHERE NOT is_deleted
+    """,
+]
+
+SQLITE_UNINSTALL = [
+    'DROP TRIGGER IF EXISTS search_task_ai',
+    'DROP TRIGGER IF EXISTS search_task_ad',
+    'DROP TRIGGER IF EXISTS search_task_au',
+    'DROP TRIGGER IF EXISTS search_comment_ai',
+    'DROP TRIGGER IF EXISTS search_comment_ad',
+    'DROP TRIGGER IF EXISTS search_comment_au',
+    'DROP TABLE IF EXISTS search_task_fts',
+    'DROP TABLE IF EXISTS search_comment_fts',
+]
+
+
+def _execute(connection, statements):
+    with connection.cursor() as cursor:
+        for sql in statements:
+            cursor.execute(sql)
+
+
+def _postgres_backfill(connection, batch_size=POSTGRES_BACKFILL_BATCH_SIZE):
+    """
+    Recompute search_vector for every row, 'batch_size' rows per UPDATE in
+    id order. Outside a transaction each batch commits (and releases its
+    row locks) on its own.
+    """
+    with connection.cursor() as cursor:
+        for table, (_, _, expression) in POSTGRES_VECTORS.items():
+            last_id = 0
+            while True:
+                cursor.execute(
+                    f"""
+                    UPDATE {table} SET search_vector = {expression.format(row='')}
+                    WHERE id IN (SELECT id FROM {table} WHERE id > %s ORDER BY id LIMIT %s)
+                    RETURNING id
+                    """,
+                    [last_id, batch_size],
+                )
+                ids = [row[0] for row in cursor.fetchall()]
+                if not ids:
+                    break
+                last_id = max(ids)
+
+
+def install(connection):
+    """
+    Create the search storage; on PostgreSQL only the columns and
+    triggers (see backfill() and create_indexes()).
+    """
+    if connection.vendor == 'postgresql':
+        _execute(connection, POSTGRES_INSTALL)
+    elif connection.vendor == 'sqlite':
+        _execute(connection, SQLITE_TABLES + SQLITE_TRIGGERS + SQLITE_BACKFILL)
+
+
+def uninstall(connection):
+    if connection.vendor == 'postgresql':
+        _execute(connection, POSTGRES_UNINSTALL)
+    elif connection.vendor == 'sqlite':
+        _execute(connection, SQLITE_UNINSTALL)
+
+
+def backfill(connection):
+    """
+    PostgreSQL: fill search_vector for rows written before the triggers.
+    """
+    if connection.vendor == 'postgresql':
+        _postgres_backfill(connection)
+
+
+def create_indexes(connection):
+    """
+    PostgreSQL: build the GIN indexes without blocking writes. Must run
+    outside a transaction.
+    """
+    if connection.vendor == 'postgresql':
+        _execute(connection, POSTGRES_INDEXES)
+
+
+def drop_indexes(connection):
+    if connection.vendor == 'postgresql':
+        _execute(connection, POSTGRES_DROP_INDEXES)
+
+
+def rebuild(connection):
+    """
+    Re-index every row from the source tables (repair after manual edits).
+    """
+    if connection.vendor == 'postgresql':
+        _execute(connection, POSTGRES_INSTALL)
+        _postgres_backfill(connection)
+    elif connection.vendor == 'sqlite':
+        _execute(connection, SQLITE_TRIGGERS + SQLITE_BACKFILL)
+
+
+def ensure_search_schema(sender, using, **kwargs):
+    """
+    post_migrate hook: restore SQLite triggers dropped by table rebuilds.
+    """
+    connection = connections[using]
+    if connection.vendor != 'sqlite':
+        return
+
+    if 'search_task_fts' in connection.introspection.table_names():
+        _execute(connection, SQLITE_TRIGGERS)
@@ -0,0 +1,160 @@
+from io import StringIO
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.core.management import call_command
+from django.contrib.auth import get_user_model
+
+from tasks.models import Task
+from comments.models import Comment
+from search.backends import search, BasicSearchBackend, KIND_TASK, KIND_COMMENT
+from taskflow.pagination import InvalidCursor
+
+User = get_user_model()
+
+
+class SearchBackendTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username = 'owner',
+            password = 'pass1234'
+        )
+        self.title_task = Task.objects.create(
+            title = 'Migrate billing database',
+            description = 'Move everything over',
+            owner = self.owner
+        )
+        self.description_task = Task.objects.create(
+            title = 'Quarterly report',
+            description = 'Mention the billing numbers',
+            owner = self.owner
+        )
+        self.comment = Comment.objects.create(
+            task = self.description_task,
+            author = self.owner,
+            content = 'Billing export is attached'
+        )
+
+    def _hits(self, query):
+        return [(hit.kind, hit.object_id) for hit in search(query, 20)]
+
+    def test_matches_titles_descriptions_and_comments(self):
+        hits = self._hits('billing')
+
+        self.assertIn((KIND_TASK, self.title_task.pk), hits)
+        self.assertIn((KIND_TASK, self.description_task.pk), hits)
+        self.assertIn((KIND_COMMENT, self.comment.pk), hits)
+
+    def test_title_match_ranks_above_description_match(self):
+        hits = self._hits('billing')
+
+        self.assertLess(
+            hits.index((KIND_TASK, self.title_task.pk)),
+            hits.index((KIND_TASK, self.description_task.pk)),
+        )
+
+    def test_stemmed_terms_match(self):
+        self.assertIn((KIND_TASK, self.title_task.pk), self._hits('migrating'))
+
+    def test_index_follows_updates_and_deletes(self):
+        Task.objects.filter(pk=self.title_task.pk).update(title='Archive invoices')
+        self.assertNotIn((KIND_TASK, self.title_task.pk), self._hits('migrate'))
+        self.assertIn((KIND_TASK, self.title_task.pk), self._hits('invoices'))
+
+        self.title_task.delete()
+        self.assertEqual(self._hits('invoices'), [])
+
+    def test_soft_deleted_comments_are_not_found(self):
+        self.comment.soft_delete(by_user=self.owner)
+
+        self.assertNotIn((KIND_COMMENT, self.comment.pk), self._hits('export'))
+
+    def test_query_syntax_is_treated_as_plain_terms(self):
+        self.assertEqual(self._hits('"'), [])
+        self.assertIn((KIND_TASK, self.title_task.pk), self._hits('billing* ('))
+
+    def test_pages_continue_from_the_cursor(self):
+        expected = self._hits('billing')
+
+        walked, cursor = [], None
+        while True:
+            page = search('billing', 1, cursor)
+            self.assertLessEqual(len(page), 1)
+            walked += [(hit.kind, hit.object_id) for hit in page]
+            cursor = page.next_cursor
+            if not page.has_next:
+                break
+
+        self.assertEqual(len(expected), 3)
+        self.assertEqual(walked, expected)
+
+    def test_basic_backend_pages_tasks_then_comments(self):
+        backend = BasicSearchBackend()
+
+        first = backend.search('billing', 2)
+        rest = backend.search('billing', 2, (0.0, first[-1].kind, first[-1].object_id))
+
+        self.assertEqual([(hit.kind, hit.object_id) for hit in first + rest], [
+            (KIND_TASK, self.description_task.pk),
+            (KIND_TASK, self.title_task.pk),
+            (KIND_COMMENT, self.comment.pk),
+        ])
+
+    def test_invalid_cursor(self):
+        for cursor in ('!!', 'e30', 'WzEsInRhc2siXQ', 'WzEsInVzZXIiLDFd'):
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(InvalidCursor):
+                    search('billing', 1, cursor)
+
+    def test_rebuild_command_restores_index(self):
+        call_command('rebuild_search_index', stdout=StringIO())
+
+        self.assertIn((KIND_COMMENT, self.comment.pk), self._hits('export'))
+        self.assertIn((KIND_TASK, self.title_task.pk), self._hits('billing'))
+
+
+@override_settings(SEARCH_PAGE_SIZE=2)
+class SearchViewTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username = 'owner',
+            password = 'pass1234'
+        )
+        for i in range(3):
+            Task.objects.create(
+                title = f'Release checklist {i}',
+                description = 'Task Description',
+                owner = self.owner
+            )
+        self.url = reverse('search:search')
+
+    def test_requires_login(self):
+        response = self.client.get(self.url, {'q': 'release'})
+        self.assertEqual(response.status_code, 302)
+
+    def test_results_are_paginated(self):
+        self.client.login(
+            username = 'owner',
+            password = 'pass1234'
+        )
+
+        first = self.client.get(self.url, {'q': 'release'})
+        second = self.client.get(self.url, {'q': 'release', 'cursor': first.context['next_cursor']})
+
+        self.assertEqual(len(first.context['results']), 2)
+        self.assertTrue(first.context['next_cursor'])
+        self.assertEqual(len(second.context['results']), 1)
+        self.assertIsNone(second.context['next_cursor'])
+
+        seen = [result['task'].pk for result in first.context['results'] + second.context['results']]
+        self.assertEqual(sorted(seen), sorted(Task.objects.values_list('pk', flat=True)))
+
+    def test_invalid_cursor_returns_404(self):
+        self.client.login(
+            username = 'owner',
+            password = 'pass1234'
+        )
+
+        response = self.client.get(self.url, {'q': 'release', 'cursor': '!!'})
+
+        self.assertEqual(response.status_code, 404)
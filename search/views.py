@@ -0,0 +1,42 @@
+from django.views.generic import TemplateView
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import Http404
+from django.conf import settings
+
+from taskflow.pagination import InvalidCursor
+from tasks.models import Task
+from comments.models import Comment
+from .backends import search, KIND_COMMENT
+
+
+class SearchView(LoginRequiredMixin, TemplateView):
+    template_name = 'search/results.html'
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        query = self.request.GET.get('q', '')
+        try:
+            page = search(query, settings.SEARCH_PAGE_SIZE, self.request.GET.get('cursor'))
+        except InvalidCursor:
+            raise Http404
+        hits = page.object_list
+
+        tasks = Task.objects.in_bulk({hit.task_id for hit in hits})
+        comments = Comment.objects.select_related('author').in_bulk(
+            [hit.object_id for hit in hits if hit.kind == KIND_COMMENT]
+        )
+
+        results = []
+        for hit in hits:
+            task = tasks.get(hit.task_id)
+            comment = comments.get(hit.object_id) if hit.kind == KIND_COMMENT else None
+            if task is None or (hit.kind == KIND_COMMENT and comment is None):
+                continue # Changed since the index was read
+            results.append({'kind': hit.kind, 'task': task, 'comment': comment, 'rank': hit.rank})
+
+        context.update({
+            'query': query,
+            'results': results,
+            'next_cursor': page.next_cursor,
+        })
+        return context
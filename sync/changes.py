@@ -0,0 +1,152 @@
+"""
+Change feed behind SyncView.
+
+Tasks and comments are read in (updated_at, id) order and tombstones in
+(deleted_at, id) order, each with a KeysetPaginator from its own
+position, so every page is an index range scan however far behind the
+client is. The three positions travel together in one opaque cursor; a
+client only keeps the last cursor it was given.
+
+Rows changed in the last SYNC_SETTLE_SECONDS are held back until a later
+request: timestamps are taken before commit, so a slow transaction can
+commit a row older than ones a client has already read past.
+"""
+import base64
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.utils import timezone
+
+from taskflow.pagination import KeysetPaginator, InvalidCursor
+from tasks.models import Task
+from comments.models import Comment
+from .models import Tombstone
+
+STREAMS = ('tasks', 'comments', 'deleted')
+
+
+class CursorExpired(Exception):
+    """
+    The cursor predates tombstones that have since been pruned.
+    """
+
+
+def serialize_task(task):
+    return {
+        'id': task.pk,
+        'title': task.title,
+        'description': task.description,
+        'status': task.status,
+        'priority': task.priority,
+        'owner': task.owner_id,
+        'due_date': task.due_date,
+        'created_at': task.created_at,
+        'updated_at': task.updated_at,
+    }
+
+
+def serialize_comment(comment):
+    return {
+        'id': comment.pk,
+        'task': comment.task_id,
+        'author': comment.author_id,
+        # Soft-deleted comments are sent so clients hide them, without their text
+        'content': '' if comment.is_deleted else comment.content,
+        'created_at': comment.created_at,
+        'edited_at': comment.edited_at,
+        'is_deleted': comment.is_deleted,
+        'deleted_at': comment.deleted_at,
+        'updated_at': comment.updated_at,
+    }
+
+
+def encode_cursor(positions):
+    raw = json.dumps(positions, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        positions = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception as exc:
+        raise InvalidCursor(cursor) from exc
+    if not isinstance(positions, dict) or set(positions) != set(STREAMS):
+        raise InvalidCursor(cursor)
+    if not all(isinstance(position, str) and position for position in positions.values()):
+        raise InvalidCursor(cursor)
+    return positions
+
+
+def _read(queryset, field, position, until, per_page):
+    """
+    Return (rows, next position, more rows waiting) for one stream.
+    """
+    paginator = KeysetPaginator([field, 'id'], per_page)
+    page = paginator.paginate(queryset.filter(**{f'{field}__lte': until}), position)
+    if page.has_next:
+        return page.object_list, page.next_cursor, True
+    # Caught up: continue from 'until', so an idle stream's position still
+    # moves forward (and cursor expiry is judged on recent positions)
+    return page.object_list, paginator.encode(queryset.model(**{field: until, 'id': 0})), False
+
+
+def changes(cursor=None, *, per_page=None, now=None):
+    """
+    Return the changes after 'cursor', or every task and comment when it
+    is empty, as a JSON-ready dict:
+
+        {'tasks': [...], 'comments': [...],
+         'deleted': {'tasks': [ids], 'comments': [ids]},
+         'cursor': '...', 'has_more': bool}
+
+    Each list holds at most 'per_page' rows. Raises InvalidCursor for a
+    malformed cursor and CursorExpired for one older than the tombstone
+    retention.
+    """
+    per_page = per_page or settings.SYNC_PAGE_SIZE
+    now = now or timezone.now()
+    until = now - timedelta(seconds=settings.SYNC_SETTLE_SECONDS)
+
+    if cursor:
+        positions = decode_cursor(cursor)
+        deleted_at, _ = KeysetPaginator(['deleted_at', 'id'], per_page).decode(positions['deleted'], Tombstone)
+        if deleted_at < now - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS):
+            raise CursorExpired(cursor)
+    else:
+        # A first sync reads the current rows; deletions before it don't concern it
+        positions = {
+            'tasks': None,
+            'comments': None,
+            'deleted': KeysetPaginator(['deleted_at', 'id'], per_page).encode(Tombstone(id=0, deleted_at=until)),
+        }
+
+    tasks, positions['tasks'], more_tasks = _read(
+        Task.objects.all(), 'updated_at', positions['tasks'], until, per_page,
+    )
+    comments, positions['comments'], more_comments = _read(
+        Comment.all_objects.all(), 'updated_at', positions['comments'], until, per_page,
+    )
+    tombstones, positions['deleted'], more_deleted = _read(
+        Tombstone.objects.all(), 'deleted_at', positions['deleted'], until, per_page,
+    )
+
+    kinds = {
+        ContentType.objects.get_for_model(Task).pk: 'tasks',
+        ContentType.objects.get_for_model(Comment).pk: 'comments',
+    }
+    deleted = {'tasks': [], 'comments': []}
+    for tombstone in tombstones:
+        kind = kinds.get(tombstone.content_type_id)
+        if kind:
+            deleted[kind].append(tombstone.object_id)
+
+    return {
+        'tasks': [serialize_task(task) for task in tasks],
+        'comments': [serialize_comment(comment) for comment in comments],
+        'deleted': deleted,
+        'cursor': encode_cursor(positions),
+        'has_more': more_tasks or more_comments or more_deleted,
+    }
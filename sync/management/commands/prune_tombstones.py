@@ -0,0 +1,29 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from sync.models import Tombstone
+
+
+class Command(BaseCommand):
+    help = 'Delete sync tombstones older than the retention period'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.SYNC_TOMBSTONE_RETENTION_DAYS,
+                            help='Keep this many days of deletions (sync cursors older than '
+                                 'SYNC_TOMBSTONE_RETENTION_DAYS are refused, so keep at least that)')
+        parser.add_argument('--dry-run', action='store_true')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        qs = Tombstone.objects.filter(deleted_at__lt=cutoff)
+
+        if options['dry_run']:
+            self.stdout.write(f'Found {qs.count()} tombstones to prune.')
+            return
+
+        # Tombstones have no relations or signals: a single DELETE
+        deleted, _ = qs.delete()
+        self.stdout.write(self.style.SUCCESS(f'Pruned {deleted} tombstones'))
@@ -0,0 +1,42 @@
+from django.db import models
+from django.contrib.contenttypes.models import ContentType
+from django.utils import timezone
+
+
+class TombstoneManager(models.Manager):
+    def record(self, model, object_ids, deleted_at=None):
+        """
+        Record the hard delete of 'object_ids' (instances of 'model') with
+        one bulk insert. Call it in the deleting transaction, so the
+        tombstones commit or roll back with the rows.
+        """
+        ct = ContentType.objects.get_for_model(model)
+        deleted_at = deleted_at or timezone.now()
+        return self.bulk_create([
+            self.model(content_type=ct, object_id=object_id, deleted_at=deleted_at)
+            for object_id in object_ids
+        ])
+
+
+class Tombstone(models.Model):
+    """
+    A hard-deleted task or comment, so sync clients learn to drop it.
+
+    Soft-deleted comments are not tombstoned: they stay in the comments
+    table (and the change feed) with is_deleted set until purged.
+    """
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveBigIntegerField()
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    objects = TombstoneManager()
+
+    class Meta:
+        indexes = [
+            # The change feed pages tombstones by (deleted_at, id)
+            models.Index(fields=['deleted_at', 'id'], name='tombstone_deleted_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.content_type.model} #{self.object_id} deleted at {self.deleted_at}'
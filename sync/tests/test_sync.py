@@ -0,0 +1,275 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from django.core.management import call_command
+from django.contrib.auth import get_user_model
+
+from tasks.models import Task
+from comments.models import Comment
+from sync.changes import changes, CursorExpired
+from sync.models import Tombstone
+from taskflow.pagination import InvalidCursor
+
+User = get_user_model()
+
+
+@override_settings(SYNC_SETTLE_SECONDS=0)
+class SyncViewTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username = 'owner',
+            password = 'pass1234'
+        )
+        self.task = Task.objects.create(
+            title = 'Synced Task',
+            description = 'Task description',
+            owner = self.owner
+        )
+        self.comment = Comment.objects.create(
+            task = self.task,
+            author = self.owner,
+            content = 'First comment'
+        )
+        self.url = reverse('sync:changes')
+        self.client.login(username='owner', password='pass1234')
+
+    def _sync(self, cursor=None):
+        response = self.client.get(self.url, {'cursor': cursor} if cursor else {})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def _sync_all(self, cursor=None):
+        # Follow 'has_more' like a client, merging the pages
+        tasks, comments, deleted = {}, {}, {'tasks': [], 'comments': []}
+        while True:
+            data = self._sync(cursor)
+            tasks.update((row['id'], row) for row in data['tasks'])
+            comments.update((row['id'], row) for row in data['comments'])
+            for kind in deleted:
+                deleted[kind] += data['deleted'][kind]
+            cursor = data['cursor']
+            if not data['has_more']:
+                return tasks, comments, deleted, cursor
+
+    def test_requires_login(self):
+        self.client.logout()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 302)
+
+    def test_first_sync_returns_everything(self):
+        data = self._sync()
+
+        self.assertEqual([row['id'] for row in data['tasks']], [self.task.pk])
+        self.assertEqual(data['tasks'][0]['title'], 'Synced Task')
+        self.assertEqual(data['tasks'][0]['owner'], self.owner.pk)
+        self.assertEqual([row['id'] for row in data['comments']], [self.comment.pk])
+        self.assertEqual(data['comments'][0]['task'], self.task.pk)
+        self.assertEqual(data['deleted'], {'tasks': [], 'comments': []})
+        self.assertFalse(data['has_more'])
+        self.assertTrue(data['cursor'])
+
+    def test_no_changes_returns_nothing(self):
+        cursor = self._sync()['cursor']
+
+        data = self._sync(cursor)
+
+        self.assertEqual(data['tasks'], [])
+        self.assertEqual(data['comments'], [])
+        self.assertEqual(data['deleted'], {'tasks': [], 'comments': []})
+
+    def test_created_and_updated_rows(self):
+        cursor = self._sync()['cursor']
+
+        new_task = Task.objects.create(title='New Task', description='x', owner=self.owner)
+        self.task.title = 'Renamed'
+        self.task.save()
+        new_comment = Comment.objects.create(task=new_task, author=self.owner, content='Hello')
+
+        tasks, comments, _, _ = self._sync_all(cursor)
+
+        self.assertEqual(set(tasks), {self.task.pk, new_task.pk})
+        self.assertEqual(tasks[self.task.pk]['title'], 'Renamed')
+        self.assertEqual(set(comments), {new_comment.pk})
+
+    def test_comment_edit_and_soft_delete(self):
+        other = Comment.objects.create(task=self.task, author=self.owner, content='Second')
+        cursor = self._sync()['cursor']
+
+        self.client.post(
+            reverse('tasks:comments:comment-edit', kwargs={'task_id': self.task.pk, 'pk': self.comment.pk}),
+            {'content': 'Edited'},
+        )
+        Comment.objects.filter(pk=other.pk).soft_delete(by_user=self.owner)
+
+        _, comments, _, _ = self._sync_all(cursor)
+
+        self.assertEqual(comments[self.comment.pk]['content'], 'Edited')
+        self.assertTrue(comments[other.pk]['is_deleted'])
+        self.assertEqual(comments[other.pk]['content'], '')
+
+    def test_single_soft_delete_is_a_change(self):
+        cursor = self._sync()['cursor']
+
+        self.comment.soft_delete(by_user=self.owner)
+
+        _, comments, _, _ = self._sync_all(cursor)
+
+        self.assertTrue(comments[self.comment.pk]['is_deleted'])
+
+    def test_bulk_update_is_a_change(self):
+        cursor = self._sync()['cursor']
+
+        self.client.post(reverse('tasks:task-bulk'), {'ids': [self.task.pk], 'operation': 'status', 'status': 'D'})
+
+        tasks, _, _, _ = self._sync_all(cursor)
+
+        self.assertEqual(tasks[self.task.pk]['status'], 'D')
+
+    def test_task_delete_leaves_tombstone(self):
+        cursor = self._sync()['cursor']
+
+        self.client.post(reverse('tasks:task-delete', kwargs={'pk': self.task.pk}))
+
+        tasks, comments, deleted, _ = self._sync_all(cursor)
+
+        self.assertEqual(tasks, {})
+        self.assertEqual(deleted, {'tasks': [self.task.pk], 'comments': []})
+
+    def test_bulk_delete_leaves_tombstones(self):
+        second = Task.objects.create(title='Second', description='x', owner=self.owner)
+        cursor = self._sync()['cursor']
+
+        self.client.post(reverse('tasks:task-bulk'), {'ids': [self.task.pk, second.pk], 'operation': 'delete'})
+
+        _, _, deleted, _ = self._sync_all(cursor)
+
+        self.assertEqual(sorted(deleted['tasks']), sorted([self.task.pk, second.pk]))
+
+    def test_purge_leaves_tombstones(self):
+        self.comment.soft_delete(by_user=self.owner)
+        Comment.all_objects.filter(pk=self.comment.pk).update(deleted_at=timezone.now() - timedelta(days=60))
+        cursor = self._sync()['cursor']
+
+        call_command('purge_deleted_comments', days=30, stdout=StringIO())
+
+        _, _, deleted, _ = self._sync_all(cursor)
+
+        self.assertEqual(deleted, {'tasks': [], 'comments': [self.comment.pk]})
+
+    def test_user_delete_leaves_tombstones(self):
+        other = User.objects.create_user(username='other', password='pass1234')
+        their_task = Task.objects.create(title='Theirs', description='x', owner=other)
+        Comment.objects.create(task=their_task, author=other, content='On their task')
+        their_comment = Comment.objects.create(task=self.task, author=other, content='On my task')
+        cursor = self._sync()['cursor']
+
+        other.delete()
+
+        _, _, deleted, _ = self._sync_all(cursor)
+
+        # Their comment on their own task goes with the task
+        self.assertEqual(deleted, {'tasks': [their_task.pk], 'comments': [their_comment.pk]})
+
+    def test_first_sync_skips_earlier_deletions(self):
+        Tombstone.objects.record(Task, [12345], deleted_at=timezone.now() - timedelta(minutes=1))
+
+        _, _, deleted, _ = self._sync_all()
+
+        self.assertEqual(deleted, {'tasks': [], 'comments': []})
+
+    @override_settings(SYNC_PAGE_SIZE=2)
+    def test_pages_through_large_change_sets(self):
+        cursor = self._sync_all()[3]
+        created = [
+            Task.objects.create(title=f'Task {i}', description='x', owner=self.owner).pk
+            for i in range(5)
+        ]
+
+        pages = []
+        seen = []
+        while True:
+            data = self._sync(cursor)
+            pages.append(data)
+            self.assertLessEqual(len(data['tasks']), 2)
+            seen += [row['id'] for row in data['tasks']]
+            cursor = data['cursor']
+            if not data['has_more']:
+                break
+
+        self.assertEqual(seen, created)
+        self.assertEqual(len(pages), 3)
+
+    @override_settings(SYNC_PAGE_SIZE=2)
+    def test_page_queries_do_not_grow(self):
+        for i in range(10):
+            task = Task.objects.create(title=f'Task {i}', description='x', owner=self.owner)
+            Comment.objects.create(task=task, author=self.owner, content='x')
+
+        self._sync() # content types cached
+
+        # session, user, tasks, comments, tombstones
+        with self.assertNumQueries(5):
+            self._sync()
+
+    def test_invalid_cursor(self):
+        for cursor in ('!!', 'e30', 'WzFd'):
+            with self.subTest(cursor=cursor):
+                response = self.client.get(self.url, {'cursor': cursor})
+                self.assertEqual(response.status_code, 400)
+
+    @override_settings(SYNC_TOMBSTONE_RETENTION_DAYS=1)
+    def test_expired_cursor(self):
+        cursor = changes(now=timezone.now() - timedelta(days=2))['cursor']
+
+        response = self.client.get(self.url, {'cursor': cursor})
+
+        self.assertEqual(response.status_code, 410)
+
+
+class SyncChangesTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username = 'owner',
+            password = 'pass1234'
+        )
+
+    @override_settings(SYNC_SETTLE_SECONDS=5)
+    def test_recent_changes_wait_to_settle(self):
+        cursor = changes()['cursor']
+        task = Task.objects.create(title='Fresh', description='x', owner=self.owner)
+
+        self.assertEqual(changes(cursor)['tasks'], [])
+
+        later = changes(cursor, now=timezone.now() + timedelta(seconds=10))
+        self.assertEqual([row['id'] for row in later['tasks']], [task.pk])
+
+    def test_malformed_positions(self):
+        with self.assertRaises(InvalidCursor):
+            changes('eyJ0YXNrcyI6bnVsbCwiY29tbWVudHMiOm51bGwsImRlbGV0ZWQiOm51bGx9')
+
+    @override_settings(SYNC_TOMBSTONE_RETENTION_DAYS=1)
+    def test_idle_cursor_does_not_expire(self):
+        old = timezone.now() - timedelta(days=2)
+        Tombstone.objects.record(Task, [1], deleted_at=old)
+
+        cursor = changes()['cursor']
+
+        self.assertIsInstance(changes(cursor), dict)
+        with self.assertRaises(CursorExpired):
+            changes(changes(now=old)['cursor'])
+
+
+class PruneTombstonesTests(TestCase):
+    def test_prunes_old_tombstones(self):
+        now = timezone.now()
+        Tombstone.objects.record(Task, [1], deleted_at=now - timedelta(days=100))
+        Tombstone.objects.record(Task, [2], deleted_at=now - timedelta(days=1))
+
+        call_command('prune_tombstones', days=90, stdout=StringIO())
+
+        self.assertEqual(list(Tombstone.objects.values_list('object_id', flat=True)), [2])
@@ -0,0 +1,26 @@
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import JsonResponse
+from django.views.generic import View
+
+from taskflow.pagination import InvalidCursor
+from .changes import changes, CursorExpired
+
+
+class SyncView(LoginRequiredMixin, View):
+    '''
+    Tasks and comments created, updated or deleted since 'cursor', as JSON.
+
+    Without a cursor every task and comment is returned. Clients request
+    again with the returned cursor while 'has_more' is true, and keep the
+    last cursor for their next sync.
+    '''
+
+    def get(self, request, *args, **kwargs):
+        try:
+            page = changes(request.GET.get('cursor'))
+        except InvalidCursor:
+            return JsonResponse({'errors': {'cursor': ['Invalid cursor.']}}, status=400)
+        except CursorExpired:
+            # Deletions since then may have been pruned: start over
+            return JsonResponse({'errors': {'cursor': ['Cursor expired; sync again without one.']}}, status=410)
+        return JsonResponse(page)
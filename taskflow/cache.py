@@ -0,0 +1,35 @@
+import time
+
+from django.core.cache import cache
+
+
+def get_versions(*keys):
+    """
+    Return the current value of each version counter in 'keys', in order.
+
+    Missing counters are seeded with a time-based value rather than 0, so a
+    counter that was evicted never rewinds to a number an old cache entry
+    was stored under.
+    """
+    found = cache.get_many(keys)
+    versions = []
+
+    for key in keys:
+        version = found.get(key)
+        if version is None:
+            cache.add(key, time.time_ns())
+            version = cache.get(key)
+        versions.append(version)
+
+    return versions
+
+
+def bump_version(key):
+    """
+    Invalidate everything cached under the version counter 'key'.
+    """
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Counter was never read or has been evicted
+        cache.add(key, time.time_ns())
@@ -0,0 +1,28 @@
+from django import forms
+from django.conf import settings
+
+
+class IdListField(forms.Field):
+    """
+    Repeated integer parameter (?ids=1&ids=2), deduplicated and capped at
+    the value of the 'limit_setting' setting.
+    """
+    widget = forms.MultipleHiddenInput
+
+    def __init__(self, *, limit_setting, **kwargs):
+        self.limit_setting = limit_setting
+        super().__init__(**kwargs)
+
+    def to_python(self, value):
+        if not value:
+            return []
+        try:
+            return sorted({int(item) for item in value})
+        except (TypeError, ValueError):
+            raise forms.ValidationError('Enter a list of ids.')
+
+    def validate(self, value):
+        super().validate(value)
+        limit = getattr(settings, self.limit_setting)
+        if len(value) > limit:
+            raise forms.ValidationError(f'At most {limit} ids per request.')
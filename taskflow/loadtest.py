@@ -0,0 +1,379 @@
+"""
+Concurrent load generator for the task and comment views.
+
+LoadTest drives a weighted mix of task list, task detail, comment post and
+comment delete requests from several threads, each acting as a logged-in
+user, and collects latency, status and query counts per request.
+
+Requests go either straight into the WSGI application (WSGITransport, no
+network or server in the way) or over HTTP to a running server
+(HTTPTransport). In-process runs count queries with the same execute
+wrapper as QueryInstrumentationMiddleware; HTTP runs read them from the
+'Server-Timing' header when the middleware is enabled and the server
+sends it to the load-test users (QUERY_SERVER_TIMING).
+"""
+import http.client
+import io
+import math
+import random
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import ExitStack
+from urllib.parse import urlencode, urlsplit
+
+from django.conf import settings
+from django.db import connections
+from django.test import Client
+from django.urls import reverse
+from django.utils.crypto import get_random_string
+
+from .middleware import QueryStats
+
+DEFAULT_MIX = {'list': 50, 'detail': 35, 'comment': 10, 'delete': 5}
+
+LIST_QUERIES = [
+    {},
+    {},
+    {'sort': '-activity'},
+    {'status': 'T'},
+    {'priority': 'H', 'sort': 'due'},
+]
+
+_SERVER_TIMING_QUERIES_RE = re.compile(r'desc="(\d+) queries"')
+
+
+def parse_mix(value):
+    """
+    Parse 'list=50,detail=35' into {'list': 50, 'detail': 35}.
+    """
+    mix = {}
+    for part in value.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise ValueError(f'unknown action {name!r}')
+        mix[name] = int(weight)
+    if not any(mix.values()):
+        raise ValueError('the mix needs at least one positive weight')
+    return mix
+
+
+def percentile(sorted_values, p):
+    # Nearest-rank percentile of an ascending list
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class VirtualUser:
+    """
+    A logged-in session, with a CSRF secret for POSTs.
+    """
+
+    def __init__(self, user, comments=()):
+        client = Client()
+        client.force_login(user)
+        self.user = user
+        self.csrf_token = get_random_string(32)
+        self.cookies = {
+            settings.SESSION_COOKIE_NAME: client.cookies[settings.SESSION_COOKIE_NAME].value,
+            settings.CSRF_COOKIE_NAME: self.csrf_token,
+        }
+        # (task id, comment id) of this user's comments, consumed by deletes
+        self.comments = list(comments)
+        self.lock = threading.Lock()
+
+    def cookie_header(self):
+        return '; '.join(f'{name}={value}' for name, value in self.cookies.items())
+
+    def pop_comment(self):
+        with self.lock:
+            return self.comments.pop() if self.comments else None
+
+
+class WSGITransport:
+    def __init__(self, application, host='localhost'):
+        self.application = application
+        self.host = host
+
+    def request(self, method, path, user, body=b''):
+        path, _, query = path.partition('?')
+        environ = {
+            'REQUEST_METHOD': method,
+            'PATH_INFO': path,
+            'QUERY_STRING': query,
+            'SERVER_NAME': self.host,
+            'SERVER_PORT': '80',
+            'SERVER_PROTOCOL': 'HTTP/1.1',
+            'HTTP_HOST': self.host,
+            'HTTP_COOKIE': user.cookie_header(),
+            'CONTENT_TYPE': 'application/x-www-form-urlencoded',
+            'CONTENT_LENGTH': str(len(body)),
+            'wsgi.input': io.BytesIO(body),
+            'wsgi.errors': io.StringIO(),
+            'wsgi.url_scheme': 'http',
+            'wsgi.version': (1, 0),
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': False,
+            'wsgi.run_once': False,
+        }
+        status = []
+        stats = QueryStats()
+
+        with ExitStack() as stack:
+            for alias in settings.DATABASES:
+                stack.enter_context(connections[alias].execute_wrapper(stats))
+            response = self.application(environ, lambda s, headers, exc_info=None: status.append(s))
+            try:
+                for _ in response:
+                    pass
+            finally:
+                if hasattr(response, 'close'):
+                    response.close()
+
+        return int(status[0].split()[0]), stats.count
+
+    def close(self):
+        # Connections are per thread; close this worker's
+        connections.close_all()
+
+
+class HTTPTransport:
+    def __init__(self, base_url):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ('http', 'https'):
+            raise ValueError(f'unsupported URL {base_url!r}')
+        self.scheme = parts.scheme
+        self.netloc = parts.netloc
+        self.prefix = parts.path.rstrip('/')
+        self.local = threading.local()
+
+    def connection(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            cls = http.client.HTTPSConnection if self.scheme == 'https' else http.client.HTTPConnection
+            conn = self.local.conn = cls(self.netloc, timeout=30)
+        return conn
+
+    def request(self, method, path, user, body=b''):
+        headers = {
+            'Cookie': user.cookie_header(),
+            'Content-Type': 'application/x-www-form-urlencoded',
+        }
+        if self.scheme == 'https':
+            headers['Referer'] = f'https://{self.netloc}/'
+
+        conn = self.connection()
+        try:
+            conn.request(method, self.prefix + path, body=body or None, headers=headers)
+            response = conn.getresponse()
+            response.read()
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            self.local.conn = None
+            raise
+
+        match = _SERVER_TIMING_QUERIES_RE.search(response.getheader('Server-Timing') or '')
+        return response.status, int(match.group(1)) if match else None
+
+    def close(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self.local.conn = None
+
+
+class Results:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.queries = defaultdict(list)
+        self.errors = Counter()
+        self.statuses = defaultdict(Counter)
+        self.elapsed = 0.0
+
+    def add(self, action, seconds, status, queries, ok):
+        with self.lock:
+            self.latencies[action].append(seconds)
+            self.statuses[action][status] += 1
+            if queries is not None:
+                self.queries[action].append(queries)
+            if not ok:
+                self.errors[action] += 1
+
+    def _describe(self, latencies, queries, errors):
+        latencies = sorted(latencies)
+        ms = lambda value: round(value * 1000, 2) if value is not None else None
+        return {
+            'requests': len(latencies),
+            'errors': errors,
+            'throughput': round(len(latencies) / self.elapsed, 2) if self.elapsed else 0,
+            'mean_ms': ms(sum(latencies) / len(latencies)) if latencies else None,
+            'p50_ms': ms(percentile(latencies, 50)),
+            'p95_ms': ms(percentile(latencies, 95)),
+            'p99_ms': ms(percentile(latencies, 99)),
+            'max_ms': ms(latencies[-1]) if latencies else None,
+            'queries_per_request': round(sum(queries) / len(queries), 2) if queries else None,
+        }
+
+    def summary(self):
+        endpoints = {
+            action: dict(
+                self._describe(self.latencies[action], self.queries[action], self.errors[action]),
+                statuses={str(code): n for code, n in sorted(self.statuses[action].items())},
+            )
+            for action in sorted(self.latencies)
+        }
+        overall = self._describe(
+            [value for values in self.latencies.values() for value in values],
+            [value for values in self.queries.values() for value in values],
+            sum(self.errors.values()),
+        )
+        return {'elapsed_s': round(self.elapsed, 3), 'overall': overall, 'endpoints': endpoints}
+
+
+class LoadTest:
+    EXPECTED_STATUS = {'list': 200, 'detail': 200, 'comment': 302, 'delete': 302}
+
+    def __init__(self, transport, users, task_ids, *, mix=None, threads=8,
+                 duration=None, requests=None, warmup=0, seed=0):
+        if not users or not task_ids:
+            raise ValueError('a load test needs at least one user and one task')
+        if duration is None and requests is None:
+            raise ValueError('give a duration or a number of requests')
+        self.transport = transport
+        self.users = users
+        self.task_ids = task_ids
+        self.mix = mix or DEFAULT_MIX
+        self.threads = threads
+        self.duration = duration
+        self.requests = requests
+        self.warmup = warmup
+        self.seed = seed
+        self._issued = 0
+        self._lock = threading.Lock()
+
+    # Actions: each returns (method, path, body)
+
+    def action_list(self, rng, user):
+        params = rng.choice(LIST_QUERIES)
+        path = reverse('tasks:task-list')
+        return 'GET', f'{path}?{urlencode(params)}' if params else path, b''
+
+    def action_detail(self, rng, user):
+        return 'GET', reverse('tasks:task-detail', kwargs={'pk': rng.choice(self.task_ids)}), b''
+
+    def action_comment(self, rng, user):
+        task_id = rng.choice(self.task_ids)
+        body = urlencode({
+            'content': f'Load test comment {rng.randrange(10 ** 9)}',
+            'csrfmiddlewaretoken': user.csrf_token,
+        })
+        return 'POST', reverse('tasks:comments:comment-add', kwargs={'task_id': task_id}), body.encode()
+
+    def action_delete(self, rng, user):
+        target = user.pop_comment()
+        if target is None:
+            return None
+        task_id, comment_id = target
+        body = urlencode({'csrfmiddlewaretoken': user.csrf_token}).encode()
+        return 'POST', reverse('tasks:comments:comment-delete', kwargs={'task_id': task_id, 'pk': comment_id}), body
+
+    def _take_slot(self):
+        with self._lock:
+            if self.requests is not None and self._issued >= self.requests:
+                return False
+            self._issued += 1
+            return True
+
+    def _worker(self, index, results, deadline, errors):
+        rng = random.Random(f'{self.seed}:{index}')
+        user = self.users[index % len(self.users)]
+        actions = list(self.mix)
+        weights = [self.mix[action] for action in actions]
+
+        try:
+            while deadline is None or time.perf_counter() < deadline:
+                action = rng.choices(actions, weights)[0]
+                plan = getattr(self, f'action_{action}')(rng, user)
+                if plan is None:
+                    # Nothing left to delete: post a comment instead
+                    action = 'comment'
+                    plan = self.action_comment(rng, user)
+                if results is not None and not self._take_slot():
+                    break
+
+                method, path, body = plan
+                start = time.perf_counter()
+                try:
+                    status, queries = self.transport.request(method, path, user, body)
+                except Exception as exc:
+                    status, queries = 0, None
+                    errors.append(f'{method} {path}: {exc!r}')
+                seconds = time.perf_counter() - start
+
+                if results is None:
+                    return
+                results.add(action, seconds, status, queries, status == self.EXPECTED_STATUS[action])
+        finally:
+            self.transport.close()
+
+    def _run_threads(self, results, deadline, count):
+        errors = []
+        threads = [
+            threading.Thread(target=self._worker, args=(i, results, deadline, errors), daemon=True)
+            for i in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return errors
+
+    def run(self):
+        # Warm-up: one request per worker, repeated, results discarded
+        for _ in range(self.warmup):
+            self._run_threads(None, None, self.threads)
+
+        results = Results()
+        start = time.perf_counter()
+        deadline = start + self.duration if self.duration else None
+        self.errors = self._run_threads(results, deadline, self.threads)
+        results.elapsed = time.perf_counter() - start
+        return results
+
+
+COMPARED = [
+    # (metric, higher is better)
+    ('throughput', True),
+    ('p50_ms', False),
+    ('p95_ms', False),
+    ('p99_ms', False),
+    ('queries_per_request', False),
+]
+
+
+def compare(current, baseline):
+    """
+    Compare two summaries. Returns [(scope, metric, baseline, current,
+    change %, regression %)], where the regression is positive when
+    'current' is worse, whichever direction is better for the metric.
+    """
+    rows = []
+    scopes = [('overall', current['overall'], baseline.get('overall', {}))]
+    scopes += [
+        (name, data, baseline.get('endpoints', {}).get(name, {}))
+        for name, data in current['endpoints'].items()
+    ]
+    for scope, now, before in scopes:
+        for metric, higher_is_better in COMPARED:
+            old, new = before.get(metric), now.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old * 100
+            rows.append((scope, metric, old, new, round(change, 1),
+                         round(-change if higher_is_better else change, 1)))
+    return rows
@@ -0,0 +1,129 @@
+"""
+Per-request SQL instrumentation.
+
+QueryInstrumentationMiddleware wraps every database connection with
+connection.execute_wrapper() for the duration of a request. It counts the
+queries and the time spent in the database, and logs a warning to the
+'taskflow.queries' logger when one statement shape repeats more than
+QUERY_REPEAT_THRESHOLD times, which is what an N+1 looks like from the
+database's side.
+
+Both figures are also reported in a 'Server-Timing' header, but only to
+staff users, with DEBUG, or when QUERY_SERVER_TIMING is set: they tell
+any client how much database work a URL costs. Everyone else's requests
+are only logged, at DEBUG level.
+
+The wrapper only bumps a counter and a dict entry per query; statements are
+normalized once per distinct SQL string when the request finishes, so it is
+cheap enough to stay enabled in production.
+"""
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger('taskflow.queries')
+
+_IN_LIST_RE = re.compile(r'\bIN \((?:%s|\?)(?:, (?:%s|\?))*\)', re.IGNORECASE)
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r'\b\d+(?:\.\d+)?\b')
+_SPACE_RE = re.compile(r'\s+')
+
+
+def normalize_sql(sql):
+    """
+    Reduce 'sql' to its shape: literals become '?' and IN lists of any
+    length collapse to 'IN (...)', so queries that differ only in their
+    parameters compare equal.
+    """
+    sql = _STRING_RE.sub('?', sql)
+    sql = _NUMBER_RE.sub('?', sql)
+    sql = _IN_LIST_RE.sub('IN (...)', sql)
+    return _SPACE_RE.sub(' ', sql).strip()
+
+
+class QueryStats:
+    """
+    Query counters for one request. Used as the execute wrapper itself.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.statements[sql] += 1
+
+    def repeated(self, threshold):
+        """
+        Return [(shape, count)] for every shape seen more than 'threshold'
+        times, most frequent first.
+        """
+        if self.count <= threshold:
+            return []
+        shapes = Counter()
+        for sql, count in self.statements.items():
+            shapes[normalize_sql(sql)] += count
+        return [
+            (shape, count) for shape, count in shapes.most_common()
+            if count > threshold
+        ]
+
+
+class QueryInstrumentationMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.threshold = getattr(settings, 'QUERY_REPEAT_THRESHOLD', 10)
+
+    def __call__(self, request):
+        stats = QueryStats()
+        start = time.perf_counter()
+
+        with ExitStack() as stack:
+            for alias in settings.DATABASES:
+                stack.enter_context(connections[alias].execute_wrapper(stats))
+            response = self.get_response(request)
+
+        total = time.perf_counter() - start
+        if self.show_server_timing(request):
+            self.add_server_timing(response, stats, total)
+        else:
+            logger.debug(
+                '%s %s: %d queries, db %.1fms, app %.1fms',
+                request.method, request.path, stats.count, stats.duration * 1000, total * 1000,
+            )
+
+        for shape, count in stats.repeated(self.threshold):
+            logger.warning(
+                'Possible N+1 on %s %s: %d queries of one shape (%d total): %s',
+                request.method, request.path, count, stats.count, shape,
+            )
+
+        return response
+
+    def show_server_timing(self, request):
+        if settings.DEBUG or getattr(settings, 'QUERY_SERVER_TIMING', False):
+            return True
+        user = getattr(request, 'user', None)
+        return bool(user and user.is_staff)
+
+    def add_server_timing(self, response, stats, total):
+        # Streaming bodies are rendered after this runs, so their queries
+        # are not counted
+        metrics = (
+            f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries", '
+            f'app;dur={total * 1000:.1f}'
+        )
+        existing = response.get('Server-Timing')
+        response['Server-Timing'] = f'{existing}, {metrics}' if existing else metrics
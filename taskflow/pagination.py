@@ -0,0 +1,140 @@
+import base64
+import datetime
+import json
+
+from django.db.models import F, Q
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+class KeysetPage:
+    def __init__(self, object_list, next_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+class KeysetPaginator:
+    """
+    Cursor (keyset) pagination over a fixed ordering.
+
+    'ordering' lists model field names, optionally prefixed with '-', and
+    must end with a unique field (usually 'id') so every row has a distinct
+    position. Pages are fetched with 'WHERE (ordering) > (cursor)' instead
+    of OFFSET, so the cost of a page does not depend on how deep it is and
+    an index on the ordering columns serves it directly.
+
+    NULLs sort after every value in ascending order and before every value
+    in descending order (PostgreSQL's default), so one index serves both
+    directions.
+    """
+
+    def __init__(self, ordering, per_page):
+        self.ordering = [
+            (name.lstrip('-'), name.startswith('-')) for name in ordering
+        ]
+        self.per_page = per_page
+
+    def _fields(self, model):
+        return [
+            (model._meta.get_field(name), descending)
+            for name, descending in self.ordering
+        ]
+
+    def order_by(self, model):
+        expressions = []
+        for field, descending in self._fields(model):
+            expression = F(field.attname)
+            if not field.null:
+                expressions.append(expression.desc() if descending else expression.asc())
+            elif descending:
+                expressions.append(expression.desc(nulls_first=True))
+            else:
+                expressions.append(expression.asc(nulls_last=True))
+        return expressions
+
+    def encode(self, obj):
+        values = []
+        for field, _ in self._fields(type(obj)):
+            value = getattr(obj, field.attname)
+            if isinstance(value, (datetime.date, datetime.datetime)):
+                value = value.isoformat()
+            values.append(value)
+
+        raw = json.dumps(values, separators=(',', ':')).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    def decode(self, cursor, model):
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            fields = self._fields(model)
+            if not isinstance(values, list) or len(values) != len(fields):
+                raise InvalidCursor(cursor)
+            return [
+                None if value is None else field.to_python(value)
+                for (field, _), value in zip(fields, values)
+            ]
+        except InvalidCursor:
+            raise
+        except Exception as exc:
+            raise InvalidCursor(cursor) from exc
+
+    def _after(self, model, values):
+        """
+        Build 'rows strictly after the cursor' as an OR of prefix matches.
+        """
+        condition = Q(pk__in=[])
+        equal = Q()
+
+        for (field, descending), value in zip(self._fields(model), values):
+            name = field.attname
+            if value is None:
+                after = Q(**{f'{name}__isnull': False}) if descending else None
+                same = Q(**{f'{name}__isnull': True})
+            else:
+                after = Q(**{f'{name}__lt' if descending else f'{name}__gt': value})
+                if field.null and not descending:
+                    after |= Q(**{f'{name}__isnull': True})
+                same = Q(**{name: value})
+
+            if after is not None:
+                condition |= equal & after
+            equal &= same
+
+        # Redundant bound on the leading column lets the planner start an
+        # index range scan instead of evaluating the OR for every row.
+        (field, descending), value = self._fields(model)[0], values[0]
+        if value is not None and not field.null:
+            lookup = f'{field.attname}__lte' if descending else f'{field.attname}__gte'
+            condition &= Q(**{lookup: value})
+
+        return condition
+
+    def paginate(self, queryset, cursor=None):
+        """
+        Return the KeysetPage that follows 'cursor' (the first page if empty).
+        """
+        model = queryset.model
+        queryset = queryset.order_by(*self.order_by(model))
+
+        if cursor:
+            queryset = queryset.filter(self._after(model, self.decode(cursor, model)))
+
+        rows = list(queryset[:self.per_page + 1])
+        if len(rows) > self.per_page:
+            rows = rows[:self.per_page]
+            return KeysetPage(rows, self.encode(rows[-1]))
+
+        return KeysetPage(rows, None)
@@ -43,7 +43,9 @@ INSTALLED_APPS = [
     'accounts.apps.AccountsConfig',
     'tasks.apps.TasksConfig',
     'comments.apps.CommentsConfig',
-    'rbac.apps.RbacConfig'
+    'rbac.apps.RbacConfig',
+    'search.apps.SearchConfig',
+    'sync.apps.SyncConfig',
 ]
 
 MIDDLEWARE = [
@@ -62,6 +64,34 @@ COMMENTS_ACTIVE_ONLY = True # Default: hide soft-deleted comments
 
 COMMENTS_EDIT_WINDOW_MINUTES = 15 # Default time limit for comments edit window
 
+COMMENTS_PAGE_SIZE = 50 # Comments loaded per page on the task detail view
+COMMENTS_MODERATION_MAX = 1000 # Most comments one moderation action may delete
+COMMENTS_FRAGMENT_CACHE_TIMEOUT = 3600 # Seconds a rendered comment body stays in the fragment cache
+
+TASKS_PAGE_SIZE = 50 # Tasks per page on the task list view
+TASKS_EXPORT_CHUNK_SIZE = 2000 # Rows fetched per database round trip by the task export
+TASKS_BULK_MAX = 1000 # Most tasks one bulk action may touch
+TASKS_DETAIL_CACHE_TIMEOUT = 300 # Seconds a cached task detail page (task + first comment page) is kept
+
+SEARCH_PAGE_SIZE = 20 # Results per page on the search view
+
+SYNC_PAGE_SIZE = 500 # Most rows of each kind (tasks, comments, deletions) per sync response
+SYNC_SETTLE_SECONDS = 5 # Changes younger than this wait for the next sync, so slow commits aren't skipped
+SYNC_TOMBSTONE_RETENTION_DAYS = 90 # prune_tombstones drops older deletions; older cursors must sync from scratch
+
+RBAC_PERMISSION_CACHE_TIMEOUT = 300 # Seconds a resolved permission set stays in the shared cache
+
+AUDIT_BUFFER_MODE = 'deferred' # 'deferred': one bulk insert per transaction on commit; 'sync': write immediately
+AUDIT_BUFFER_BATCH_SIZE = 1000 # Rows per INSERT when a buffer is flushed
+AUDIT_PAGE_SIZE = 50 # Audit log entries per page
+AUDIT_RETENTION_DAYS = 365 # Audit entries older than this are dropped by rotate_audit_partitions
+AUDIT_PARTITIONS_AHEAD = 3 # Monthly audit partitions created ahead of time (PostgreSQL)
+AUDIT_ARCHIVE_DIR = BASE_DIR / 'audit-archive' # Cold-storage segments written by archive_audit
+AUDIT_ARCHIVE_AFTER_DAYS = 90 # archive_audit moves entries older than this out of the database
+
+QUERY_REPEAT_THRESHOLD = 10 # QueryInstrumentationMiddleware warns when one SQL shape repeats more often per request
+QUERY_SERVER_TIMING = os.getenv("QUERY_SERVER_TIMING", "False") == "True" # Server-Timing header for every client, not only staff (always on with DEBUG)
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
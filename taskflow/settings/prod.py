@@ -5,6 +5,13 @@ DEBUG = False
 
 ALLOWED_HOSTS = os.getenv("ALLOWED_HOSTS", "").split(",")
 
+# Query counts and database time per request (Server-Timing for staff, N+1 warnings)
+MIDDLEWARE = [
+    MIDDLEWARE[0],
+    "taskflow.middleware.QueryInstrumentationMiddleware",
+    *MIDDLEWARE[1:],
+]
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
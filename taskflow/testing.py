@@ -0,0 +1,67 @@
+"""
+Query-budget assertions for tests.
+
+QueryBudgetMixin adds two assertions to a TestCase:
+
+- assertMaxQueries(budget) fails when a block runs more than 'budget'
+  queries, listing the SQL that ran.
+- assertQueriesDoNotGrow(request, grow, sizes) seeds the database at each
+  size in turn and fails when 'request' runs more queries at a larger size
+  than at the smallest one, which is how an N+1 or a missing
+  select_related/prefetch_related shows up.
+"""
+from contextlib import contextmanager
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+
+def format_queries(queries):
+    return '\n'.join(
+        f'{number}. {query["sql"]}' for number, query in enumerate(queries, start=1)
+    )
+
+
+class QueryBudgetMixin:
+    @contextmanager
+    def assertMaxQueries(self, budget, using=DEFAULT_DB_ALIAS):
+        with CaptureQueriesContext(connections[using]) as context:
+            yield context
+
+        executed = len(context.captured_queries)
+        if executed > budget:
+            self.fail(
+                f'{executed} queries executed, budget is {budget}\n'
+                f'Captured queries were:\n{format_queries(context.captured_queries)}'
+            )
+
+    def count_queries(self, func, using=DEFAULT_DB_ALIAS):
+        """
+        Call 'func' and return (its result, the queries it ran).
+        """
+        with CaptureQueriesContext(connections[using]) as context:
+            result = func()
+        return result, context.captured_queries
+
+    def assertQueriesDoNotGrow(self, request, grow, sizes=(1, 5, 25), using=DEFAULT_DB_ALIAS):
+        """
+        For each size, call grow(size) to seed the database, then count the
+        queries run by request(). Fails when any larger size needs more
+        queries than the first one.
+        """
+        counts = []
+        baseline = None
+        for size in sizes:
+            grow(size)
+            _, queries = self.count_queries(request, using=using)
+            counts.append(len(queries))
+            if baseline is None:
+                baseline = queries
+            elif len(queries) > len(baseline):
+                self.fail(
+                    'Query count grows with the data: '
+                    + ', '.join(f'{s}: {c}' for s, c in zip(sizes, counts))
+                    + f'\nQueries at size {sizes[0]}:\n{format_queries(baseline)}'
+                    + f'\nQueries at size {size}:\n{format_queries(queries)}'
+                )
+        return counts
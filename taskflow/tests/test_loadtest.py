@@ -0,0 +1,117 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.test import SimpleTestCase, TransactionTestCase
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.contrib.auth import get_user_model
+
+from tasks.models import Task
+from comments.models import Comment
+from taskflow import loadtest
+from taskflow.wsgi import application
+
+User = get_user_model()
+
+
+class LoadTestHelperTests(SimpleTestCase):
+    def test_percentile_is_nearest_rank(self):
+        values = list(range(1, 101))
+        self.assertEqual(loadtest.percentile(values, 50), 50)
+        self.assertEqual(loadtest.percentile(values, 99), 99)
+        self.assertEqual(loadtest.percentile([7], 95), 7)
+        self.assertIsNone(loadtest.percentile([], 50))
+
+    def test_parse_mix(self):
+        self.assertEqual(loadtest.parse_mix('list=3, detail=1'), {'list': 3, 'detail': 1})
+        with self.assertRaises(ValueError):
+            loadtest.parse_mix('search=1')
+        with self.assertRaises(ValueError):
+            loadtest.parse_mix('list=0')
+
+    def test_compare_reports_regressions_in_both_directions(self):
+        baseline = {'overall': {'throughput': 100, 'p95_ms': 10.0}, 'endpoints': {}}
+        current = {'overall': {'throughput': 80, 'p95_ms': 12.0}, 'endpoints': {}}
+
+        rows = {(scope, metric): regression
+                for scope, metric, _, _, _, regression in loadtest.compare(current, baseline)}
+
+        self.assertEqual(rows, {('overall', 'throughput'): 20.0, ('overall', 'p95_ms'): 20.0})
+
+
+class LoadTestRunTests(TransactionTestCase):
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(
+                username = f'user{i}',
+                password = 'pass1234'
+            )
+            for i in range(2)
+        ]
+        self.tasks = [
+            Task.objects.create(
+                title = f'Task {i}',
+                description = 'Task description',
+                owner = self.users[i % 2]
+            )
+            for i in range(3)
+        ]
+        for i in range(4):
+            Comment.objects.create(
+                task = self.tasks[0],
+                author = self.users[0],
+                content = f'Comment {i}'
+            )
+
+    def _run(self, **kwargs):
+        users = [
+            loadtest.VirtualUser(user, Comment.objects.filter(author=user).values_list('task_id', 'pk'))
+            for user in self.users
+        ]
+        run = loadtest.LoadTest(
+            loadtest.WSGITransport(application, host='testserver'),
+            users, [task.pk for task in self.tasks], **kwargs,
+        )
+        return run.run().summary()
+
+    def test_in_process_reads(self):
+        summary = self._run(mix={'list': 1, 'detail': 1}, threads=2, requests=20)
+
+        self.assertEqual(summary['overall']['requests'], 20)
+        self.assertEqual(summary['overall']['errors'], 0)
+        self.assertEqual(set(summary['endpoints']), {'list', 'detail'})
+        detail = summary['endpoints']['detail']
+        self.assertLessEqual(detail['p50_ms'], detail['p99_ms'])
+        self.assertGreater(detail['queries_per_request'], 0)
+
+    def test_in_process_writes(self):
+        summary = self._run(mix={'comment': 1, 'delete': 1}, threads=1, requests=12, seed=3)
+
+        self.assertEqual(summary['overall']['errors'], 0)
+        self.assertEqual(summary['endpoints']['delete']['statuses'], {'302': summary['endpoints']['delete']['requests']})
+        self.assertEqual(
+            Comment.all_objects.filter(is_deleted=True).count(),
+            summary['endpoints']['delete']['requests'],
+        )
+
+    def test_command_writes_and_compares_results(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        path = os.path.join(tmpdir.name, 'run.json')
+        args = ['loadtest', '--host', 'testserver', '--threads', '1', '--requests', '10',
+                '--warmup', '0', '--mix', 'list=1,detail=1']
+
+        call_command(*args, '--output', path, stdout=StringIO())
+        with open(path) as fh:
+            self.assertEqual(json.load(fh)['overall']['requests'], 10)
+
+        out = StringIO()
+        call_command(*args, '--baseline', path, stdout=out)
+        self.assertIn('Compared with baseline', out.getvalue())
+
+        with open(path, 'w') as fh:
+            json.dump({'overall': {'throughput': 10 ** 9}, 'endpoints': {}}, fh)
+        with self.assertRaises(CommandError):
+            call_command(*args, '--baseline', path, '--max-regression', '50', stdout=StringIO())
@@ -0,0 +1,129 @@
+from django.conf import settings
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+
+from tasks.models import Task
+from taskflow.middleware import QueryInstrumentationMiddleware, normalize_sql
+
+User = get_user_model()
+
+MIDDLEWARE = [
+    settings.MIDDLEWARE[0],
+    'taskflow.middleware.QueryInstrumentationMiddleware',
+    *settings.MIDDLEWARE[1:],
+]
+
+
+class NormalizeSqlTests(TestCase):
+    def test_literals_and_in_lists_collapse(self):
+        self.assertEqual(
+            normalize_sql("SELECT * FROM t WHERE a = 'x' AND b = 12 AND c IN (%s, %s, %s)"),
+            normalize_sql("SELECT * FROM t WHERE a = 'it''s' AND b = 7 AND c IN (%s)"),
+        )
+        self.assertEqual(normalize_sql('SELECT  1\n FROM t'), 'SELECT ? FROM t')
+
+
+class QueryInstrumentationMiddlewareTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username = 'owner',
+            password = 'pass1234'
+        )
+        self.tasks = [
+            Task.objects.create(
+                title = f'Task {i}',
+                description = 'Task description',
+                owner = self.owner
+            )
+            for i in range(5)
+        ]
+        self.request = RequestFactory().get('/tasks/')
+
+    def _run(self, view):
+        return QueryInstrumentationMiddleware(view)(self.request)
+
+    @override_settings(QUERY_SERVER_TIMING=True)
+    def test_server_timing_counts_queries(self):
+        def view(request):
+            Task.objects.count()
+            User.objects.count()
+            return HttpResponse()
+
+        response = self._run(view)
+
+        self.assertRegex(response['Server-Timing'], r'^db;dur=\d+\.\d;desc="2 queries", app;dur=\d+\.\d$')
+
+    @override_settings(QUERY_SERVER_TIMING=True)
+    def test_existing_server_timing_is_kept(self):
+        def view(request):
+            response = HttpResponse()
+            response['Server-Timing'] = 'cache;dur=1'
+            return response
+
+        self.assertTrue(self._run(view)['Server-Timing'].startswith('cache;dur=1, db;dur='))
+
+    @override_settings(QUERY_SERVER_TIMING=False, DEBUG=False)
+    def test_server_timing_is_only_logged_for_other_clients(self):
+        def view(request):
+            Task.objects.count()
+            return HttpResponse()
+
+        with self.assertLogs('taskflow.queries', 'DEBUG') as logs:
+            response = self._run(view)
+
+        self.assertFalse(response.has_header('Server-Timing'))
+        self.assertIn('GET /tasks/: 1 queries', logs.output[0])
+
+    @override_settings(QUERY_SERVER_TIMING=False, DEBUG=False)
+    def test_server_timing_for_staff(self):
+        def view(request):
+            return HttpResponse()
+
+        self.request.user = self.owner
+        self.assertFalse(self._run(view).has_header('Server-Timing'))
+
+        self.owner.is_staff = True
+        self.assertTrue(self._run(view).has_header('Server-Timing'))
+
+    @override_settings(QUERY_REPEAT_THRESHOLD=3)
+    def test_repeated_shape_is_logged(self):
+        def view(request):
+            for task in self.tasks:
+                Task.objects.get(pk=task.pk)
+            return HttpResponse()
+
+        with self.assertLogs('taskflow.queries', 'WARNING') as logs:
+            self._run(view)
+
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn('GET /tasks/: 5 queries of one shape', logs.output[0])
+
+    @override_settings(QUERY_REPEAT_THRESHOLD=5)
+    def test_below_threshold_is_quiet(self):
+        def view(request):
+            for task in self.tasks:
+                Task.objects.get(pk=task.pk)
+            return HttpResponse()
+
+        with self.assertNoLogs('taskflow.queries', 'WARNING'):
+            self._run(view)
+
+    @override_settings(MIDDLEWARE=MIDDLEWARE, QUERY_SERVER_TIMING=False, DEBUG=False)
+    def test_enabled_in_the_stack(self):
+        self.client.login(
+            username = 'owner',
+            password = 'pass1234'
+        )
+
+        response = self.client.get(reverse('tasks:task-list'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('Server-Timing'))
+
+        User.objects.filter(pk=self.owner.pk).update(is_staff=True)
+
+        response = self.client.get(reverse('tasks:task-list'))
+
+        self.assertIn('queries"', response['Server-Timing'])
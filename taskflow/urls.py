@@ -5,5 +5,9 @@ from .views import index
 urlpatterns = [
     path('', index, name='index'),
     path('tasks/', include('tasks.urls', namespace='tasks')),
+    path('comments/moderate/', include('comments.moderation_urls', namespace='moderation')),
+    path('search/', include('search.urls', namespace='search')),
+    path('sync/', include('sync.urls', namespace='sync')),
+    path('audit/', include('rbac.urls', namespace='audit')),
     path('admin/', admin.site.urls),
 ]
\ No newline at end of file
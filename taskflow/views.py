@@ -14,5 +14,7 @@ def index(request):
         <ul>
             <li>/admin/ — Django admin</li>
             <li>/tasks/ — Task-related views</li>
+            <li>/search/ — Full-text search over tasks and comments</li>
+            <li>/audit/ — Audit log (requires rbac.view_auditentry)</li>
         </ul>
     """)
\ No newline at end of file
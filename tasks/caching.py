@@ -0,0 +1,103 @@
+"""
+Read-through cache for task detail pages.
+
+The task and the first page of its comments are cached together under a
+per-task version counter (see taskflow.cache). Anything that changes what
+the page shows calls invalidate_tasks() with the affected task ids: Task
+save/delete, Comment save (create, edit, soft delete), bulk soft deletes,
+bulk task actions and purges.
+
+The cached data is the same for every viewer; edit/delete controls are
+computed per request by CommentPermissions on top of it. Keys also carry
+a global usernames version, bumped when a user may have been renamed.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from taskflow.cache import get_versions, bump_version
+
+
+def _version_key(task_id):
+    return f'tasks:detail:version:{task_id}'
+
+
+# Cached pages show owner and author usernames
+USERNAMES_VERSION_KEY = 'tasks:detail:usernames-version'
+
+
+def invalidate_usernames():
+    """
+    Drop every cached detail page, after a user may have been renamed.
+    """
+    bump_version(USERNAMES_VERSION_KEY)
+    transaction.on_commit(lambda: bump_version(USERNAMES_VERSION_KEY))
+
+
+def usernames_version():
+    version, = get_versions(USERNAMES_VERSION_KEY)
+    return version
+
+
+def detail_versions(task_id):
+    """
+    The version counters a task's cached detail page is stored under.
+    """
+    return get_versions(_version_key(task_id), USERNAMES_VERSION_KEY)
+
+
+def invalidate_tasks(*task_ids):
+    """
+    Drop the cached detail pages of 'task_ids'.
+    """
+    for key in {_version_key(task_id) for task_id in task_ids}:
+        bump_version(key)
+        # Bump again once the change is visible to other connections, so a
+        # reader that cached the pre-commit state in between is invalidated too.
+        transaction.on_commit(lambda key=key: bump_version(key))
+
+
+LAST_DELETION_KEY = 'tasks:last-deletion'
+
+
+def mark_tasks_deleted():
+    """
+    Record that tasks were deleted, for the task list's Last-Modified. Also
+    used when comment counts change without moving any task timestamp.
+    """
+    cache.set(LAST_DELETION_KEY, timezone.now(), None)
+
+
+def last_task_deletion():
+    """
+    When tasks were last deleted. Unknown (evicted) counts as now, so a
+    lost timestamp costs a full response rather than a stale 304.
+    """
+    at = cache.get(LAST_DELETION_KEY)
+    if at is None:
+        cache.add(LAST_DELETION_KEY, timezone.now(), None)
+        at = cache.get(LAST_DELETION_KEY)
+    return at
+
+
+def get_task_detail(task_id):
+    """
+    Return {'task', 'comments', 'next_cursor'} for the task's detail page,
+    from the cache or the database. Raises Task.DoesNotExist.
+    """
+    # Imported here: the models import this module to invalidate
+    from comments.views import comment_page
+    from .models import Task
+
+    version, usernames = detail_versions(task_id)
+    key = f'tasks:detail:{task_id}:{version}:{usernames}'
+
+    detail = cache.get(key)
+    if detail is None:
+        task = Task.objects.select_related('owner').get(pk=task_id)
+        comments, next_cursor = comment_page(task)
+        detail = {'task': task, 'comments': comments, 'next_cursor': next_cursor}
+        cache.set(key, detail, getattr(settings, 'TASKS_DETAIL_CACHE_TIMEOUT', 300))
+
+    return detail
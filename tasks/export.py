@@ -0,0 +1,71 @@
+"""
+Streaming serialization of tasks for TaskExportView.
+
+Rows are read with values_list().iterator(), so no model instances are
+built and, on PostgreSQL, a server-side cursor feeds the response chunk
+by chunk instead of the whole result set being loaded first.
+"""
+import csv
+import datetime
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+FIELDS = ['id', 'title', 'description', 'status', 'priority', 'owner', 'created_at', 'due_date']
+COMMENT_FIELDS = ['comment_count', 'last_activity_at']
+
+_COLUMNS = {
+    'id': 'id',
+    'title': 'title',
+    'description': 'description',
+    'status': 'status',
+    'priority': 'priority',
+    'owner': 'owner__username',
+    'created_at': 'created_at',
+    'due_date': 'due_date',
+    # Denormalized on Task, so including them costs no extra query
+    'comment_count': 'active_comment_count',
+    'last_activity_at': 'last_activity_at',
+}
+
+
+class Echo:
+    """
+    File-like object whose write() returns the value, for csv.writer.
+    """
+
+    def write(self, value):
+        return value
+
+
+def iter_rows(queryset, *, include_comments=False, chunk_size=2000):
+    fields = FIELDS + (COMMENT_FIELDS if include_comments else [])
+    rows = queryset.values_list(*(_COLUMNS[field] for field in fields)).iterator(chunk_size=chunk_size)
+    for row in rows:
+        yield dict(zip(fields, row))
+
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    return value
+
+
+def csv_lines(rows, fields):
+    writer = csv.writer(Echo())
+    yield writer.writerow(fields)
+    for row in rows:
+        yield writer.writerow([_csv_value(row[field]) for field in fields])
+
+
+def ndjson_lines(rows, fields):
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder, separators=(',', ':')) + '\n'
+
+
+FORMATS = {
+    'csv': (csv_lines, 'text/csv'),
+    'ndjson': (ndjson_lines, 'application/x-ndjson'),
+}
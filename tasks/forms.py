@@ -0,0 +1,165 @@
+from django import forms
+from django.contrib.auth import get_user_model
+
+from taskflow.forms import IdListField
+
+from .models import Task
+
+
+class TaskFilterForm(forms.Form):
+    """
+    Server-side filtering and sorting for the task list (GET parameters).
+
+    Every sort key maps to an ordering that one of the Task indexes covers,
+    and every ordering ends with 'id' so it can drive keyset pagination.
+    Status and priority sort by their stored codes; 'owner' groups tasks by
+    owner in account (id) order, not by username, which would need a join
+    no index can serve.
+
+    Only filter and sort combinations an index serves are accepted:
+
+    - with a status, priority or owner filter: 'created', 'due' and the
+      filtered field itself, from the (field, created_at/due_date, id)
+      indexes; not 'activity' or another field's sort
+    - with a due date range: 'due' only
+
+    Any other sort is dropped like an invalid value, and the listing falls
+    back to the default for its filters ('due' for a date range).
+    """
+    SORT_ORDERINGS = {
+        'created': ('created_at', 'id'),
+        'due': ('due_date', 'id'),
+        'status': ('status', 'created_at', 'id'),
+        'priority': ('priority', 'created_at', 'id'),
+        'owner': ('owner', 'created_at', 'id'),
+        'activity': ('last_activity_at', 'id'),
+    }
+    SORT_CHOICES = [
+        (f'{prefix}{key}', f'{key} ({direction})')
+        for key in SORT_ORDERINGS
+        for prefix, direction in (('', 'ascending'), ('-', 'descending'))
+    ]
+    DEFAULT_SORT = '-created'
+
+    status = forms.ChoiceField(choices=[('', 'any')] + Task.STATUS_CHOICES, required=False)
+    priority = forms.ChoiceField(choices=[('', 'any')] + Task.PRIORITY_CHOICES, required=False)
+    owner = forms.CharField(required=False, help_text='Username')
+    due_after = forms.DateTimeField(required=False)
+    due_before = forms.DateTimeField(required=False)
+    sort = forms.ChoiceField(choices=SORT_CHOICES, required=False)
+
+    # Filter field -> Task column it compares with equality
+    EQUALITY_FILTERS = {'status': 'status', 'priority': 'priority', 'owner': 'owner'}
+
+    def clean(self):
+        cleaned_data = super().clean()
+        sort = cleaned_data.get('sort')
+        if sort and not self._index_backed(self.SORT_ORDERINGS[sort.lstrip('-')], cleaned_data):
+            self.add_error('sort', 'This sort is not available with these filters.')
+        return cleaned_data
+
+    def _index_backed(self, ordering, cleaned_data):
+        """
+        Whether one Task index both narrows to the filters and returns the
+        rows in 'ordering', so a page is a single index range scan.
+        """
+        equal = {
+            column for name, column in self.EQUALITY_FILTERS.items() if cleaned_data.get(name)
+        }
+        ranged = cleaned_data.get('due_after') or cleaned_data.get('due_before')
+        # Columns fixed by a filter don't affect the order
+        ordering = [name for name in ordering if name not in equal]
+        if ranged and ordering[0] != 'due_date':
+            return False
+
+        for index in Task._meta.indexes:
+            fields = list(index.fields)
+            if equal and fields[0] not in equal:
+                continue
+            while fields and fields[0] in equal:
+                fields.pop(0)
+            if fields[:len(ordering)] == ordering:
+                return True
+        return False
+
+    def default_sort(self):
+        if self._cleaned('due_after') or self._cleaned('due_before'):
+            return 'due'
+        return self.DEFAULT_SORT
+
+    def _cleaned(self, name):
+        # Invalid values are dropped rather than failing the whole listing
+        if not self.is_bound:
+            return None
+        self.is_valid()
+        return self.cleaned_data.get(name)
+
+    def filter_queryset(self, queryset):
+        filters = {
+            'status': self._cleaned('status'),
+            'priority': self._cleaned('priority'),
+            'owner__username': self._cleaned('owner'),
+            'due_date__gte': self._cleaned('due_after'),
+            'due_date__lt': self._cleaned('due_before'),
+        }
+        return queryset.filter(**{
+            lookup: value for lookup, value in filters.items() if value
+        })
+
+    def ordering(self):
+        sort = self._cleaned('sort') or self.default_sort()
+        prefix = '-' if sort.startswith('-') else ''
+        return tuple(prefix + name for name in self.SORT_ORDERINGS[sort.lstrip('-')])
+
+
+class TaskBulkActionForm(forms.Form):
+    """
+    One operation applied to many tasks at once.
+    """
+    OPERATION_STATUS = 'status'
+    OPERATION_PRIORITY = 'priority'
+    OPERATION_REASSIGN = 'reassign'
+    OPERATION_DELETE = 'delete'
+
+    OPERATION_CHOICES = [
+        (OPERATION_STATUS, 'Set status'),
+        (OPERATION_PRIORITY, 'Set priority'),
+        (OPERATION_REASSIGN, 'Reassign'),
+        (OPERATION_DELETE, 'Delete'),
+    ]
+
+    ids = IdListField(limit_setting='TASKS_BULK_MAX')
+    operation = forms.ChoiceField(choices=OPERATION_CHOICES)
+    status = forms.ChoiceField(choices=Task.STATUS_CHOICES, required=False)
+    priority = forms.ChoiceField(choices=Task.PRIORITY_CHOICES, required=False)
+    owner = forms.CharField(required=False, help_text='Username of the new owner')
+
+    def clean(self):
+        cleaned_data = super().clean()
+        operation = cleaned_data.get('operation')
+
+        if operation in (self.OPERATION_STATUS, self.OPERATION_PRIORITY) and not cleaned_data.get(operation):
+            self.add_error(operation, 'This field is required for this operation.')
+
+        if operation == self.OPERATION_REASSIGN:
+            username = cleaned_data.get('owner')
+            if not username:
+                self.add_error('owner', 'This field is required for this operation.')
+            else:
+                try:
+                    cleaned_data['owner'] = get_user_model().objects.get(username=username)
+                except get_user_model().DoesNotExist:
+                    self.add_error('owner', 'Unknown user.')
+
+        return cleaned_data
+
+    def changes(self):
+        """
+        Field values to update() for the chosen operation (empty for delete).
+        """
+        operation = self.cleaned_data['operation']
+        if operation == self.OPERATION_REASSIGN:
+            return {'owner': self.cleaned_data['owner']}
+        if operation == self.OPERATION_DELETE:
+            return {}
+        return {operation: self.cleaned_data[operation]}
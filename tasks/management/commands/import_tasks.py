@@ -0,0 +1,204 @@
+import csv
+import datetime
+import json
+import os
+import sys
+from itertools import islice
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from tasks.models import Task
+
+User = get_user_model()
+
+
+class RowError(ValueError):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Import tasks from a CSV or JSONL file in batched inserts'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="CSV or JSONL file, or '-' for stdin")
+        parser.add_argument('--format', choices=['csv', 'jsonl'],
+                            help='Input format (default: from the file extension)')
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Tasks inserted per bulk_create and transaction')
+        parser.add_argument('--errors',
+                            help='Write rejected rows to this CSV file instead of stderr')
+
+    # Reading
+
+    def detect_format(self, path, requested):
+        if requested:
+            return requested
+        if path.endswith(('.jsonl', '.ndjson')):
+            return 'jsonl'
+        if path.endswith('.csv'):
+            return 'csv'
+        raise CommandError('Cannot tell the format from the file name; pass --format')
+
+    def read_rows(self, stream, fmt):
+        """
+        Yield (line number, row dict or None, raw text) one row at a time.
+        """
+        if fmt == 'csv':
+            reader = csv.DictReader(stream)
+            for row in reader:
+                yield reader.line_num, row, None
+            return
+
+        for line_num, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                yield line_num, None, line.rstrip('\n')
+                continue
+            yield line_num, row if isinstance(row, dict) else None, line.rstrip('\n')
+
+    # Validation
+
+    def choice(self, value, choices, field):
+        value = str(value or '').strip()
+        if not value:
+            return Task._meta.get_field(field).default
+        for code, label in choices:
+            if value.lower() in (code.lower(), label.lower()):
+                return code
+        raise RowError(f'invalid {field} {value!r}')
+
+    def due_date(self, value):
+        value = str(value or '').strip()
+        if not value:
+            return None
+        parsed = parse_datetime(value)
+        if parsed is None:
+            day = parse_date(value)
+            if day is None:
+                raise RowError(f'invalid due_date {value!r}')
+            parsed = datetime.datetime.combine(day, datetime.time())
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
+
+    def resolve_owners(self, usernames):
+        # One query per batch for usernames not seen yet; misses are cached too
+        missing = [name for name in usernames if name not in self.owner_ids]
+        if missing:
+            found = dict(User.objects.filter(username__in=missing).values_list('username', 'pk'))
+            for name in missing:
+                self.owner_ids[name] = found.get(name)
+
+    def build_task(self, row):
+        title = str(row.get('title') or '').strip()
+        if not title:
+            raise RowError('title is required')
+        if len(title) > self.title_max_length:
+            raise RowError(f'title longer than {self.title_max_length} characters')
+
+        owner_name = str(row.get('owner') or '').strip()
+        owner_id = self.owner_ids.get(owner_name)
+        if owner_id is None:
+            raise RowError(f'unknown owner {owner_name!r}')
+
+        return Task(
+            title = title,
+            description = str(row.get('description') or ''),
+            status = self.choice(row.get('status'), Task.STATUS_CHOICES, 'status'),
+            priority = self.choice(row.get('priority'), Task.PRIORITY_CHOICES, 'priority'),
+            due_date = self.due_date(row.get('due_date')),
+            owner_id = owner_id,
+        )
+
+    # Output
+
+    def reject(self, line_num, error, data):
+        self.rejected += 1
+        if self.error_writer:
+            self.error_writer.writerow([line_num, error, data])
+        else:
+            self.stderr.write(f'Line {line_num}: {error}')
+
+    # Import
+
+    def import_batch(self, batch):
+        self.resolve_owners({
+            str(row.get('owner') or '').strip() for _, row, _ in batch if row is not None
+        })
+
+        tasks, sources = [], []
+        for line_num, row, raw in batch:
+            if row is None:
+                self.reject(line_num, 'not a JSON object', raw)
+                continue
+            try:
+                tasks.append(self.build_task(row))
+            except RowError as exc:
+                self.reject(line_num, str(exc), raw or json.dumps(row))
+                continue
+            sources.append((line_num, raw or json.dumps(row)))
+
+        if not tasks:
+            return
+        try:
+            with transaction.atomic():
+                Task.objects.bulk_create(tasks)
+        except DatabaseError as exc:
+            # Only this batch is lost; report its rows and carry on
+            first, last = batch[0][0], batch[-1][0]
+            self.stderr.write(f'Lines {first}-{last}: batch rejected by the database: {exc}')
+            if self.error_writer:
+                for line_num, data in sources:
+                    self.reject(line_num, f'batch rejected by the database: {exc}', data)
+            else:
+                self.rejected += len(tasks)
+            return
+        self.imported += len(tasks)
+
+    def handle(self, *args, **options):
+        path = options['path']
+        fmt = self.detect_format(path, options['format'])
+        batch_size = options['batch_size']
+
+        self.title_max_length = Task._meta.get_field('title').max_length
+        self.owner_ids = {}
+        self.imported = self.rejected = 0
+        self.error_writer = None
+
+        if path == '-':
+            stream = sys.stdin
+        elif not os.path.exists(path):
+            raise CommandError(f'{path} does not exist')
+        else:
+            stream = open(path, newline='', encoding='utf-8')
+
+        error_file = None
+        try:
+            if options['errors']:
+                error_file = open(options['errors'], 'w', newline='', encoding='utf-8')
+                self.error_writer = csv.writer(error_file)
+                self.error_writer.writerow(['line', 'error', 'data'])
+
+            rows = self.read_rows(stream, fmt)
+            while True:
+                batch = list(islice(rows, batch_size))
+                if not batch:
+                    break
+                self.import_batch(batch)
+                self.stdout.write(f'Imported {self.imported} tasks ({self.rejected} rejected)...')
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+            if error_file:
+                error_file.close()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported {self.imported} tasks, rejected {self.rejected} rows'
+        ))
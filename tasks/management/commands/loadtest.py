@@ -0,0 +1,134 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from tasks.models import Task
+from comments.models import Comment
+from taskflow import loadtest
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Drive a concurrent mix of task and comment requests and report latency percentiles'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url',
+                            help='Base URL of a running server; default: call taskflow.wsgi in-process')
+        parser.add_argument('--host', default='localhost',
+                            help='Host header for in-process requests (must be in ALLOWED_HOSTS)')
+        parser.add_argument('--threads', type=int, default=8)
+        parser.add_argument('--duration', type=float, default=30,
+                            help='Seconds to run (ignored with --requests)')
+        parser.add_argument('--requests', type=int,
+                            help='Stop after this many requests instead of after --duration')
+        parser.add_argument('--warmup', type=int, default=2,
+                            help='Untimed requests per thread before measuring')
+        parser.add_argument('--mix', default='list=50,detail=35,comment=10,delete=5',
+                            help='Relative weights of list, detail, comment and delete requests')
+        parser.add_argument('--users', type=int, default=20,
+                            help='Distinct logged-in users, shared round-robin by the threads')
+        parser.add_argument('--tasks', type=int, default=500,
+                            help='Most recently active tasks that detail and comment requests pick from')
+        parser.add_argument('--deletable', type=int, default=200,
+                            help="Comments per user made available to delete requests")
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--output', help='Write the results to this JSON file')
+        parser.add_argument('--baseline', help='Compare against the results in this JSON file')
+        parser.add_argument('--max-regression', type=float,
+                            help='Fail when a compared metric is this many percent worse than the baseline')
+
+    def load_users(self, count, deletable):
+        users = list(User.objects.filter(is_active=True).order_by('pk')[:count])
+        if not users:
+            raise CommandError('No users to log in as; run seed_benchmark_data first')
+
+        virtual = []
+        for user in users:
+            comments = (
+                Comment.objects
+                .filter(author=user)
+                .order_by('-created_at')
+                .values_list('task_id', 'pk')[:deletable]
+            )
+            virtual.append(loadtest.VirtualUser(user, comments))
+        return virtual
+
+    def write_summary(self, summary):
+        header = f"{'endpoint':<10} {'requests':>8} {'errors':>6} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'queries':>8}"
+        self.stdout.write(header)
+        rows = list(summary['endpoints'].items()) + [('overall', summary['overall'])]
+        for name, data in rows:
+            values = [data[key] for key in ('p50_ms', 'p95_ms', 'p99_ms', 'queries_per_request')]
+            values = ['-' if value is None else f'{value:.1f}' for value in values]
+            self.stdout.write(
+                f"{name:<10} {data['requests']:>8} {data['errors']:>6} {data['throughput']:>8.1f} "
+                + ' '.join(f'{value:>8}' for value in values)
+            )
+
+    def handle(self, *args, **options):
+        try:
+            mix = loadtest.parse_mix(options['mix'])
+        except ValueError as exc:
+            raise CommandError(f'Invalid --mix: {exc}')
+
+        task_ids = list(
+            Task.objects.order_by('-last_activity_at', '-id').values_list('pk', flat=True)[:options['tasks']]
+        )
+        if not task_ids:
+            raise CommandError('No tasks to request; run seed_benchmark_data first')
+        users = self.load_users(options['users'], options['deletable'] if mix.get('delete') else 0)
+
+        if options['url']:
+            transport = loadtest.HTTPTransport(options['url'])
+            target = options['url']
+        else:
+            from taskflow.wsgi import application
+            transport = loadtest.WSGITransport(application, host=options['host'])
+            target = 'taskflow.wsgi (in-process)'
+
+        run = loadtest.LoadTest(
+            transport, users, task_ids,
+            mix = mix,
+            threads = options['threads'],
+            duration = None if options['requests'] else options['duration'],
+            requests = options['requests'],
+            warmup = options['warmup'],
+            seed = options['seed'],
+        )
+        self.stdout.write(f"Running against {target} with {options['threads']} threads...")
+        results = run.run()
+        for error in run.errors[:10]:
+            self.stderr.write(error)
+
+        summary = {
+            'target': target,
+            'threads': options['threads'],
+            'mix': mix,
+            **results.summary(),
+        }
+        self.write_summary(summary)
+
+        if options['output']:
+            with open(options['output'], 'w') as fh:
+                json.dump(summary, fh, indent=2)
+            self.stdout.write(f"Results written to {options['output']}")
+
+        if options['baseline']:
+            with open(options['baseline']) as fh:
+                baseline = json.load(fh)
+            self.compare(summary, baseline, options['max_regression'])
+
+    def compare(self, summary, baseline, max_regression):
+        worst = []
+        self.stdout.write(f'Compared with baseline ({baseline.get("target", "unknown target")}):')
+        for scope, metric, old, new, change, regression in loadtest.compare(summary, baseline):
+            flag = ''
+            if max_regression is not None and regression > max_regression:
+                flag = '  <-- regression'
+                worst.append(f'{scope} {metric} {change:+.1f}%')
+            self.stdout.write(f'  {scope:<10} {metric:<20} {old:>10} -> {new:<10} ({change:+.1f}%){flag}')
+
+        if worst:
+            raise CommandError(f'Worse than the baseline by more than {max_regression}%: ' + ', '.join(worst))
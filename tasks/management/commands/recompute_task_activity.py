@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Max
+
+from tasks.models import Task
+
+
+class Command(BaseCommand):
+    help = 'Recompute Task.active_comment_count and last_activity_at from comments'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000,
+                            help='Tasks updated per statement (by primary key range)')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        max_pk = Task.objects.aggregate(m=Max('pk'))['m'] or 0
+        updated = 0
+
+        for start in range(0, max_pk, batch_size):
+            with transaction.atomic():
+                updated += (
+                    Task.objects
+                    .filter(pk__gt=start, pk__lte=start + batch_size)
+                    .recompute_comment_activity()
+                )
+
+        self.stdout.write(self.style.SUCCESS(f'Recomputed activity for {updated} tasks'))
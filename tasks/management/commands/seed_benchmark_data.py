@@ -0,0 +1,272 @@
+import random
+import time
+from array import array
+from contextlib import contextmanager
+from datetime import datetime, timezone as dt_timezone
+from itertools import islice
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from tasks.models import Task
+from comments.models import Comment
+from rbac.models import AuditEntry, Membership, Role
+
+User = get_user_model()
+
+WORDS = (
+    'deploy review fix update migrate invoice report client budget design '
+    'backend frontend release sprint meeting draft approve schedule follow '
+    'up bug feature customer server database cache index query test docs'
+).split()
+
+
+@contextmanager
+def explicit_timestamps(*fields):
+    """
+    Keep the timestamps set on seeded rows; auto_now/auto_now_add would
+    otherwise overwrite them with the insert time in bulk_create().
+    """
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class Command(BaseCommand):
+    help = 'Generate a large, deterministic dataset for benchmarking'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--roles', type=int, default=10)
+        parser.add_argument('--role-share', type=float, default=0.1,
+                            help='Share of users given one or two roles')
+        parser.add_argument('--tasks', type=int, default=100_000)
+        parser.add_argument('--comments', type=int, default=1_000_000)
+        parser.add_argument('--deleted-share', type=float, default=0.1,
+                            help='Share of comments that are soft-deleted')
+        parser.add_argument('--edited-share', type=float, default=0.2,
+                            help='Share of comments that have been edited')
+        parser.add_argument('--audit', type=int, default=1_000_000,
+                            help='Audit entries to generate')
+        parser.add_argument('--days', type=int, default=365,
+                            help='Spread timestamps over this many days before --now')
+        parser.add_argument('--now',
+                            help='End of the time window (ISO 8601; default: the current time). '
+                                 'Fix it to reproduce a dataset exactly')
+        parser.add_argument('--seed', type=int, default=0,
+                            help='Random seed; the same seed and options give the same data')
+        parser.add_argument('--prefix', default='bench',
+                            help='Prefix of generated usernames and role slugs')
+        parser.add_argument('--batch-size', type=int, default=5000,
+                            help='Rows per bulk_create')
+
+    # Helpers
+
+    def rng(self, name):
+        # One stream per table, so changing one count leaves the others' data unchanged
+        return random.Random(f'{self.seed}:{name}')
+
+    def sentence(self, rng, low, high):
+        return ' '.join(rng.choices(WORDS, k=rng.randint(low, high))).capitalize()
+
+    def moment(self, rng, start):
+        # A timestamp between 'start' (epoch seconds) and the end of the window
+        return start + rng.random() * (self.end - start)
+
+    def as_datetime(self, seconds):
+        return datetime.fromtimestamp(seconds, tz=dt_timezone.utc)
+
+    def insert(self, model, objects, label, keep_ids=True):
+        """
+        bulk_create 'objects' in batches and return their ids (array of int).
+        """
+        ids = array('q')
+        total = 0
+        started = time.monotonic()
+
+        while True:
+            batch = list(islice(objects, self.batch_size))
+            if not batch:
+                break
+            model._base_manager.bulk_create(batch)
+            if keep_ids:
+                ids.extend(obj.pk for obj in batch)
+            total += len(batch)
+
+        elapsed = time.monotonic() - started
+        rate = total / elapsed if elapsed else 0
+        self.stdout.write(f'{label}: {total} rows in {elapsed:.1f}s ({rate:,.0f} rows/s)')
+        return ids
+
+    # Generators
+
+    def gen_users(self, count):
+        password = make_password('benchmark')
+        for i in range(count):
+            yield User(
+                username = f'{self.prefix}{i:07d}',
+                email = f'{self.prefix}{i}@example.com',
+                password = password,
+            )
+
+    def gen_roles(self, count):
+        rng = self.rng('roles')
+        permissions = list(
+            Permission.objects
+            .filter(content_type__app_label__in=['tasks', 'comments', 'rbac'])
+            .order_by('pk')
+        )
+        for i in range(count):
+            role = Role(name=f'{self.prefix} role {i}', slug=f'{self.prefix}-role-{i}')
+            role.seeded_permissions = rng.sample(permissions, k=rng.randint(min(1, len(permissions)), len(permissions)))
+            yield role
+
+    def gen_memberships(self, role_ids, share):
+        rng = self.rng('memberships')
+        now = self.as_datetime(self.end)
+        for user_id in self.user_ids:
+            if not role_ids or rng.random() >= share:
+                continue
+            for role_id in rng.sample(role_ids, k=min(len(role_ids), rng.randint(1, 2))):
+                yield Membership(user_id=user_id, role_id=role_id, created_at=now)
+
+    def gen_tasks(self, count):
+        rng = self.rng('tasks')
+        statuses = [code for code, _ in Task.STATUS_CHOICES]
+        priorities = [code for code, _ in Task.PRIORITY_CHOICES]
+        self.task_times = array('d')
+
+        for _ in range(count):
+            created = self.moment(rng, self.start)
+            self.task_times.append(created)
+            due = created + rng.randint(1, 60) * 86400 if rng.random() < 0.7 else None
+            yield Task(
+                title = self.sentence(rng, 2, 5)[:50],
+                description = self.sentence(rng, 5, 30),
+                status = rng.choice(statuses),
+                priority = rng.choice(priorities),
+                created_at = self.as_datetime(created),
+                updated_at = self.as_datetime(created),
+                last_activity_at = self.as_datetime(created),
+                due_date = self.as_datetime(due) if due is not None else None,
+                owner_id = rng.choice(self.user_ids),
+            )
+
+    def gen_comments(self, count, deleted_share, edited_share):
+        rng = self.rng('comments')
+        tasks = len(self.task_ids)
+
+        for _ in range(count):
+            # Skewed: a few tasks collect most of the discussion
+            index = int(tasks * rng.random() ** 3)
+            created = self.moment(rng, self.task_times[index])
+            author_id = rng.choice(self.user_ids)
+            comment = Comment(
+                task_id = self.task_ids[index],
+                author_id = author_id,
+                content = self.sentence(rng, 3, 40),
+                created_at = self.as_datetime(created),
+            )
+            if rng.random() < edited_share:
+                comment.edited_at = self.as_datetime(created + rng.random() * 900)
+            if rng.random() < deleted_share:
+                comment.is_deleted = True
+                comment.deleted_at = self.as_datetime(self.moment(rng, created))
+                comment.deleted_by_id = author_id if rng.random() < 0.8 else rng.choice(self.user_ids)
+            comment.updated_at = max(filter(None, (comment.created_at, comment.edited_at, comment.deleted_at)))
+            yield comment
+
+    def gen_audit(self, count):
+        rng = self.rng('audit')
+        targets = [
+            (ContentType.objects.get_for_model(Task).pk, self.task_ids),
+            (ContentType.objects.get_for_model(Comment).pk, self.comment_ids),
+        ]
+        targets = [(ct, ids) for ct, ids in targets if ids]
+        actions = [AuditEntry.ACTION_CREATE, AuditEntry.ACTION_EDIT, AuditEntry.ACTION_DELETE]
+
+        for _ in range(count):
+            ct_id, ids = rng.choice(targets)
+            action = rng.choices(actions, weights=(3, 5, 1))[0]
+            payload = {
+                AuditEntry.ACTION_CREATE: {},
+                AuditEntry.ACTION_EDIT: {'status': rng.choice('TID')},
+                AuditEntry.ACTION_DELETE: {'is_deleted': True},
+            }[action]
+            yield AuditEntry(
+                actor_id = rng.choice(self.user_ids),
+                action = action,
+                target_content_type_id = ct_id,
+                target_object_id = rng.choice(ids),
+                timestamp = self.as_datetime(self.moment(rng, self.start)),
+                payload = payload,
+            )
+
+    def handle(self, *args, **options):
+        self.seed = options['seed']
+        self.prefix = options['prefix']
+        self.batch_size = options['batch_size']
+
+        if options['now']:
+            end = parse_datetime(options['now'])
+            if end is None:
+                raise CommandError(f"Invalid --now {options['now']!r}")
+            if timezone.is_naive(end):
+                end = timezone.make_aware(end)
+        else:
+            end = timezone.now()
+        self.end = end.timestamp()
+        self.start = self.end - options['days'] * 86400
+
+        if options['users'] < 1 and (options['tasks'] or options['comments'] or options['audit']):
+            raise CommandError('--users must be at least 1')
+        if (User.objects.filter(username__startswith=self.prefix).exists()
+                or Role.objects.filter(slug__startswith=f'{self.prefix}-role-').exists()):
+            raise CommandError(f"Data seeded with prefix '{self.prefix}' already exists; pick another --prefix")
+
+        self.user_ids = list(self.insert(User, self.gen_users(options['users']), 'Users'))
+
+        roles = list(self.gen_roles(options['roles']))
+        self.insert(Role, iter(roles), 'Roles', keep_ids=False)
+        Role.permissions.through.objects.bulk_create([
+            Role.permissions.through(role_id=role.pk, permission_id=permission.pk)
+            for role in roles
+            for permission in role.seeded_permissions
+        ])
+
+        with explicit_timestamps(Membership._meta.get_field('created_at')):
+            self.insert(
+                Membership,
+                self.gen_memberships([role.pk for role in roles], options['role_share']),
+                'Memberships', keep_ids=False,
+            )
+
+        with explicit_timestamps(Task._meta.get_field('created_at'), Task._meta.get_field('updated_at')):
+            self.task_ids = self.insert(Task, self.gen_tasks(options['tasks']), 'Tasks')
+
+        self.comment_ids = array('q')
+        if self.task_ids:
+            with explicit_timestamps(Comment._meta.get_field('created_at'), Comment._meta.get_field('updated_at')):
+                self.comment_ids = self.insert(
+                    Comment,
+                    self.gen_comments(options['comments'], options['deleted_share'], options['edited_share']),
+                    'Comments',
+                )
+            # bulk_create() skips Comment.save(), which maintains these
+            call_command('recompute_task_activity', batch_size=self.batch_size, stdout=self.stdout)
+
+        if self.task_ids or self.comment_ids:
+            self.insert(AuditEntry, self.gen_audit(options['audit']), 'Audit entries', keep_ids=False)
+
+        self.stdout.write(self.style.SUCCESS(f'Seeded benchmark data (seed {self.seed})'))
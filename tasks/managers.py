@@ -0,0 +1,86 @@
+from django.db import models
+from django.db.models import F, Count, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+
+class TaskQuerySet(models.QuerySet):
+    def record_comment_activity(self, task_id, *, delta=0, at=None):
+        """
+        Apply one comment change to the task's denormalized counters.
+
+        'delta' is the change in active comments (+1 created, -1 soft-deleted).
+        Both columns are updated in a single UPDATE with F-expressions, so
+        concurrent writers never lose an increment, and 'last_activity_at'
+        only ever moves forward. The count is clamped at 0, so a counter
+        that has drifted (e.g. comments bulk-created without running
+        recompute_task_activity) can't fail the user's delete.
+        """
+        at = at or timezone.now()
+        updates = {
+            'last_activity_at': Greatest(F('last_activity_at'), at),
+        }
+        if delta:
+            updates['active_comment_count'] = Greatest(F('active_comment_count') + delta, 0)
+
+        return self.filter(pk=task_id).update(**updates)
+
+    def record_comment_removals(self, counts, *, at=None):
+        """
+        Apply a bulk soft delete to the counters: 'counts' maps task id to
+        the number of its comments removed. Tasks losing the same number
+        share one UPDATE, with the same F-expressions (and clamp) as
+        record_comment_activity, so comments added meanwhile aren't lost.
+        """
+        at = at or timezone.now()
+        by_count = {}
+        for task_id, n in counts.items():
+            by_count.setdefault(n, []).append(task_id)
+
+        for n, task_ids in by_count.items():
+            self.filter(pk__in=task_ids).update(
+                active_comment_count=Greatest(F('active_comment_count') - n, 0),
+                last_activity_at=Greatest(F('last_activity_at'), at),
+            )
+
+    def recompute_comment_activity(self, *, counts_only=False):
+        """
+        Recompute both counters from the comments table for every task in
+        this queryset, in one UPDATE. With 'counts_only', 'last_activity_at'
+        is left alone (it never moves backwards when history is purged).
+        """
+        # Imported here: comments.models imports this app's models
+        from comments.models import Comment
+
+        active = (
+            Comment.all_objects
+            .filter(task=OuterRef('pk'), is_deleted=False)
+            .order_by()
+            .values('task')
+            .annotate(n=Count('pk'))
+            .values('n')
+        )
+        if counts_only:
+            return self.update(active_comment_count=Coalesce(Subquery(active), 0))
+
+        created = Max('created_at')
+        latest = (
+            Comment.all_objects
+            .filter(task=OuterRef('pk'))
+            .order_by()
+            .values('task')
+            .annotate(at=Greatest(
+                created,
+                Coalesce(Max('edited_at'), created),
+                Coalesce(Max('deleted_at'), created),
+            ))
+            .values('at')
+        )
+
+        return self.update(
+            active_comment_count=Coalesce(Subquery(active), 0),
+            last_activity_at=Greatest(F('created_at'), Coalesce(Subquery(latest), F('created_at'))),
+        )
+
+
+TaskManager = models.Manager.from_queryset(TaskQuerySet)
@@ -0,0 +1,60 @@
+# Generated by Django 6.0.1 on 2026-10-18 02:30
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import F, Count, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
+
+
+def backfill_comment_activity(apps, schema_editor):
+    Task = apps.get_model('tasks', 'Task')
+    Comment = apps.get_model('comments', 'Comment')
+
+    active = (
+        Comment.objects
+        .filter(task=OuterRef('pk'), is_deleted=False)
+        .order_by()
+        .values('task')
+        .annotate(n=Count('pk'))
+        .values('n')
+    )
+    created = Max('created_at')
+    latest = (
+        Comment.objects
+        .filter(task=OuterRef('pk'))
+        .order_by()
+        .values('task')
+        .annotate(at=Greatest(
+            created,
+            Coalesce(Max('edited_at'), created),
+            Coalesce(Max('deleted_at'), created),
+        ))
+        .values('at')
+    )
+
+    Task.objects.update(
+        active_comment_count=Coalesce(Subquery(active), 0),
+        last_activity_at=Greatest(F('created_at'), Coalesce(Subquery(latest), F('created_at'))),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0002_task_list_indexes'),
+        ('comments', '0004_comment_task_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='active_comment_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='last_activity_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+        migrations.RunPython(backfill_comment_activity, migrations.RunPython.noop),
+    ]
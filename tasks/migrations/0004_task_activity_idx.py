@@ -0,0 +1,21 @@
+# Generated by Django 6.0.1 on 2026-10-18 02:30
+
+from django.db import migrations, models
+
+from taskflow.migration_operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('tasks', '0003_task_comment_activity'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['last_activity_at', 'id'], name='task_activity_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0.1 on 2026-10-18 03:10
+
+from django.db import migrations, models
+
+from taskflow.migration_operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('tasks', '0005_task_updated_at'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['updated_at', 'id'], name='task_updated_idx'),
+        ),
+    ]
@@ -1,4 +1,8 @@
+import hashlib
+
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.views.decorators.http import condition
+
 
 class OwnerRequiredMixin(LoginRequiredMixin):
     owner_field = 'owner'
@@ -6,4 +10,37 @@ class OwnerRequiredMixin(LoginRequiredMixin):
     def get_queryset(self):
         qs = super().get_queryset()
         filter_kwargs = {self.owner_field: self.request.user}
-        return qs.filter(**filter_kwargs)
\ No newline at end of file
+        return qs.filter(**filter_kwargs)
+
+
+def make_etag(*parts):
+    return hashlib.md5('|'.join(map(str, parts)).encode(), usedforsecurity=False).hexdigest()
+
+
+class ConditionalGetMixin:
+    """
+    Answer GET/HEAD with 304 Not Modified, without building the page, when
+    the client's If-None-Match / If-Modified-Since still match.
+
+    Subclasses implement get_validators(), returning (last_modified, etag)
+    from cheap queries, or (None, None) to always render. It is called at
+    most once per request. List it after LoginRequiredMixin so anonymous
+    requests are redirected first.
+    """
+
+    def get_validators(self):
+        raise NotImplementedError
+
+    def dispatch(self, request, *args, **kwargs):
+        validators = []
+
+        def validator(index):
+            if not validators:
+                validators.extend(self.get_validators())
+            return validators[index]
+
+        view = condition(
+            etag_func=lambda request, *args, **kwargs: validator(1),
+            last_modified_func=lambda request, *args, **kwargs: validator(0),
+        )(super().dispatch)
+        return view(request, *args, **kwargs)
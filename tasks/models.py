@@ -1,5 +1,10 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from .caching import invalidate_tasks, mark_tasks_deleted
+from .managers import TaskManager
+from sync.models import Tombstone
 
 User = get_user_model()
 
@@ -20,8 +25,47 @@ class Task(models.Model):
     status = models.CharField(max_length=1, choices=STATUS_CHOICES, default='T')
     priority = models.CharField(max_length=1, choices=PRIORITY_CHOICES, default='L')
     created_at = models.DateTimeField(auto_now_add=True)
+    # Last change to the task's own fields; comment activity is tracked in
+    # 'last_activity_at'. QuerySet.update() callers must set it themselves.
+    updated_at = models.DateTimeField(auto_now=True)
     due_date = models.DateTimeField(null=True, blank=True)
     owner = models.ForeignKey(User, on_delete=models.CASCADE)
 
+    # Denormalized from comments; kept current by Comment and repaired by
+    # the recompute_task_activity command.
+    active_comment_count = models.PositiveIntegerField(default=0, editable=False)
+    last_activity_at = models.DateTimeField(default=timezone.now, editable=False)
+
+    objects = TaskManager()
+
+    class Meta:
+        # One index per TaskListView sort key, each ending in 'id' so keyset
+        # pages are index scans; the filter-prefixed ones keep an equality
+        # filter combined with a date sort selective.
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='task_created_idx'),
+            models.Index(fields=['due_date', 'id'], name='task_due_idx'),
+            models.Index(fields=['status', 'created_at', 'id'], name='task_status_created_idx'),
+            models.Index(fields=['status', 'due_date', 'id'], name='task_status_due_idx'),
+            models.Index(fields=['priority', 'created_at', 'id'], name='task_priority_created_idx'),
+            models.Index(fields=['priority', 'due_date', 'id'], name='task_priority_due_idx'),
+            models.Index(fields=['owner', 'created_at', 'id'], name='task_owner_created_idx'),
+            models.Index(fields=['owner', 'due_date', 'id'], name='task_owner_due_idx'),
+            models.Index(fields=['last_activity_at', 'id'], name='task_activity_idx'),
+            models.Index(fields=['updated_at', 'id'], name='task_updated_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        invalidate_tasks(self.pk)
+
+    def delete(self, *args, **kwargs):
+        invalidate_tasks(self.pk)
+        mark_tasks_deleted()
+        with transaction.atomic():
+            # Comments go with the task; sync clients drop them with it
+            Tombstone.objects.record(Task, [self.pk])
+            return super().delete(*args, **kwargs)
+
     def __str__(self):
         return self.title
\ No newline at end of file
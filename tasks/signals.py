@@ -0,0 +1,55 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import pre_delete, post_delete, post_save
+from django.dispatch import receiver
+
+from comments.models import Comment
+from sync.models import Tombstone
+from .caching import invalidate_tasks, invalidate_usernames, mark_tasks_deleted
+from .models import Task
+
+User = get_user_model()
+
+
+@receiver(pre_delete, sender=User)
+def user_deleting(sender, instance, **kwargs):
+    # Deleting a user cascades to their tasks and comments through the
+    # collector, bypassing Task.delete() and Comment.save(). Note what goes
+    # while the rows still exist.
+    instance._owned_task_ids = list(Task.objects.filter(owner=instance).values_list('pk', flat=True))
+    # Comments on their own tasks go with those tasks
+    instance._other_comments = list(
+        Comment.all_objects
+        .filter(author=instance)
+        .exclude(task__owner=instance)
+        .order_by()
+        .values_list('pk', 'task_id')
+    )
+
+
+@receiver(post_delete, sender=User)
+def user_deleted(sender, instance, **kwargs):
+    # Still inside the collector's transaction, so the tombstones commit or
+    # roll back with the deletion
+    owned = getattr(instance, '_owned_task_ids', [])
+    comment_ids = [pk for pk, _ in getattr(instance, '_other_comments', [])]
+    commented = {task_id for _, task_id in getattr(instance, '_other_comments', [])}
+
+    if owned:
+        Tombstone.objects.record(Task, owned)
+        mark_tasks_deleted()
+    if comment_ids:
+        Tombstone.objects.record(Comment, comment_ids)
+        # Their comments on other users' tasks are gone from the counters too
+        Task.objects.filter(pk__in=commented).recompute_comment_activity(counts_only=True)
+        # The list shows those counts, but no task timestamp moved
+        mark_tasks_deleted()
+    invalidate_tasks(*owned, *commented)
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, created, update_fields=None, **kwargs):
+    # Saves limited to other fields (e.g. last_login on every login) can't
+    # have renamed the user
+    if created or (update_fields is not None and 'username' not in update_fields):
+        return
+    invalidate_usernames()
@@ -0,0 +1,113 @@
+import csv
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.db import IntegrityError
+from django.test import TestCase
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.contrib.auth import get_user_model
+
+from tasks.models import Task
+
+User = get_user_model()
+
+
+class ImportTasksTests(TestCase):
+    def setUp(self):
+        self.alice = User.objects.create_user(
+            username = 'alice',
+            password = 'pass1234'
+        )
+        self.bob = User.objects.create_user(
+            username = 'bob',
+            password = 'pass1234'
+        )
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.dir = tmpdir.name
+
+    def _write(self, name, content):
+        path = os.path.join(self.dir, name)
+        with open(path, 'w', newline='', encoding='utf-8') as fh:
+            fh.write(content)
+        return path
+
+    def _import(self, *args):
+        out, err = StringIO(), StringIO()
+        call_command('import_tasks', *args, stdout=out, stderr=err)
+        return out.getvalue(), err.getvalue()
+
+    def test_csv_import_in_batches(self):
+        rows = ['title,description,status,priority,owner,due_date']
+        for i in range(7):
+            rows.append(f'Task {i},Imported,{"done" if i % 2 else "T"},H,{"alice" if i % 2 else "bob"},2026-12-0{i + 1}')
+        path = self._write('tasks.csv', '\n'.join(rows) + '\n')
+
+        # Per batch: owner lookup (first batch only), savepoint, INSERT, release
+        with self.assertNumQueries(1 + 3 * 3):
+            output, _ = self._import(path, '--batch-size', '3')
+
+        self.assertEqual(Task.objects.count(), 7)
+        task = Task.objects.get(title='Task 1')
+        self.assertEqual((task.status, task.priority, task.owner), ('D', 'H', self.alice))
+        self.assertEqual(task.due_date.day, 2)
+        self.assertIn('Imported 7 tasks, rejected 0 rows', output)
+
+    def test_bad_rows_go_to_error_report(self):
+        lines = [
+            {'title': 'Good', 'description': 'ok', 'owner': 'alice'},
+            {'title': 'Bad status', 'status': 'someday', 'owner': 'alice'},
+            {'title': 'No owner', 'owner': 'mallory'},
+            {'title': 'x' * 51, 'owner': 'bob'},
+            {'title': 'Bad date', 'owner': 'bob', 'due_date': 'tomorrow'},
+        ]
+        content = '\n'.join(json.dumps(line) for line in lines) + '\nnot json\n'
+        path = self._write('tasks.jsonl', content)
+        report = os.path.join(self.dir, 'errors.csv')
+
+        output, _ = self._import(path, '--errors', report)
+
+        self.assertEqual(list(Task.objects.values_list('title', flat=True)), ['Good'])
+        self.assertIn('Imported 1 tasks, rejected 5 rows', output)
+        with open(report, newline='') as fh:
+            errors = list(csv.DictReader(fh))
+        self.assertEqual([int(error['line']) for error in errors], [2, 3, 4, 5, 6])
+        self.assertIn("invalid status 'someday'", errors[0]['error'])
+        self.assertIn("unknown owner 'mallory'", errors[1]['error'])
+        self.assertEqual(errors[4]['data'], 'not json')
+
+    def test_errors_go_to_stderr_without_report(self):
+        path = self._write('tasks.jsonl', json.dumps({'title': 'T', 'owner': 'nobody'}) + '\n')
+
+        _, errors = self._import(path)
+
+        self.assertIn("Line 1: unknown owner 'nobody'", errors)
+
+    def test_batch_rejected_by_database_goes_to_error_report(self):
+        lines = [
+            {'title': 'First', 'owner': 'alice'},
+            {'title': 'Second', 'owner': 'bob'},
+            {'title': 'Third', 'owner': 'alice'},
+        ]
+        path = self._write('tasks.jsonl', '\n'.join(json.dumps(line) for line in lines) + '\n')
+        report = os.path.join(self.dir, 'errors.csv')
+
+        with mock.patch.object(Task.objects, 'bulk_create', side_effect=[IntegrityError('boom'), None]):
+            output, errors = self._import(path, '--batch-size', '2', '--errors', report)
+
+        self.assertIn('Lines 1-2: batch rejected by the database: boom', errors)
+        self.assertIn('Imported 1 tasks, rejected 2 rows', output)
+        with open(report, newline='') as fh:
+            rejected = list(csv.DictReader(fh))
+        self.assertEqual([int(row['line']) for row in rejected], [1, 2])
+        self.assertEqual(json.loads(rejected[1]['data'])['title'], 'Second')
+
+    def test_unknown_extension_needs_format(self):
+        path = self._write('tasks.txt', '')
+
+        with self.assertRaises(CommandError):
+            self._import(path)
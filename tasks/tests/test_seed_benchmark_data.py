@@ -0,0 +1,87 @@
+from io import StringIO
+
+from django.test import TestCase
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.contrib.auth import get_user_model
+
+from tasks.models import Task
+from comments.models import Comment
+from rbac.models import AuditEntry, Membership, Role
+
+User = get_user_model()
+
+NOW = '2026-06-01T00:00:00+00:00'
+
+
+class SeedBenchmarkDataTests(TestCase):
+    def _seed(self, *args):
+        out = StringIO()
+        call_command(
+            'seed_benchmark_data', '--users', '20', '--roles', '3', '--role-share', '0.5',
+            '--tasks', '50', '--comments', '400', '--audit', '100', '--batch-size', '64',
+            '--now', NOW, *args, stdout=out,
+        )
+        return out.getvalue()
+
+    def _snapshot(self):
+        comments = Comment.all_objects.order_by('pk').values_list(
+            'task__title', 'author__username', 'content', 'created_at', 'is_deleted', 'edited_at',
+        )
+        tasks = Task.objects.order_by('pk').values_list('title', 'owner__username', 'created_at', 'due_date')
+        return list(tasks), list(comments)
+
+    def test_generates_requested_rows(self):
+        output = self._seed()
+
+        self.assertEqual(User.objects.count(), 20)
+        self.assertEqual(Role.objects.count(), 3)
+        self.assertTrue(Membership.objects.exists())
+        self.assertEqual(Task.objects.count(), 50)
+        self.assertEqual(Comment.all_objects.count(), 400)
+        self.assertEqual(AuditEntry.objects.count(), 100)
+        self.assertIn('Comments: 400 rows', output)
+
+        deleted = Comment.all_objects.filter(is_deleted=True)
+        self.assertTrue(20 < deleted.count() < 80)
+        self.assertFalse(deleted.filter(deleted_at__isnull=True).exists())
+        self.assertTrue(Comment.all_objects.filter(edited_at__isnull=False).exists())
+
+    def test_timestamps_and_counters_are_consistent(self):
+        self._seed()
+
+        # created_at is the generated time, not the insert time
+        self.assertLess(Task.objects.latest('created_at').created_at.isoformat(), NOW)
+        self.assertFalse(any(
+            comment.created_at < comment.task.created_at
+            for comment in Comment.all_objects.select_related('task')
+        ))
+        self.assertEqual(
+            sum(Task.objects.values_list('active_comment_count', flat=True)),
+            Comment.objects.count(),
+        )
+
+    def test_same_seed_gives_same_data(self):
+        self._seed('--seed', '7')
+        first = self._snapshot()
+
+        AuditEntry.objects.all().delete()
+        Role.objects.all().delete()
+        User.objects.all().delete()
+        self._seed('--seed', '7')
+
+        self.assertEqual(self._snapshot(), first)
+
+        Role.objects.all().delete()
+        User.objects.all().delete()
+        self._seed('--seed', '8')
+        self.assertNotEqual(self._snapshot(), first)
+
+    def test_refuses_to_reuse_prefix(self):
+        User.objects.create_user(
+            username = 'bench0000000',
+            password = 'pass1234'
+        )
+
+        with self.assertRaises(CommandError):
+            self._seed()
@@ -0,0 +1,119 @@
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+
+from tasks.models import Task
+from comments.models import Comment
+from rbac.models import AuditEntry
+
+User = get_user_model()
+
+
+class TaskBulkActionTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username = 'owner',
+            password = 'pass1234'
+        )
+        self.other = User.objects.create_user(
+            username = 'other',
+            password = 'pass1234'
+        )
+        self.mine = [
+            Task.objects.create(
+                title = f'Mine {i}',
+                description = 'Task description',
+                owner = self.owner
+            )
+            for i in range(4)
+        ]
+        self.theirs = Task.objects.create(
+            title = 'Theirs',
+            description = 'Task description',
+            owner = self.other
+        )
+        self.ids = [task.pk for task in self.mine] + [self.theirs.pk]
+
+        self.url = reverse('tasks:task-bulk')
+        self.client.login(
+            username = 'owner',
+            password = 'pass1234'
+        )
+
+    def _post(self, data):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(self.url, data)
+
+    def test_set_status_only_touches_own_tasks(self):
+        response = self._post({'ids': self.ids, 'operation': 'status', 'status': 'D'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['skipped'], [self.theirs.pk])
+        self.assertEqual(set(Task.objects.filter(status='D').values_list('pk', flat=True)),
+                         {task.pk for task in self.mine})
+        self.theirs.refresh_from_db()
+        self.assertEqual(self.theirs.status, 'T')
+
+    def test_one_update_and_one_audit_insert(self):
+        self.client.get(reverse('tasks:task-list'))  # warm the session
+
+        # session, user, savepoint, select ids, UPDATE, release, and one
+        # audit INSERT on commit (the content type is cached)
+        with self.assertNumQueries(7):
+            self._post({'ids': self.ids, 'operation': 'priority', 'priority': 'H'})
+
+        entries = AuditEntry.objects.filter(action=AuditEntry.ACTION_EDIT)
+        self.assertEqual(sorted(entries.values_list('target_object_id', flat=True)),
+                         [task.pk for task in self.mine])
+        self.assertEqual(entries.first().payload, {'bulk': 'priority', 'priority': 'H'})
+
+    def test_changes_stay_scoped_to_owner(self):
+        # The ids are read first; the UPDATE must not act on a task that was
+        # reassigned in between
+        with CaptureQueriesContext(connection) as ctx:
+            self._post({'ids': self.ids, 'operation': 'status', 'status': 'D'})
+
+        update = next(query['sql'] for query in ctx.captured_queries if query['sql'].startswith('UPDATE "tasks_task"'))
+        self.assertIn('"owner_id" = %s' % self.owner.pk, update)
+
+    def test_reassign(self):
+        response = self._post({'ids': self.ids[:2], 'operation': 'reassign', 'owner': 'other'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Task.objects.filter(owner=self.other).count(), 3)
+        self.assertEqual(AuditEntry.objects.first().payload, {'bulk': 'reassign', 'owner': 'other'})
+
+    def test_delete_removes_tasks_and_comments(self):
+        Comment.objects.create(
+            task = self.mine[0],
+            author = self.owner,
+            content = 'Hello'
+        )
+
+        self._post({'ids': self.ids, 'operation': 'delete'})
+
+        self.assertEqual(list(Task.objects.values_list('pk', flat=True)), [self.theirs.pk])
+        self.assertFalse(Comment.all_objects.exists())
+        self.assertEqual(AuditEntry.objects.filter(action=AuditEntry.ACTION_DELETE).count(), 4)
+
+    def test_invalid_requests(self):
+        cases = [
+            {'ids': self.ids, 'operation': 'status'},
+            {'ids': self.ids, 'operation': 'reassign', 'owner': 'nobody'},
+            {'ids': ['x'], 'operation': 'delete'},
+            {'operation': 'delete'},
+            {'ids': self.ids, 'operation': 'archive'},
+        ]
+        for data in cases:
+            with self.subTest(data=data):
+                self.assertEqual(self._post(data).status_code, 400)
+        self.assertEqual(Task.objects.count(), 5)
+
+    @override_settings(TASKS_BULK_MAX=2)
+    def test_too_many_ids(self):
+        self.assertEqual(self._post({'ids': self.ids, 'operation': 'delete'}).status_code, 400)
+
+    def test_get_not_allowed(self):
+        self.assertEqual(self.client.get(self.url).status_code, 405)
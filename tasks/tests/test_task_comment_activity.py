@@ -0,0 +1,145 @@
+from io import StringIO
+from datetime import timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from django.core.management import call_command
+from django.contrib.auth import get_user_model
+
+from tasks.models import Task
+from comments.models import Comment
+
+User = get_user_model()
+
+
+class TaskCommentActivityTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username = 'owner',
+            password = 'pass1234'
+        )
+        self.task = Task.objects.create(
+            title = 'Test Task',
+            description = 'Task Description',
+            owner = self.owner
+        )
+
+    def _comment(self, content='Hello'):
+        return Comment.objects.create(
+            task = self.task,
+            author = self.owner,
+            content = content
+        )
+
+    def test_creating_comments_increments_count_and_activity(self):
+        comment = self._comment()
+        self._comment()
+
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.active_comment_count, 2)
+        self.assertGreaterEqual(self.task.last_activity_at, comment.created_at)
+
+    def test_soft_delete_decrements_count_once(self):
+        comment = self._comment()
+        self._comment()
+
+        comment.soft_delete(by_user=self.owner)
+        deleted_at = comment.deleted_at
+        comment.soft_delete(by_user=self.owner)
+
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.active_comment_count, 1)
+        self.assertGreaterEqual(self.task.last_activity_at, deleted_at)
+
+    def test_bulk_soft_delete_decrements_each_task(self):
+        second = Task.objects.create(title='Second', description='x', owner=self.owner)
+        self._comment()
+        self._comment()
+        Comment.objects.create(task=second, author=self.owner, content='x')
+        Comment.objects.create(task=second, author=self.owner, content='x')
+        # Counted but not yet visible, like a comment committed meanwhile
+        Task.objects.filter(pk=self.task.pk).update(active_comment_count=3)
+
+        Comment.objects.all().soft_delete(by_user=self.owner)
+
+        self.task.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(self.task.active_comment_count, 1)
+        self.assertEqual(second.active_comment_count, 0)
+        self.assertEqual(self.task.last_activity_at, Comment.all_objects.filter(task=self.task).first().deleted_at)
+
+    def test_soft_delete_of_drifted_counter_stays_at_zero(self):
+        comment = self._comment()
+        Task.objects.filter(pk=self.task.pk).update(active_comment_count=0)
+
+        comment.soft_delete(by_user=self.owner)
+
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.active_comment_count, 0)
+        self.assertTrue(Comment.all_objects.get(pk=comment.pk).is_deleted)
+
+    def test_edit_records_activity(self):
+        comment = self._comment()
+        Task.objects.filter(pk=self.task.pk).update(last_activity_at=timezone.now() - timedelta(days=1))
+        before = timezone.now()
+
+        self.client.login(
+            username = 'owner',
+            password = 'pass1234'
+        )
+        self.client.post(
+            reverse('tasks:comments:comment-edit', kwargs={'task_id': self.task.pk, 'pk': comment.pk}),
+            {'content': 'Edited'},
+        )
+
+        self.task.refresh_from_db()
+        self.assertGreaterEqual(self.task.last_activity_at, before)
+
+    def test_purge_repairs_count_of_rows_deleted_outside_soft_delete(self):
+        comment = self._comment()
+        Comment.all_objects.filter(pk=comment.pk).update(
+            is_deleted=True,
+            deleted_at=timezone.now() - timedelta(days=40),
+        )
+
+        call_command('purge_deleted_comments', '--days', '30', stdout=StringIO())
+
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.active_comment_count, 0)
+
+    def test_recompute_command_repairs_drifted_counters(self):
+        self._comment()
+        self._comment().soft_delete(by_user=self.owner)
+        Comment.objects.bulk_create([
+            Comment(task=self.task, author=self.owner, content='Bulk')
+        ])
+        Task.objects.filter(pk=self.task.pk).update(
+            active_comment_count=99,
+            last_activity_at=self.task.created_at,
+        )
+
+        call_command('recompute_task_activity', '--batch-size', '1', stdout=StringIO())
+
+        self.task.refresh_from_db()
+        latest = Comment.all_objects.filter(task=self.task).order_by('-deleted_at').first()
+        self.assertEqual(self.task.active_comment_count, 2)
+        self.assertEqual(self.task.last_activity_at, max(
+            [c.created_at for c in Comment.all_objects.filter(task=self.task)] + [latest.deleted_at]
+        ))
+
+    def test_task_list_sorts_by_recent_activity(self):
+        quiet = Task.objects.create(
+            title = 'Quiet Task',
+            description = 'Task Description',
+            owner = self.owner
+        )
+        self._comment()
+
+        self.client.login(
+            username = 'owner',
+            password = 'pass1234'
+        )
+        response = self.client.get(reverse('tasks:task-list'), {'sort': '-activity'})
+
+        self.assertEqual([t.pk for t in response.context['tasks']], [self.task.pk, quiet.pk])
@@ -0,0 +1,235 @@
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
+from django.core.cache import cache
+from django.contrib.auth import get_user_model
+
+from tasks.models import Task
+from comments.models import Comment
+
+User = get_user_model()
+
+
+class TaskConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(
+            username = 'owner',
+            password = 'pass1234'
+        )
+        self.other = User.objects.create_user(
+            username = 'other',
+            password = 'pass1234'
+        )
+        self.task = Task.objects.create(
+            title = 'Conditional Task',
+            description = 'Task description',
+            owner = self.owner
+        )
+        self.second = Task.objects.create(
+            title = 'Second Task',
+            description = 'Task description',
+            owner = self.owner
+        )
+        self.list_url = reverse('tasks:task-list')
+        self.detail_url = reverse('tasks:task-detail', kwargs={'pk': self.task.pk})
+        self.client.login(username='owner', password='pass1234')
+
+    def _revalidate(self, url, response):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+
+    def assertNotModified(self, url, response):
+        revalidated = self._revalidate(url, response)
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(revalidated.content, b'')
+        self.assertEqual(revalidated.templates, []) # nothing rendered
+
+    def assertModified(self, url, response):
+        self.assertEqual(self._revalidate(url, response).status_code, 200)
+
+    # Validators
+
+    def test_responses_carry_validators(self):
+        for url in (self.list_url, self.detail_url):
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(response['ETag'])
+                self.assertTrue(response['Last-Modified'])
+
+    def test_list_unchanged_is_not_modified(self):
+        response = self.client.get(self.list_url)
+
+        with self.assertNumQueries(3): # session, user, one aggregate
+            revalidated = self._revalidate(self.list_url, response)
+
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertNotModified(self.list_url, response)
+
+    def test_detail_unchanged_is_not_modified(self):
+        response = self.client.get(self.detail_url)
+
+        with self.assertNumQueries(3): # session, user, one timestamp lookup
+            revalidated = self._revalidate(self.detail_url, response)
+
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertNotModified(self.detail_url, response)
+
+    def test_if_modified_since(self):
+        response = self.client.get(self.list_url)
+
+        revalidated = self.client.get(self.list_url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(revalidated.status_code, 304)
+
+        earlier = http_date((timezone.now() - timedelta(days=1)).timestamp())
+        revalidated = self.client.get(self.list_url, HTTP_IF_MODIFIED_SINCE=earlier)
+        self.assertEqual(revalidated.status_code, 200)
+
+    def test_task_leaving_the_filter_changes_validators(self):
+        todo_url = f'{self.list_url}?status=T'
+        todo_response = self.client.get(todo_url)
+
+        self.second.status = 'D'
+        self.second.save()
+
+        self.assertModified(todo_url, todo_response)
+
+    def test_reassigned_task_changes_filtered_validators(self):
+        url = f'{self.list_url}?owner=owner'
+        response = self.client.get(url)
+
+        self.client.post(reverse('tasks:task-bulk'), {'ids': [self.second.pk], 'operation': 'reassign', 'owner': 'other'})
+
+        self.assertModified(url, response)
+
+    def test_detail_etag_differs_per_viewer(self):
+        response = self.client.get(self.detail_url)
+
+        self.client.login(username='other', password='pass1234')
+
+        self.assertModified(self.detail_url, response)
+
+    def test_anonymous_is_redirected_before_validation(self):
+        response = self.client.get(self.list_url)
+        self.client.logout()
+
+        revalidated = self._revalidate(self.list_url, response)
+
+        self.assertEqual(revalidated.status_code, 302)
+
+    def test_missing_task_is_404(self):
+        response = self.client.get(reverse('tasks:task-detail', kwargs={'pk': 0}))
+
+        self.assertEqual(response.status_code, 404)
+
+    # Changes that must produce a fresh page
+
+    def test_task_edit_changes_validators(self):
+        list_response = self.client.get(self.list_url)
+        detail_response = self.client.get(self.detail_url)
+
+        self.client.post(reverse('tasks:task-edit', kwargs={'pk': self.task.pk}), {
+            'title': 'Edited',
+            'description': 'Task description',
+            'status': 'I',
+            'priority': 'M',
+        })
+
+        self.assertModified(self.list_url, list_response)
+        self.assertModified(self.detail_url, detail_response)
+        self.assertNotModified(reverse('tasks:task-detail', kwargs={'pk': self.second.pk}),
+                               self.client.get(reverse('tasks:task-detail', kwargs={'pk': self.second.pk})))
+
+    def test_comment_changes_validators(self):
+        list_response = self.client.get(self.list_url)
+        detail_response = self.client.get(self.detail_url)
+
+        self.client.post(
+            reverse('tasks:comments:comment-add', kwargs={'task_id': self.task.pk}),
+            {'content': 'New comment'},
+        )
+
+        self.assertModified(self.list_url, list_response)
+        self.assertModified(self.detail_url, detail_response)
+
+    def test_comment_delete_changes_validators(self):
+        comment = Comment.objects.create(task=self.task, author=self.owner, content='Soon gone')
+        detail_response = self.client.get(self.detail_url)
+
+        self.client.post(reverse('tasks:comments:comment-delete', kwargs={'task_id': self.task.pk, 'pk': comment.pk}))
+
+        self.assertModified(self.detail_url, detail_response)
+
+    def test_bulk_update_changes_validators(self):
+        list_response = self.client.get(self.list_url)
+        detail_response = self.client.get(self.detail_url)
+
+        self.client.post(reverse('tasks:task-bulk'), {'ids': [self.task.pk], 'operation': 'status', 'status': 'D'})
+
+        self.assertModified(self.list_url, list_response)
+        self.assertModified(self.detail_url, detail_response)
+
+    def test_delete_changes_list_validators(self):
+        list_response = self.client.get(self.list_url)
+
+        self.client.post(reverse('tasks:task-delete', kwargs={'pk': self.second.pk}))
+
+        self.assertModified(self.list_url, list_response)
+
+    def test_bulk_delete_changes_list_validators(self):
+        list_response = self.client.get(self.list_url)
+
+        self.client.post(reverse('tasks:task-bulk'), {'ids': [self.second.pk], 'operation': 'delete'})
+
+        self.assertModified(self.list_url, list_response)
+
+    def test_lost_deletion_timestamp_is_not_a_stale_304(self):
+        list_response = self.client.get(self.list_url)
+
+        cache.clear()
+
+        self.assertModified(self.list_url, list_response)
+
+    def test_user_delete_changes_validators(self):
+        Comment.objects.create(task=self.task, author=self.other, content='Soon gone')
+        detail_response = self.client.get(self.detail_url)
+
+        list_response = self.client.get(self.list_url)
+
+        # Cascades to the comment without touching the task row; the list
+        # shows the comment count that drops with it
+        self.other.delete()
+
+        self.assertModified(self.detail_url, detail_response)
+        self.assertModified(self.list_url, list_response)
+
+    def test_owner_rename_changes_validators(self):
+        list_response = self.client.get(self.list_url)
+        detail_response = self.client.get(self.detail_url)
+
+        self.owner.username = 'renamed'
+        self.owner.save()
+
+        self.assertModified(self.list_url, list_response)
+        self.assertModified(self.detail_url, detail_response)
+
+    def test_user_delete_changes_list_validators(self):
+        Task.objects.create(title='Theirs', description='x', owner=self.other)
+        list_response = self.client.get(self.list_url)
+
+        # Cascades to their task, bypassing Task.delete()
+        self.other.delete()
+
+        self.assertModified(self.list_url, list_response)
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}})
+    def test_empty_list_without_cache_renders(self):
+        Task.objects.all().delete()
+
+        response = self.client.get(self.list_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('ETag'))
@@ -0,0 +1,159 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from django.urls import reverse
+from django.utils import timezone
+from django.core.cache import cache
+from django.core.management import call_command
+from django.contrib.auth import get_user_model
+
+from tasks.models import Task
+from comments.models import Comment
+
+User = get_user_model()
+
+
+class TaskDetailCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(
+            username = 'owner',
+            password = 'pass1234'
+        )
+        self.author = User.objects.create_user(
+            username = 'author',
+            password = 'pass1234'
+        )
+        self.task = Task.objects.create(
+            title = 'Cached Task',
+            description = 'Task description',
+            owner = self.owner
+        )
+        self.comment = Comment.objects.create(
+            task = self.task,
+            author = self.author,
+            content = 'First comment'
+        )
+        self.url = reverse('tasks:task-detail', kwargs={'pk': self.task.pk})
+
+    def _get(self, username):
+        self.client.login(username=username, password='pass1234')
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return response, [query['sql'] for query in ctx.captured_queries]
+
+    def _contents(self, response):
+        return [item['comment'].content for item in response.context['comments']]
+
+    def test_one_entry_serves_every_viewer(self):
+        _, first = self._get('owner')
+        self.assertTrue(any('comments_comment' in sql for sql in first))
+
+        response, second = self._get('author')
+
+        self.assertFalse(any('comments_comment' in sql for sql in second))
+        # Only the conditional GET validators (updated_at, last_activity_at) are read
+        self.assertEqual([sql for sql in second if 'tasks_task' in sql and 'title' in sql], [])
+        self.assertEqual(response.context['task'], self.task)
+        # Flags are the viewer's, not those of whoever filled the cache
+        item = response.context['comments'][0]
+        self.assertTrue(item['can_edit'])
+        self.assertTrue(item['can_delete'])
+
+        response, _ = self._get('owner')
+        self.assertFalse(response.context['comments'][0]['can_edit'])
+
+    def test_comment_create_edit_and_delete_invalidate(self):
+        self._get('owner')
+
+        Comment.objects.create(
+            task = self.task,
+            author = self.owner,
+            content = 'Second comment'
+        )
+        response, _ = self._get('owner')
+        self.assertEqual(self._contents(response), ['First comment', 'Second comment'])
+
+        edit_url = reverse('tasks:comments:comment-edit', kwargs={'task_id': self.task.pk, 'pk': self.comment.pk})
+        self.client.login(username='author', password='pass1234')
+        self.client.post(edit_url, {'content': 'Edited comment'})
+        response, _ = self._get('owner')
+        self.assertEqual(self._contents(response), ['Edited comment', 'Second comment'])
+        self.assertTrue(response.context['comments'][0]['comment'].is_edited)
+
+        self.comment.soft_delete(by_user=self.author)
+        response, _ = self._get('owner')
+        self.assertEqual(self._contents(response), ['Second comment'])
+
+    def test_bulk_soft_delete_invalidates(self):
+        self._get('owner')
+
+        Comment.objects.filter(task=self.task).soft_delete(by_user=self.owner)
+
+        response, _ = self._get('owner')
+        self.assertEqual(self._contents(response), [])
+
+    def test_task_save_invalidates(self):
+        self._get('owner')
+
+        self.task.title = 'Renamed'
+        self.task.save()
+
+        response, _ = self._get('owner')
+        self.assertEqual(response.context['task'].title, 'Renamed')
+
+    def test_purge_invalidates(self):
+        self.comment.soft_delete(by_user=self.author)
+        Comment.all_objects.filter(pk=self.comment.pk).update(deleted_at=timezone.now() - timedelta(days=40))
+        self._get('owner')
+        version = cache.get(f'tasks:detail:version:{self.task.pk}')
+
+        call_command('purge_deleted_comments', '--days', '30', stdout=StringIO())
+
+        self.assertNotEqual(cache.get(f'tasks:detail:version:{self.task.pk}'), version)
+
+    def test_deleted_task_is_not_served(self):
+        self._get('owner')
+
+        self.task.delete()
+
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+    def test_user_delete_invalidates(self):
+        other_task = Task.objects.create(
+            title = 'Other Task',
+            description = 'Task description',
+            owner = self.author
+        )
+        other_url = reverse('tasks:task-detail', kwargs={'pk': other_task.pk})
+        self._get('owner')
+        self.client.get(other_url)
+
+        # Cascades to the author's task and to their comment on self.task
+        self.author.delete()
+
+        response, _ = self._get('owner')
+        self.assertEqual(self._contents(response), [])
+        self.assertEqual(response.context['task'].active_comment_count, 0)
+        self.assertEqual(self.client.get(other_url).status_code, 404)
+
+    def test_user_rename_invalidates(self):
+        self._get('owner')
+
+        self.author.username = 'renamed'
+        self.author.save()
+
+        response, _ = self._get('owner')
+        self.assertEqual(response.context['comments'][0]['comment'].author.username, 'renamed')
+
+    def test_login_does_not_invalidate(self):
+        self._get('owner')
+
+        # login() saves last_login only
+        _, queries = self._get('author')
+
+        self.assertFalse(any('comments_comment' in sql for sql in queries))
@@ -0,0 +1,77 @@
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from django.urls import reverse
+from django.core.cache import cache
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+
+from tasks.models import Task
+from comments.models import Comment
+from rbac.models import Role, Membership
+
+User = get_user_model()
+
+
+class TaskDetailQueryCountTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(
+            username = 'owner',
+            password = 'pass1234'
+        )
+        self.moderator = User.objects.create_user(
+            username = 'moderator',
+            password = 'pass1234'
+        )
+        self.task = Task.objects.create(
+            title = 'Busy Task',
+            description = 'Task Description',
+            owner = self.owner
+        )
+
+        ct = ContentType.objects.get_for_model(Comment)
+        role = Role.objects.create(
+            name = 'Moderator',
+            slug = 'moderator'
+        )
+        role.permissions.add(Permission.objects.get(content_type=ct, codename='delete_comment'))
+        Membership.objects.create(user=self.moderator, role=role)
+
+        self.url = reverse('tasks:task-detail', kwargs={'pk': self.task.pk})
+
+    def _add_comments(self, count):
+        authors = [self.owner, self.moderator]
+        Comment.objects.bulk_create([
+            Comment(task=self.task, author=authors[i % 2], content=f'Comment {i}')
+            for i in range(count)
+        ])
+
+    def _count_queries(self):
+        cache.clear()
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def test_query_count_does_not_grow_with_comments(self):
+        self.client.login(username='moderator', password='pass1234')
+
+        self._add_comments(3)
+        small = self._count_queries()
+
+        self._add_comments(30)
+        large = self._count_queries()
+
+        self.assertEqual(small, large)
+
+    def test_moderator_sees_delete_controls_for_all_comments(self):
+        self._add_comments(4)
+        self.client.login(username='moderator', password='pass1234')
+
+        response = self.client.get(self.url)
+
+        for item in response.context['comments']:
+            self.assertTrue(item['can_delete'])
+            self.assertEqual(item['can_edit'], item['comment'].author_id == self.moderator.pk)
@@ -0,0 +1,82 @@
+import csv
+import json
+from io import StringIO
+
+from django.test import TestCase
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+
+from tasks.models import Task
+from comments.models import Comment
+
+User = get_user_model()
+
+
+class TaskExportViewTests(TestCase):
+    def setUp(self):
+        self.alice = User.objects.create_user(
+            username = 'alice',
+            password = 'pass1234'
+        )
+        self.bob = User.objects.create_user(
+            username = 'bob',
+            password = 'pass1234'
+        )
+        self.tasks = [
+            Task.objects.create(
+                title = f'Task {i}',
+                description = 'Line one, "quoted"\nline two',
+                owner = self.alice if i % 2 else self.bob,
+                status = 'D' if i < 2 else 'T',
+            )
+            for i in range(5)
+        ]
+        Comment.objects.create(
+            task = self.tasks[4],
+            author = self.alice,
+            content = 'Hello'
+        )
+
+        self.url = reverse('tasks:task-export')
+        self.client.login(
+            username = 'alice',
+            password = 'pass1234'
+        )
+
+    def _content(self, response):
+        self.assertTrue(response.streaming)
+        return b''.join(response.streaming_content).decode()
+
+    def test_csv_export_streams_filtered_tasks_in_list_order(self):
+        response = self.client.get(self.url, {'status': 'T', 'sort': 'created'})
+
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertIn('tasks.csv', response['Content-Disposition'])
+        rows = list(csv.DictReader(StringIO(self._content(response))))
+        self.assertEqual([int(row['id']) for row in rows], [task.pk for task in self.tasks[2:]])
+        self.assertEqual(rows[0]['description'], 'Line one, "quoted"\nline two')
+        self.assertEqual(rows[0]['owner'], 'bob')
+        self.assertNotIn('comment_count', rows[0])
+
+    def test_ndjson_export_with_comment_counts(self):
+        response = self.client.get(self.url, {'format': 'ndjson', 'comments': '1', 'owner': 'bob'})
+
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        rows = [json.loads(line) for line in self._content(response).splitlines()]
+        self.assertEqual([row['id'] for row in rows], [self.tasks[4].pk, self.tasks[2].pk, self.tasks[0].pk])
+        self.assertEqual(rows[0]['comment_count'], 1)
+        self.assertEqual(rows[1]['comment_count'], 0)
+
+    def test_export_runs_one_query(self):
+        response = self.client.get(self.url, {'comments': '1'})
+
+        with self.assertNumQueries(1):
+            self._content(response)
+
+    def test_unknown_format_is_404(self):
+        self.assertEqual(self.client.get(self.url, {'format': 'xlsx'}).status_code, 404)
+
+    def test_requires_login(self):
+        self.client.logout()
+
+        self.assertEqual(self.client.get(self.url).status_code, 302)
@@ -0,0 +1,134 @@
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+
+from tasks.forms import TaskFilterForm
+from tasks.models import Task
+
+User = get_user_model()
+
+
+@override_settings(TASKS_PAGE_SIZE=3)
+class TaskListViewTests(TestCase):
+    def setUp(self):
+        self.alice = User.objects.create_user(
+            username = 'alice',
+            password = 'pass1234'
+        )
+        self.bob = User.objects.create_user(
+            username = 'bob',
+            password = 'pass1234'
+        )
+        now = timezone.now()
+        self.tasks = []
+        for i in range(8):
+            self.tasks.append(Task.objects.create(
+                title = f'Task {i}',
+                description = 'Task Description',
+                owner = self.alice if i % 2 else self.bob,
+                status = 'D' if i < 3 else 'T',
+                priority = 'HLM'[i % 3],
+                due_date = None if i == 5 else now + timedelta(days=8 - i),
+            ))
+
+        self.url = reverse('tasks:task-list')
+        self.client.login(
+            username = 'alice',
+            password = 'pass1234'
+        )
+
+    def _walk(self, params=None):
+        params = dict(params or {})
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        pks = [task.pk for task in response.context['tasks']]
+
+        while response.context['next_cursor']:
+            params['cursor'] = response.context['next_cursor']
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, 200)
+            pks += [task.pk for task in response.context['tasks']]
+
+        return pks
+
+    def test_default_lists_newest_first_across_pages(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(len(response.context['tasks']), 3)
+        self.assertEqual(self._walk(), [t.pk for t in reversed(self.tasks)])
+
+    def test_filters_by_status_priority_and_owner(self):
+        pks = self._walk({'status': 'T', 'owner': 'alice'})
+        expected = [t.pk for t in self.tasks if t.status == 'T' and t.owner == self.alice]
+        self.assertEqual(sorted(pks), sorted(expected))
+
+        pks = self._walk({'priority': 'H'})
+        self.assertEqual(sorted(pks), sorted(t.pk for t in self.tasks if t.priority == 'H'))
+
+    def test_filters_by_due_date_range(self):
+        after = self.tasks[6].due_date
+        before = self.tasks[2].due_date
+
+        pks = self._walk({'due_after': after.isoformat(), 'due_before': before.isoformat()})
+
+        self.assertEqual(sorted(pks), [t.pk for t in self.tasks[3:7] if t.due_date])
+
+    def test_sort_by_due_date_puts_undated_tasks_last(self):
+        pks = self._walk({'sort': 'due'})
+        dated = sorted((t for t in self.tasks if t.due_date), key=lambda t: t.due_date)
+        self.assertEqual(pks, [t.pk for t in dated] + [self.tasks[5].pk])
+
+        pks = self._walk({'sort': '-due'})
+        self.assertEqual(pks, [self.tasks[5].pk] + [t.pk for t in reversed(dated)])
+
+    def test_sort_by_status_groups_rows(self):
+        pks = self._walk({'sort': 'status'})
+        expected = sorted(self.tasks, key=lambda t: (t.status, t.created_at, t.pk))
+        self.assertEqual(pks, [t.pk for t in expected])
+
+    def test_invalid_filter_values_are_ignored(self):
+        pks = self._walk({'status': 'nope', 'sort': 'sideways'})
+        self.assertEqual(len(pks), len(self.tasks))
+
+    def test_sorts_without_an_index_for_the_filters_are_dropped(self):
+        form = TaskFilterForm({'status': 'T', 'sort': 'priority'})
+        self.assertIn('sort', form.errors)
+        self.assertEqual(form.ordering(), ('-created_at', '-id'))
+
+        for params in (
+            {'status': 'T', 'sort': 'status'},
+            {'owner': 'alice', 'sort': '-due'},
+            {'priority': 'H', 'status': 'T', 'sort': 'created'},
+            {'sort': 'activity'},
+        ):
+            with self.subTest(params=params):
+                self.assertNotIn('sort', TaskFilterForm(params).errors)
+
+        self.assertIn('sort', TaskFilterForm({'owner': 'alice', 'sort': 'activity'}).errors)
+
+    def test_due_date_range_sorts_by_due_date(self):
+        after = self.tasks[6].due_date
+        params = {'due_after': after.isoformat(), 'sort': 'created'}
+
+        self.assertEqual(TaskFilterForm(params).ordering(), ('due_date', 'id'))
+
+        pks = self._walk(params)
+        self.assertEqual(pks, [t.pk for t in reversed(self.tasks[:7]) if t.due_date])
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.client.get(self.url, {'cursor': '!!'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_query_count_does_not_grow_with_tasks(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(4):
+            self.client.get(self.url)
+
+        for i in range(10):
+            Task.objects.create(title=f'Extra {i}', description='x', owner=self.bob)
+
+        with self.assertNumQueries(4):
+            self.client.get(self.url)
@@ -0,0 +1,197 @@
+from django.test import TestCase
+from django.urls import reverse
+from django.core.cache import cache
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+
+from tasks.models import Task
+from comments.models import Comment
+from rbac.models import Role, Membership
+from taskflow.testing import QueryBudgetMixin
+import tasks.urls
+import comments.urls
+
+User = get_user_model()
+
+SIZES = (1, 5, 25)
+
+
+class ViewQueryBudgetTests(QueryBudgetMixin, TestCase):
+    """
+    Every view in tasks.urls and comments.urls must run the same number of
+    queries however many tasks, comments and roles exist.
+    """
+
+    # URL name -> the test methods below that exercise it
+    COVERED = {
+        'task-list', 'task-create', 'task-export', 'task-bulk', 'task-detail',
+        'task-edit', 'task-delete',
+        'comment-list', 'comment-add', 'comment-edit', 'comment-delete',
+    }
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username = 'owner',
+            password = 'pass1234'
+        )
+        self.other = User.objects.create_user(
+            username = 'other',
+            password = 'pass1234'
+        )
+        self.permissions = list(Permission.objects.filter(
+            content_type__in = ContentType.objects.get_for_models(Task, Comment).values(),
+        ))
+        self.client.force_login(self.user)
+
+    def grow(self, size):
+        """
+        Seed up to 'size' tasks per user, comments per task and roles for
+        the requesting user, then create fresh objects for the request to
+        act on.
+        """
+        for owner in (self.user, self.other):
+            missing = size - Task.objects.filter(owner=owner).count()
+            Task.objects.bulk_create([
+                Task(title=f'Task {i}', description='Seeded', owner=owner)
+                for i in range(missing)
+            ])
+
+        missing = size - Role.objects.count()
+        for i in range(missing):
+            role = Role.objects.create(
+                name = f'Role {size}-{i}',
+                slug = f'role-{size}-{i}'
+            )
+            role.permissions.set(self.permissions)
+            Membership.objects.create(user=self.user, role=role)
+
+        self.task = Task.objects.create(
+            title = 'Target',
+            description = 'Target task',
+            owner = self.user
+        )
+        # Someone else's comment first, so even the smallest page needs
+        # the RBAC permission check
+        authors = [self.other, self.user]
+        Comment.objects.bulk_create([
+            Comment(task=self.task, author=authors[i % 2], content=f'Comment {i}')
+            for i in range(size)
+        ])
+        self.comment = Comment.objects.create(
+            task = self.task,
+            author = self.user,
+            content = 'Mine'
+        )
+
+        # Measure cold: no cached permissions or content types
+        cache.clear()
+        ContentType.objects.clear_cache()
+
+    def _get(self, name, expected=200, kwargs=None):
+        def request():
+            response = self.client.get(reverse(name, kwargs=kwargs() if kwargs else None))
+            self.assertEqual(response.status_code, expected)
+            # Streaming responses query while they are consumed
+            if response.streaming:
+                b''.join(response.streaming_content)
+            return response
+        return request
+
+    def _post(self, name, data, expected=302, kwargs=None):
+        def request():
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(reverse(name, kwargs=kwargs() if kwargs else None), data())
+            self.assertEqual(response.status_code, expected)
+            return response
+        return request
+
+    def _task(self):
+        return {'pk': self.task.pk}
+
+    def _comment(self):
+        return {'task_id': self.task.pk, 'pk': self.comment.pk}
+
+    def _task_form(self):
+        return {'title': 'Changed', 'description': 'Changed', 'status': 'I', 'priority': 'H'}
+
+    def test_every_view_is_covered(self):
+        names = {
+            pattern.name for pattern in tasks.urls.urlpatterns + comments.urls.urlpatterns
+            if getattr(pattern, 'name', None)
+        }
+        self.assertEqual(names, self.COVERED)
+
+    def test_task_list(self):
+        self.assertQueriesDoNotGrow(self._get('tasks:task-list'), self.grow, SIZES)
+
+    def test_read_views_stay_within_budget(self):
+        # Cold caches, as after grow(); a constant query added to every
+        # page load doesn't make the count grow, but does break the budget
+        self.grow(SIZES[-1])
+        for name, kwargs, budget in (
+            ('tasks:task-list', None, 4),
+            ('tasks:task-detail', self._task, 6),
+            ('tasks:comments:comment-list', lambda: {'task_id': self.task.pk}, 4),
+        ):
+            with self.subTest(name=name):
+                request = self._get(name, kwargs=kwargs)
+                with self.assertMaxQueries(budget):
+                    request()
+
+    def test_task_create(self):
+        self.assertQueriesDoNotGrow(self._get('tasks:task-create'), self.grow, SIZES)
+        self.assertQueriesDoNotGrow(self._post('tasks:task-create', self._task_form), self.grow, SIZES)
+
+    def test_task_export(self):
+        request = self._get('tasks:task-export')
+        self.assertQueriesDoNotGrow(request, self.grow, SIZES)
+
+    def test_task_bulk(self):
+        def data():
+            return {'ids': list(Task.objects.filter(owner=self.user).values_list('pk', flat=True)),
+                    'operation': 'priority', 'priority': 'H'}
+        self.assertQueriesDoNotGrow(self._post('tasks:task-bulk', data, expected=200), self.grow, SIZES)
+
+    def test_task_detail(self):
+        self.assertQueriesDoNotGrow(self._get('tasks:task-detail', kwargs=self._task), self.grow, SIZES)
+
+    def test_task_edit(self):
+        self.assertQueriesDoNotGrow(self._get('tasks:task-edit', kwargs=self._task), self.grow, SIZES)
+        self.assertQueriesDoNotGrow(
+            self._post('tasks:task-edit', self._task_form, kwargs=self._task), self.grow, SIZES,
+        )
+
+    def test_task_delete(self):
+        self.assertQueriesDoNotGrow(self._get('tasks:task-delete', kwargs=self._task), self.grow, SIZES)
+        self.assertQueriesDoNotGrow(
+            self._post('tasks:task-delete', dict, kwargs=self._task), self.grow, SIZES,
+        )
+
+    def test_comment_list(self):
+        request = self._get('tasks:comments:comment-list', kwargs=lambda: {'task_id': self.task.pk})
+        self.assertQueriesDoNotGrow(request, self.grow, SIZES)
+
+    def test_comment_add(self):
+        request = self._post(
+            'tasks:comments:comment-add', lambda: {'content': 'New'},
+            kwargs=lambda: {'task_id': self.task.pk},
+        )
+        self.assertQueriesDoNotGrow(request, self.grow, SIZES)
+
+    def test_comment_edit(self):
+        self.assertQueriesDoNotGrow(
+            self._get('tasks:comments:comment-edit', kwargs=self._comment), self.grow, SIZES,
+        )
+        self.assertQueriesDoNotGrow(
+            self._post('tasks:comments:comment-edit', lambda: {'content': 'Edited'}, kwargs=self._comment),
+            self.grow, SIZES,
+        )
+
+    def test_comment_delete(self):
+        self.assertQueriesDoNotGrow(
+            self._get('tasks:comments:comment-delete', kwargs=self._comment), self.grow, SIZES,
+        )
+        self.assertQueriesDoNotGrow(
+            self._post('tasks:comments:comment-delete', dict, kwargs=self._comment), self.grow, SIZES,
+        )
@@ -1,11 +1,13 @@
 from django.urls import path, include
-from .views import TaskListView, TaskCreateView, TaskUpdateView, TaskDeleteView, TaskDetailView
+from .views import TaskListView, TaskCreateView, TaskUpdateView, TaskDeleteView, TaskDetailView, TaskExportView, TaskBulkActionView
 
 app_name = 'tasks'
 
 urlpatterns = [
     path('', TaskListView.as_view(), name='task-list'),
     path('create/', TaskCreateView.as_view(), name='task-create'),
+    path('export/', TaskExportView.as_view(), name='task-export'),
+    path('bulk/', TaskBulkActionView.as_view(), name='task-bulk'),
     path('<int:pk>/', TaskDetailView.as_view(), name='task-detail'),
     path('<int:pk>/edit/', TaskUpdateView.as_view(), name='task-edit'),
     path('<int:pk>/delete/', TaskDeleteView.as_view(), name='task-delete'),
@@ -1,10 +1,22 @@
-from django.views.generic import ListView, CreateView, UpdateView, DeleteView, DetailView
+from django.views.generic import ListView, CreateView, UpdateView, DeleteView, DetailView, View
 from django.urls import reverse_lazy
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.db import transaction
+from django.db.models import Max
+from django.conf import settings
+from django.utils import timezone
+from django.middleware.csrf import get_token
 
 from .models import Task
-from .mixins import OwnerRequiredMixin
-from comments.models import Comment
+from .mixins import OwnerRequiredMixin, ConditionalGetMixin, make_etag
+from .forms import TaskFilterForm, TaskBulkActionForm
+from . import caching, export
+from comments.views import comment_page_context
+from taskflow.pagination import KeysetPaginator, InvalidCursor
+from rbac import audit
+from rbac.models import AuditEntry
+from sync.models import Tombstone
 
 class TaskCreateView(LoginRequiredMixin, CreateView):
     model = Task
@@ -30,20 +42,152 @@ class TaskDeleteView(LoginRequiredMixin, DeleteView):
     def get_queryset(self):
         return Task.objects.filter(owner=self.request.user)
 
-class TaskListView(LoginRequiredMixin, ListView):
+class TaskListView(LoginRequiredMixin, ConditionalGetMixin, ListView):
     model = Task
     template_name = 'tasks/tasks.html'
     context_object_name = 'tasks'
 
+    def get_validators(self):
+        # Over all tasks, not the filtered ones: a task that leaves the filter
+        # (status change, reassignment...) must change the filtered page too.
+        # Both maxima are read from their indexes. Comment activity moves
+        # last_activity_at; deletions and renames are tracked in the cache.
+        latest = Task.objects.aggregate(
+            updated=Max('updated_at'),
+            activity=Max('last_activity_at'),
+        )
+        last_modified = max(
+            (at for at in (latest['updated'], latest['activity'], caching.last_task_deletion()) if at),
+            default=None,
+        )
+        if last_modified is None:
+            # No tasks and no usable cache (e.g. DummyCache): always render
+            return None, None
+        return last_modified, make_etag('list', last_modified.isoformat(), caching.usernames_version())
+
     def get_queryset(self):
         # Any authenticated user can see tasks
-        return Task.objects.all()
+        self.filter_form = TaskFilterForm(self.request.GET or None)
+        return self.filter_form.filter_queryset(Task.objects.select_related('owner'))
+
+    def get_context_data(self, **kwargs):
+        paginator = KeysetPaginator(self.filter_form.ordering(), per_page=settings.TASKS_PAGE_SIZE)
+        try:
+            page = paginator.paginate(self.object_list, self.request.GET.get('cursor'))
+        except InvalidCursor:
+            raise Http404
+
+        context = super().get_context_data(object_list=page.object_list, **kwargs)
+        context['filter_form'] = self.filter_form
+        context['next_cursor'] = page.next_cursor
+        return context
     
-class TaskDetailView(LoginRequiredMixin, DetailView):
+class TaskExportView(LoginRequiredMixin, View):
+    '''
+    Stream the task list as CSV or NDJSON (?format=), with the list view's
+    filters and ordering; ?comments=1 adds comment counts.
+    '''
+
+    def get(self, request, *args, **kwargs):
+        try:
+            serialize, content_type = export.FORMATS[request.GET.get('format', 'csv')]
+        except KeyError:
+            raise Http404
+
+        filter_form = TaskFilterForm(request.GET)
+        queryset = filter_form.filter_queryset(Task.objects.all()).order_by(*filter_form.ordering())
+
+        fields = list(export.FIELDS)
+        include_comments = request.GET.get('comments') == '1'
+        if include_comments:
+            fields += export.COMMENT_FIELDS
+
+        rows = export.iter_rows(
+            queryset,
+            include_comments=include_comments,
+            chunk_size=settings.TASKS_EXPORT_CHUNK_SIZE,
+        )
+        extension = request.GET.get('format', 'csv')
+        return StreamingHttpResponse(
+            serialize(rows, fields),
+            content_type=content_type,
+            headers={'Content-Disposition': f'attachment; filename="tasks.{extension}"'},
+        )
+
+class TaskBulkActionView(LoginRequiredMixin, View):
+    '''
+    Apply one operation to many tasks with a single UPDATE or DELETE.
+
+    Like OwnerRequiredMixin, only the requester's own tasks are affected;
+    other ids are skipped. Responds with JSON.
+    '''
+
+    def post(self, request, *args, **kwargs):
+        form = TaskBulkActionForm(request.POST)
+        if not form.is_valid():
+            return JsonResponse({'errors': form.errors}, status=400)
+
+        operation = form.cleaned_data['operation']
+        requested = form.cleaned_data['ids']
+        changes = form.changes()
+
+        with transaction.atomic():
+            # Lock the owned rows, so a concurrent reassignment can't slip in
+            # between reading the ids and changing them
+            task_ids = list(
+                Task.objects
+                .filter(pk__in=requested, owner=request.user)
+                .select_for_update()
+                .values_list('pk', flat=True)
+            )
+            if task_ids:
+                tasks = Task.objects.filter(pk__in=task_ids, owner=request.user)
+                if changes:
+                    tasks.update(**changes, updated_at=timezone.now())
+                else:
+                    tasks.delete()
+                    caching.mark_tasks_deleted()
+                    Tombstone.objects.record(Task, task_ids)
+                caching.invalidate_tasks(*task_ids)
+
+                # One bulk insert for the whole action, on commit
+                audit.record_entries(AuditEntry.objects.build_entries(
+                    actor = request.user,
+                    action = AuditEntry.ACTION_EDIT if changes else AuditEntry.ACTION_DELETE,
+                    model = Task,
+                    object_ids = task_ids,
+                    payload = {
+                        'bulk': operation,
+                        **{field: getattr(value, 'username', value) for field, value in changes.items()},
+                    },
+                ))
+
+        return JsonResponse({
+            'operation': operation,
+            'ids': task_ids,
+            'skipped': sorted(set(requested) - set(task_ids)),
+        })
+
+class TaskDetailView(LoginRequiredMixin, ConditionalGetMixin, DetailView):
     model = Task
     template_name = 'tasks/task_detail.html'
     context_object_name = 'task'
 
+    def get_validators(self):
+        row = Task.objects.filter(pk=self.kwargs['pk']).values_list('updated_at', 'last_activity_at').first()
+        if row is None:
+            return None, None # 404 from get_object()
+        last_modified = max(row)
+        # Edit/delete controls differ per viewer, and the forms embed a token
+        # derived from the CSRF secret (created here if the client has none)
+        get_token(self.request)
+        # The cache versions also move on changes that leave the task row
+        # alone, e.g. comments removed by deleting their author
+        return last_modified, make_etag(
+            'detail', self.kwargs['pk'], last_modified.isoformat(), *caching.detail_versions(self.kwargs['pk']),
+            self.request.user.pk, self.request.META['CSRF_COOKIE'],
+        )
+
     def get_queryset(self):
         '''
         Only task owner can see tasks
@@ -51,19 +195,21 @@ class TaskDetailView(LoginRequiredMixin, DetailView):
         '''
         # Detail view follows the same visibillity rule as the list
         return Task.objects.all()
-    
+
+    def get_object(self, queryset=None):
+        # Task and first comment page come from the shared detail cache
+        try:
+            self.detail = caching.get_task_detail(self.kwargs['pk'])
+        except Task.DoesNotExist:
+            raise Http404
+        return self.detail['task']
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs) # Get the original Context (contains the task object as 'task')
 
-        # Attach related comment
-        comments_qs = (Comment.objects.filter(task=self.object).select_related('author', 'task'))
-        context['comments'] = [
-            {
-                'comment': comment,
-                'can_edit': comment.can_be_edited_by(self.request.user),
-                'can_delete': comment.can_be_deleted_by(self.request.user),
-            }
-            for comment in comments_qs
-        ]
+        # Attach the first page of comments; later pages come from comments:comment-list.
+        # Only the viewer's edit/delete flags are computed per request.
+        page = (self.detail['comments'], self.detail['next_cursor'])
+        context.update(comment_page_context(self.object, self.request.user, page=page))
         return context
     